@@ -6,6 +6,7 @@ from .courses import courses_bp
 from .students import students_bp
 from .student_courses import student_courses_bp  
 from .distributions import distributions_bp  
+from .auth import auth_bp
 
 # List all blueprints
 blueprints = [
@@ -14,5 +15,6 @@ blueprints = [
     courses_bp,
     students_bp,
     student_courses_bp,
-    distributions_bp  
+    distributions_bp,
+    auth_bp
 ]
\ No newline at end of file
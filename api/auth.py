@@ -0,0 +1,87 @@
+"""API routes for session token login and logout."""
+
+from flask import Blueprint, request, jsonify, current_app
+
+from utils.student_context import get_student_context
+
+
+# Create Blueprint
+auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
+
+
+@auth_bp.route('/token', methods=['POST'])
+def issue_token():
+    """
+    Log in by exchanging NetID authentication for a signed session token.
+    
+    Only NetID authentication of a logged-in student is accepted: a token
+    cannot be exchanged for a new one, so sessions end when tokens expire.
+    
+    Headers:
+        X-Student-NetID: The student's NetID (required; the student must be logged in)
+        
+    Returns:
+        JSON response with the token and its expiry (Unix time)
+    """
+    session_tokens = current_app.session_tokens
+    if session_tokens is None:
+        return jsonify({
+            'error': 'Session tokens are not enabled',
+            'message': 'Set SESSION_TOKENS_ENABLED to use token authentication'
+        }), 400
+    
+    if getattr(request, 'session_token', None) is not None:
+        return jsonify({
+            'error': 'Unauthorized',
+            'message': 'Session tokens cannot be refreshed; log in with the X-Student-NetID header'
+        }), 401
+    
+    try:
+        context = get_student_context()
+        issued = session_tokens.issue({'student_id': context.student_id, 'net_id': context.net_id})
+        
+        return jsonify({
+            'token': issued['token'],
+            'token_type': 'Bearer',
+            'expires_at': issued['expires_at'],
+            'expires_in': session_tokens.ttl
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Error issuing session token: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
+@auth_bp.route('/logout', methods=['POST'])
+def logout():
+    """
+    Log out: revoke every session token issued to the student and clear the
+    student's `logged` flag.
+    
+    Headers:
+        Authorization: Bearer <token>, or X-Student-NetID: The student's NetID
+        
+    Returns:
+        JSON response confirming the logout
+    """
+    try:
+        context = get_student_context()
+        
+        # Revoke tokens immediately; they would otherwise stay valid until they expire
+        session_tokens = current_app.session_tokens
+        if session_tokens is not None:
+            claims = getattr(request, 'session_token', None)
+            if claims is not None:
+                session_tokens.revoke(claims)
+            session_tokens.revoke_student(context.student_id)
+        
+        current_app.student_service.set_logged_in(context.net_id, False)
+        
+        return jsonify({'message': 'Logged out', 'net_id': context.net_id})
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+        
+    except Exception as e:
+        current_app.logger.error(f"Error logging out: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
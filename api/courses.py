@@ -1,35 +1,80 @@
 """API routes for course-related functionality."""
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from pydantic import ValidationError
 
+from services.course_catalog import CourseCatalog
 from services.course_service import CourseService
+from utils.fieldsets import get_fields_arg
+from utils.http_cache import conditional_catalog_response
+from utils.query_args import get_list_arg
 
 
 # Create Blueprint
 courses_bp = Blueprint('courses', __name__, url_prefix='/api/courses')
 
 
+def stream_ndjson(rows):
+    """
+    Stream rows as NDJSON (one JSON document per line).
+    
+    If fetching fails mid-stream the status can no longer change, so a final
+    {"error": ...} line tells the client the export is incomplete.
+    """
+    def generate():
+        try:
+            for row in rows:
+                yield current_app.json.dumps(row) + '\n'
+        except Exception as e:
+            current_app.logger.error(f"Error streaming export: {str(e)}")
+            yield current_app.json.dumps({'error': 'Export interrupted'}) + '\n'
+    
+    response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    # Ask proxies not to buffer, so lines reach the client as they are produced
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @courses_bp.route('', methods=['GET'])
 def get_all_courses():
     """
-    Get a list of all courses with optional filtering.
+    Get a list of all courses with optional faceted filtering.
+    
+    Query Parameters:
+        subject_code: Subject code(s) to filter by (repeat or comma-separate)
+        distribution: Distribution code(s) to filter by
+        level: Level band(s) to filter by ('100', '200', '300', '400+')
+        credits: Credit value(s) to filter by (e.g. '1', '0.5')
+        page: The page number (default: 1)
+        per_page: The number of courses per page (default: 50)
+        fields: Comma-separated course fields to return (default: all)
     
     Returns:
-        JSON response with paginated courses
+        JSON response with paginated courses and facet counts
     """
+    try:
+        fields = get_fields_arg()
+        # Match the facet values, so '1.0' finds the courses counted under '1'
+        credits = [CourseCatalog.credits_value(value) for value in get_list_arg('credits') or ()] or None
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the course service from the app context
         course_service = current_app.course_service
         
         # Get query parameters for filtering and pagination
-        subject_code = request.args.get('subject_code')
-        distribution = request.args.get('distribution')
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 50, type=int)
+        subject_codes = get_list_arg('subject_code')
+        distributions = get_list_arg('distribution')
+        levels = get_list_arg('level')
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
         
         # Get courses
-        courses = course_service.get_all_courses(subject_code, distribution, page, per_page)
+        courses = course_service.get_all_courses(
+            subject_codes, distributions, page, per_page,
+            levels=levels, credits=credits, fields=fields
+        )
         
         if not courses['courses']:
             return jsonify({'message': 'No courses found'}), 404
@@ -47,7 +92,45 @@ def get_all_courses():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@courses_bp.route('/export', methods=['GET'])
+def export_courses():
+    """
+    Stream the full course catalog as NDJSON, one course per line.
+    
+    Courses are read from the database in course_id order, one range at a
+    time, so memory use does not grow with the catalog.
+    
+    Query Parameters:
+        fields: Comma-separated course fields to return (default: all)
+    
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    course_service = current_app.course_service
+    rows = course_service.export_courses(fields, current_app.config['EXPORT_BATCH_SIZE'])
+    return stream_ndjson(rows)
+
+
+@courses_bp.route('/export/group-courses', methods=['GET'])
+def export_group_courses():
+    """
+    Stream every requirement group to course mapping as NDJSON.
+    
+    Returns:
+        Streaming application/x-ndjson response
+    """
+    course_service = current_app.course_service
+    rows = course_service.export_group_courses(current_app.config['EXPORT_BATCH_SIZE'])
+    return stream_ndjson(rows)
+
+
 @courses_bp.route('/<int:course_id>', methods=['GET'])
+@conditional_catalog_response(list_params=('fields',))
 def get_course_by_id(course_id):
     """
     Get detailed information about a specific course.
@@ -58,12 +141,17 @@ def get_course_by_id(course_id):
     Returns:
         JSON response with course details
     """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the course service from the app context
         course_service = current_app.course_service
         
         # Get course details
-        course = course_service.get_course_details(course_id)
+        course = course_service.get_course_details(course_id, fields)
         return jsonify(course)
         
     except ValueError as e:
@@ -80,14 +168,55 @@ def get_course_by_id(course_id):
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@courses_bp.route('/<int:course_id>/prerequisites', methods=['GET'])
+@conditional_catalog_response()
+def get_course_prerequisites(course_id):
+    """
+    Get the full prerequisite chain of a course.
+    
+    Args:
+        course_id: The course ID
+        
+    Returns:
+        JSON response with the course's depth, direct prerequisites, all
+        (transitive) prerequisites and the chain grouped by depth
+    """
+    try:
+        # Get the course service from the app context
+        course_service = current_app.course_service
+        
+        # Answered from the catalog's prerequisite graph, without queries
+        chain = course_service.get_prerequisite_chain(course_id)
+        return jsonify(chain)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+        
+    except Exception as e:
+        current_app.logger.error(f"Error retrieving prerequisites: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @courses_bp.route('/search', methods=['GET'])
 def search_courses():
     """
     Search for courses by title, subject code, or course number.
     
+    Query Parameters:
+        q: The search query (required)
+        limit: Maximum number of results (default: 10)
+        mode: 'substring' (default), 'fuzzy' for typo-tolerant matching, or
+            'fulltext' for ranked matching over titles and descriptions
+        fields: Comma-separated course fields to return (default: all)
+    
     Returns:
         JSON response with matching courses
     """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the course service from the app context
         course_service = current_app.course_service
@@ -95,18 +224,22 @@ def search_courses():
         # Get query parameter
         query = request.args.get('q', '')
         limit = request.args.get('limit', 10, type=int)
+        mode = request.args.get('mode', 'substring')
         
         if not query:
             return jsonify({'error': 'Search query is required'}), 400
         
         # Search courses
-        courses = course_service.search_courses(query, limit)
+        courses = course_service.search_courses(query, limit, mode, fields)
         
         if not courses:
             return jsonify({'message': 'No matching courses found'}), 404
         
         return jsonify(courses)
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+        
     except ValidationError as e:
         return jsonify({
             'error': 'Validation error',
@@ -118,7 +251,36 @@ def search_courses():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@courses_bp.route('/autocomplete', methods=['GET'])
+def autocomplete_courses():
+    """
+    Suggest courses as the user types a course code or title.
+    
+    Query Parameters:
+        q: The typed prefix (e.g. 'CPSC 2')
+        limit: Maximum number of suggestions (default: 10, max: 20)
+    
+    Returns:
+        JSON response with a list of {course_id, code, title} suggestions
+    """
+    try:
+        # Get the course service from the app context
+        course_service = current_app.course_service
+        
+        # Get query parameters
+        prefix = request.args.get('q', '')
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 20)
+        
+        # An empty prefix simply has no suggestions
+        return jsonify(course_service.autocomplete(prefix, limit))
+        
+    except Exception as e:
+        current_app.logger.error(f"Error autocompleting courses: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @courses_bp.route('/subject/<subject_code>', methods=['GET'])
+@conditional_catalog_response(list_params=('fields',))
 def get_courses_by_subject(subject_code):
     """
     Get all courses for a specific subject.
@@ -129,12 +291,17 @@ def get_courses_by_subject(subject_code):
     Returns:
         JSON response with courses for the subject
     """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the course service from the app context
         course_service = current_app.course_service
         
         # Get courses by subject
-        courses = course_service.get_courses_by_subject(subject_code)
+        courses = course_service.get_courses_by_subject(subject_code, fields)
         
         if not courses:
             return jsonify({'message': f'No courses found for subject: {subject_code}'}), 404
@@ -157,12 +324,17 @@ def get_courses_by_distribution(distribution):
     Returns:
         JSON response with courses for the distribution requirement
     """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the course service from the app context
         course_service = current_app.course_service
         
         # Get courses by distribution
-        courses = course_service.get_courses_by_distribution(distribution)
+        courses = course_service.get_courses_by_distribution(distribution, fields)
         
         if not courses:
             return jsonify({'message': f'No courses found for distribution: {distribution}'}), 404
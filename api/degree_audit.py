@@ -4,6 +4,7 @@ from flask import Blueprint, request, jsonify, current_app
 from pydantic import ValidationError
 
 from services.degree_audit_service import DegreeAuditService
+from utils.student_context import get_student_context
 
 
 # Create Blueprint
@@ -14,15 +15,15 @@ degree_audit_bp = Blueprint('degree_audit', __name__, url_prefix='/api')
 def check_degree_completion():
     """
     Endpoint to check if a student has completed their major requirements.
-    Requires the student's net_id in the request header.
+    Requires an authenticated student (X-Student-NetID header or session token).
     
     Returns:
         JSON response with completion status and unfulfilled requirements
     """
-    # Get student net_id from request header
-    net_id = request.headers.get('X-Student-NetID')
+    # Get the authenticated student from the request context
+    context = get_student_context()
     
-    if not net_id:
+    if context is None:
         return jsonify({
             'error': 'Missing student NetID in request header',
             'message': 'Please provide X-Student-NetID header'
@@ -33,7 +34,7 @@ def check_degree_completion():
         degree_audit_service = current_app.degree_audit_service
         
         # Check degree completion
-        result = degree_audit_service.check_degree_completion(net_id)
+        result = degree_audit_service.check_degree_completion(context.net_id, context)
         return jsonify(result)
         
     except ValueError as e:
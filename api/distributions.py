@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from services.distribution_service import DistributionService
 from utils.auth import auth_required  
+from utils.student_context import get_student_context
 
 
 # Create Blueprint
@@ -24,18 +25,16 @@ def get_distribution_requirements():
         JSON response with distribution requirement status by year
     """
     try:
-        # Get student NetID from header
-        net_id = request.headers.get('X-Student-NetID')
-        
-        # Get student info
-        student_info = current_app.student_service.get_student_info(net_id)
-        student_id = student_info['student']['student_id']
+        # Get the authenticated student from the request context
+        context = get_student_context()
+        student_id = context.student_id
+        net_id = context.net_id
         
         # Get distribution service
         dist_service = current_app.distribution_service
         
         # Get distribution status
-        status = dist_service.get_student_distribution_status(student_id)
+        status = dist_service.get_student_distribution_status(student_id, context)
         
         return jsonify({
             'student_id': student_id,
@@ -72,18 +71,16 @@ def get_distribution_requirements_by_year(year):
         }), 400
     
     try:
-        # Get student NetID from header
-        net_id = request.headers.get('X-Student-NetID')
-        
-        # Get student info
-        student_info = current_app.student_service.get_student_info(net_id)
-        student_id = student_info['student']['student_id']
+        # Get the authenticated student from the request context
+        context = get_student_context()
+        student_id = context.student_id
+        net_id = context.net_id
         
         # Get distribution service
         dist_service = current_app.distribution_service
         
         # Get distribution status for specified year
-        year_status = dist_service.get_distribution_status_by_year(student_id, year)
+        year_status = dist_service.get_distribution_status_by_year(student_id, year, context)
         
         return jsonify({
             'student_id': student_id,
@@ -4,6 +4,8 @@ from flask import Blueprint, request, jsonify, current_app
 from pydantic import ValidationError
 
 from services.major_service import MajorService
+from utils.fieldsets import get_fields_arg
+from utils.http_cache import conditional_catalog_response
 
 
 # Create Blueprint
@@ -11,6 +13,7 @@ majors_bp = Blueprint('majors', __name__, url_prefix='/api/majors')
 
 
 @majors_bp.route('', methods=['GET'])
+@conditional_catalog_response()
 def get_all_majors():
     """
     Get a list of all available majors.
@@ -36,6 +39,7 @@ def get_all_majors():
 
 
 @majors_bp.route('/<int:major_id>', methods=['GET'])
+@conditional_catalog_response()
 def get_major_by_id(major_id):
     """
     Get detailed information about a specific major.
@@ -69,6 +73,7 @@ def get_major_by_id(major_id):
 
 
 @majors_bp.route('/<int:major_id>/requirements', methods=['GET'])
+@conditional_catalog_response('catalog_year')
 def get_major_requirements(major_id):
     """
     Get all requirements for a specific major.
@@ -105,6 +110,7 @@ def get_major_requirements(major_id):
 
 
 @majors_bp.route('/<int:major_id>/courses', methods=['GET'])
+@conditional_catalog_response('type', list_params=('fields',))
 def get_major_courses(major_id):
     """
     Get all courses that can fulfill requirements for a specific major.
@@ -115,6 +121,11 @@ def get_major_courses(major_id):
     Returns:
         JSON response with major courses
     """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get the major service from the app context
         major_service = current_app.major_service
@@ -123,7 +134,7 @@ def get_major_courses(major_id):
         requirement_type = request.args.get('type')
         
         # Get major courses
-        courses = major_service.get_major_courses(major_id, requirement_type)
+        courses = major_service.get_major_courses(major_id, requirement_type, fields)
         return jsonify(courses)
         
     except ValueError as e:
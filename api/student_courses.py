@@ -1,10 +1,14 @@
 """API routes for student course management (enrollments and plans)."""
 
 from flask import Blueprint, request, jsonify, current_app
-from pydantic import BaseModel, ValidationError, Field
-from typing import Optional, List
+from pydantic import BaseModel, ValidationError, Field, model_validator
+from typing import Optional, List, Literal
 from datetime import datetime
 
+from utils.fieldsets import get_fields_arg
+from utils.student_context import get_student_context
+from utils.validation import BatchValidator, BatchValidationError
+
 
 # Create Blueprint
 student_courses_bp = Blueprint('student_courses', __name__, url_prefix='/api/student-courses')
@@ -27,35 +31,98 @@ class CoursesPlanRequest(BaseModel):
     notes: Optional[str] = None
 
 
+class PlanOperationRequest(BaseModel):
+    """Schema for one operation of a batch course plan request."""
+    op: Literal['create', 'update', 'delete']
+    plan_id: Optional[int] = None
+    course_id: Optional[int] = None
+    intended_term: Optional[str] = None
+    priority: Optional[int] = None
+    notes: Optional[str] = None
+    
+    @model_validator(mode='after')
+    def check_operation_fields(self):
+        if self.op == 'create' and (self.course_id is None or self.intended_term is None):
+            raise ValueError('create requires course_id and intended_term')
+        if self.op != 'create' and self.plan_id is None:
+            raise ValueError(f'{self.op} requires plan_id')
+        if self.op == 'update' and not self.model_fields_set & {'intended_term', 'priority', 'notes'}:
+            raise ValueError('update requires intended_term, priority or notes')
+        return self
+
+
+class GradeUpdateRequest(BaseModel):
+    """Schema for one change of a bulk grade update request."""
+    enrollment_id: int
+    grade: Optional[str] = None
+    status: Optional[str] = None
+    
+    @model_validator(mode='after')
+    def check_update_fields(self):
+        if not self.model_fields_set & {'grade', 'status'}:
+            raise ValueError('grade or status is required')
+        return self
+
+
 class CoursesListRequest(BaseModel):
     """Schema for course list request."""
     course_ids: List[int]
 
 
-# Helper function to validate student NetID from header
+# Compiled validators for bulk endpoints
+enrollment_batch_validator = BatchValidator(EnrollmentRequest)
+plan_batch_validator = BatchValidator(CoursesPlanRequest)
+plan_operation_batch_validator = BatchValidator(PlanOperationRequest)
+grade_update_batch_validator = BatchValidator(GradeUpdateRequest)
+
+
+def batch_validation_error_response(error: BatchValidationError):
+    """Build the 400 response listing every invalid item of a batch."""
+    return jsonify({
+        'error': 'Validation error',
+        'message': str(error),
+        'invalid_items': error.invalid_items,
+        'errors': error.errors
+    }), 400
+
+
+def missing_prerequisites_response(course_id: int, term: str):
+    """
+    Check the prerequisites of a course the student is adding, if requested.
+    
+    Returns:
+        The 400 response listing the missing prerequisites, or None if the
+        check was not requested (check_prerequisites=true) or passed
+    """
+    if request.args.get('check_prerequisites', '').lower() not in ('1', 'true', 'yes'):
+        return None
+    
+    context = get_student_context()
+    missing = current_app.plan_validation_service.check_course(
+        course_id, term, context.enrollments(), context.plans
+    )
+    if not missing:
+        return None
+    
+    return jsonify({
+        'error': 'Prerequisites not met',
+        'message': f'Course {course_id} has prerequisites not completed or planned before {term}',
+        'missing_prerequisites': missing
+    }), 400
+
+
+# Helper function to get the authenticated student's ID
 def get_student_id_from_header():
-    """Get student ID from NetID in header."""
-    net_id = request.headers.get('X-Student-NetID')
+    """Get student ID of the student authenticated for this request."""
+    context = get_student_context()
     
-    if not net_id:
+    if context is None:
         return jsonify({
             'error': 'Missing student NetID in request header',
             'message': 'Please provide X-Student-NetID header'
         }), 400
     
-    # Get the student service from the app context
-    student_service = current_app.student_service
-    
-    try:
-        # Get student info to find the ID
-        student_info = student_service.get_student_info(net_id)
-        student_id = student_info['student']['student_id']
-        return student_id
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 404
-    except Exception as e:
-        current_app.logger.error(f"Error getting student ID: {str(e)}")
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+    return context.student_id
 
 
 @student_courses_bp.route('/enrollments', methods=['GET'])
@@ -68,6 +135,7 @@ def get_enrollments():
         
     Query Parameters:
         status: Optional enrollment status to filter by (e.g., 'Completed', 'Enrolled')
+        fields: Comma-separated course fields to include (default: all)
         
     Returns:
         JSON response with student enrollments
@@ -76,6 +144,11 @@ def get_enrollments():
     if not isinstance(student_id, int):
         return student_id  # This is an error response
     
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Get status filter if provided
         status = request.args.get('status')
@@ -84,7 +157,7 @@ def get_enrollments():
         student_service = current_app.student_service
         
         # Get enrollments
-        enrollments = student_service.get_student_enrollments(student_id, status)
+        enrollments = student_service.get_student_enrollments(student_id, status, fields)
         
         return jsonify(enrollments)
         
@@ -107,6 +180,10 @@ def add_enrollment():
         grade: The grade received (optional)
         status: The enrollment status (default: 'Enrolled')
         
+    Query Parameters:
+        check_prerequisites: If true, reject the course when prerequisites are
+            not completed, or in progress or planned for an earlier term
+        
     Returns:
         JSON response with the created enrollment
     """
@@ -123,12 +200,15 @@ def add_enrollment():
         # For now, we'll create a placeholder implementation
         
         # Check if the course exists
-        course_service = current_app.course_service
-        try:
-            course = course_service.get_course_details(enrollment_request.course_id)
-        except ValueError:
+        courses = current_app.course_service.get_courses_by_ids([enrollment_request.course_id])
+        course = courses.get(enrollment_request.course_id)
+        if course is None:
             return jsonify({'error': f'Course with ID {enrollment_request.course_id} not found'}), 404
         
+        error_response = missing_prerequisites_response(enrollment_request.course_id, enrollment_request.term_taken)
+        if error_response:
+            return error_response
+        
         # Connect to the database
         supabase = current_app.config['supabase']
         
@@ -149,7 +229,7 @@ def add_enrollment():
         new_enrollment = response.data[0]
         
         # Add course information to the response
-        new_enrollment['course'] = course['course']
+        new_enrollment['course'] = course
         
         return jsonify(new_enrollment), 201
         
@@ -194,19 +274,6 @@ def update_enrollment(enrollment_id):
         # Connect to the database
         supabase = current_app.config['supabase']
         
-        # First check if the enrollment exists and belongs to this student
-        check_response = supabase.table('studentcourseenrollments')\
-            .select('*')\
-            .eq('enrollment_id', enrollment_id)\
-            .eq('student_id', student_id)\
-            .execute()
-        
-        if not check_response.data:
-            return jsonify({
-                'error': 'Enrollment not found',
-                'message': f'No enrollment found with ID {enrollment_id} for this student'
-            }), 404
-        
         # Prepare update data (only include fields that were provided)
         update_data = {}
         if 'term_taken' in data:
@@ -219,7 +286,7 @@ def update_enrollment(enrollment_id):
         if not update_data:
             return jsonify({'error': 'No update data provided'}), 400
         
-        # Update the enrollment
+        # Update the enrollment only if it belongs to this student (no row means not found)
         response = supabase.table('studentcourseenrollments')\
             .update(update_data)\
             .eq('enrollment_id', enrollment_id)\
@@ -227,18 +294,18 @@ def update_enrollment(enrollment_id):
             .execute()
         
         if not response.data:
-            return jsonify({'error': 'Failed to update enrollment'}), 500
+            return jsonify({
+                'error': 'Enrollment not found',
+                'message': f'No enrollment found with ID {enrollment_id} for this student'
+            }), 404
         
         updated_enrollment = response.data[0]
         
         # Get course information
-        course_service = current_app.course_service
-        try:
-            course = course_service.get_course_details(updated_enrollment['course_id'])
-            updated_enrollment['course'] = course['course']
-        except ValueError:
-            # If we can't get course details, just return the enrollment without course info
-            pass
+        courses = current_app.course_service.get_courses_by_ids([updated_enrollment['course_id']])
+        course = courses.get(updated_enrollment['course_id'])
+        if course:
+            updated_enrollment['course'] = course
         
         return jsonify(updated_enrollment)
         
@@ -269,29 +336,19 @@ def delete_enrollment(enrollment_id):
         # Connect to the database
         supabase = current_app.config['supabase']
         
-        # First check if the enrollment exists and belongs to this student
-        check_response = supabase.table('studentcourseenrollments')\
-            .select('*')\
+        # Delete the enrollment only if it belongs to this student (no row means not found)
+        response = supabase.table('studentcourseenrollments')\
+            .delete()\
             .eq('enrollment_id', enrollment_id)\
             .eq('student_id', student_id)\
             .execute()
         
-        if not check_response.data:
+        if not response.data:
             return jsonify({
                 'error': 'Enrollment not found',
                 'message': f'No enrollment found with ID {enrollment_id} for this student'
             }), 404
         
-        # Delete the enrollment
-        response = supabase.table('studentcourseenrollments')\
-            .delete()\
-            .eq('enrollment_id', enrollment_id)\
-            .eq('student_id', student_id)\
-            .execute()
-        
-        if not response.data:
-            return jsonify({'error': 'Failed to delete enrollment'}), 500
-        
         return jsonify({
             'message': 'Enrollment deleted successfully',
             'enrollment_id': enrollment_id
@@ -368,6 +425,10 @@ def add_course_plan():
         priority: Priority level (optional)
         notes: Additional notes (optional)
         
+    Query Parameters:
+        check_prerequisites: If true, reject the course when prerequisites are
+            not completed, or in progress or planned for an earlier term
+        
     Returns:
         JSON response with the created course plan
     """
@@ -381,12 +442,15 @@ def add_course_plan():
         plan_request = CoursesPlanRequest(**data)
         
         # Check if the course exists
-        course_service = current_app.course_service
-        try:
-            course = course_service.get_course_details(plan_request.course_id)
-        except ValueError:
+        courses = current_app.course_service.get_courses_by_ids([plan_request.course_id])
+        course = courses.get(plan_request.course_id)
+        if course is None:
             return jsonify({'error': f'Course with ID {plan_request.course_id} not found'}), 404
         
+        error_response = missing_prerequisites_response(plan_request.course_id, plan_request.intended_term)
+        if error_response:
+            return error_response
+        
         # Connect to the database
         supabase = current_app.config['supabase']
         
@@ -407,7 +471,7 @@ def add_course_plan():
         new_plan = response.data[0]
         
         # Add course information to the response
-        new_plan['course'] = course['course']
+        new_plan['course'] = course
         
         return jsonify(new_plan), 201
         
@@ -422,6 +486,36 @@ def add_course_plan():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@student_courses_bp.route('/plans/validate', methods=['GET'])
+def validate_course_plans():
+    """
+    Check all course plans of a student against their prerequisites.
+    
+    Plans are ordered by intended term; each course's prerequisites must be
+    completed, or in progress or planned for an earlier term (or the same
+    term, where concurrent enrollment is allowed).
+    
+    Headers:
+        X-Student-NetID: The student's NetID
+        
+    Returns:
+        JSON response with 'valid' and every violation found
+    """
+    student_id = get_student_id_from_header()
+    if not isinstance(student_id, int):
+        return student_id  # This is an error response
+    
+    try:
+        context = get_student_context()
+        result = current_app.plan_validation_service.validate_plans(context.enrollments(), context.plans)
+        
+        return jsonify(result)
+        
+    except Exception as e:
+        current_app.logger.error(f"Error validating course plans: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @student_courses_bp.route('/plans/<int:plan_id>', methods=['PUT'])
 def update_course_plan(plan_id):
     """
@@ -452,19 +546,6 @@ def update_course_plan(plan_id):
         # Connect to the database
         supabase = current_app.config['supabase']
         
-        # First check if the plan exists and belongs to this student
-        check_response = supabase.table('studentcourseplans')\
-            .select('*')\
-            .eq('plan_id', plan_id)\
-            .eq('student_id', student_id)\
-            .execute()
-        
-        if not check_response.data:
-            return jsonify({
-                'error': 'Course plan not found',
-                'message': f'No course plan found with ID {plan_id} for this student'
-            }), 404
-        
         # Prepare update data (only include fields that were provided)
         update_data = {}
         if 'intended_term' in data:
@@ -477,7 +558,7 @@ def update_course_plan(plan_id):
         if not update_data:
             return jsonify({'error': 'No update data provided'}), 400
         
-        # Update the course plan
+        # Update the course plan only if it belongs to this student (no row means not found)
         response = supabase.table('studentcourseplans')\
             .update(update_data)\
             .eq('plan_id', plan_id)\
@@ -485,18 +566,18 @@ def update_course_plan(plan_id):
             .execute()
         
         if not response.data:
-            return jsonify({'error': 'Failed to update course plan'}), 500
+            return jsonify({
+                'error': 'Course plan not found',
+                'message': f'No course plan found with ID {plan_id} for this student'
+            }), 404
         
         updated_plan = response.data[0]
         
         # Get course information
-        course_service = current_app.course_service
-        try:
-            course = course_service.get_course_details(updated_plan['course_id'])
-            updated_plan['course'] = course['course']
-        except ValueError:
-            # If we can't get course details, just return the plan without course info
-            pass
+        courses = current_app.course_service.get_courses_by_ids([updated_plan['course_id']])
+        course = courses.get(updated_plan['course_id'])
+        if course:
+            updated_plan['course'] = course
         
         return jsonify(updated_plan)
         
@@ -527,29 +608,19 @@ def delete_course_plan(plan_id):
         # Connect to the database
         supabase = current_app.config['supabase']
         
-        # First check if the plan exists and belongs to this student
-        check_response = supabase.table('studentcourseplans')\
-            .select('*')\
+        # Delete the course plan only if it belongs to this student (no row means not found)
+        response = supabase.table('studentcourseplans')\
+            .delete()\
             .eq('plan_id', plan_id)\
             .eq('student_id', student_id)\
             .execute()
         
-        if not check_response.data:
+        if not response.data:
             return jsonify({
                 'error': 'Course plan not found',
                 'message': f'No course plan found with ID {plan_id} for this student'
             }), 404
         
-        # Delete the course plan
-        response = supabase.table('studentcourseplans')\
-            .delete()\
-            .eq('plan_id', plan_id)\
-            .eq('student_id', student_id)\
-            .execute()
-        
-        if not response.data:
-            return jsonify({'error': 'Failed to delete course plan'}), 500
-        
         return jsonify({
             'message': 'Course plan deleted successfully',
             'plan_id': plan_id
@@ -588,23 +659,35 @@ def batch_add_enrollments():
         if not data or 'enrollments' not in data or not isinstance(data['enrollments'], list):
             return jsonify({'error': 'Invalid request. Expected "enrollments" array.'}), 400
         
-        # Validate each enrollment
-        enrollments_to_add = []
-        for enrollment_data in data['enrollments']:
-            try:
-                enrollment = EnrollmentRequest(**enrollment_data)
-                enrollments_to_add.append({
-                    'student_id': student_id,
-                    'course_id': enrollment.course_id,
-                    'term_taken': enrollment.term_taken,
-                    'grade': enrollment.grade,
-                    'status': enrollment.status
-                })
-            except ValidationError as e:
-                return jsonify({
-                    'error': f'Validation error in enrollment data: {enrollment_data}',
-                    'message': str(e)
-                }), 400
+        # Validate all enrollments in one call, reporting every invalid item
+        try:
+            enrollments = enrollment_batch_validator.validate(data['enrollments'])
+        except BatchValidationError as e:
+            return batch_validation_error_response(e)
+        
+        # Check that all courses exist (one lookup), rejecting the batch before inserting anything
+        courses = current_app.course_service.get_courses_by_ids([enrollment.course_id for enrollment in enrollments])
+        unknown_courses = [
+            {
+                'index': index,
+                'field': 'course_id',
+                'message': f'Course with ID {enrollment.course_id} not found'
+            }
+            for index, enrollment in enumerate(enrollments) if enrollment.course_id not in courses
+        ]
+        if unknown_courses:
+            return batch_validation_error_response(BatchValidationError(unknown_courses, len(enrollments)))
+        
+        enrollments_to_add = [
+            {
+                'student_id': student_id,
+                'course_id': enrollment.course_id,
+                'term_taken': enrollment.term_taken,
+                'grade': enrollment.grade,
+                'status': enrollment.status
+            }
+            for enrollment in enrollments
+        ]
         
         # Connect to the database
         supabase = current_app.config['supabase']
@@ -615,20 +698,11 @@ def batch_add_enrollments():
         if not response.data:
             return jsonify({'error': 'Failed to create enrollments'}), 500
         
-        # Add course information to the response
-        course_service = current_app.course_service
-        enrollments_with_details = []
-        
-        for enrollment in response.data:
-            course_id = enrollment['course_id']
-            try:
-                course = course_service.get_course_details(course_id)
-                enrollment_with_details = enrollment.copy()
-                enrollment_with_details['course'] = course['course']
-                enrollments_with_details.append(enrollment_with_details)
-            except ValueError:
-                # If we can't get course details, still include the enrollment without course info
-                enrollments_with_details.append(enrollment)
+        # Add course information to the response from the courses looked up above
+        enrollments_with_details = [
+            dict(enrollment, course=courses[enrollment['course_id']])
+            for enrollment in response.data
+        ]
         
         return jsonify({
             'message': f'Successfully added {len(enrollments_with_details)} enrollments',
@@ -640,6 +714,155 @@ def batch_add_enrollments():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@student_courses_bp.route('/batch/plans', methods=['POST'])
+def batch_plan_operations():
+    """
+    Create, update and delete several course plans for a student in a single request.
+    
+    Headers:
+        X-Student-NetID: The student's NetID
+        
+    Request Body:
+        operations: List of operation objects, each containing:
+            op: 'create', 'update' or 'delete'
+            plan_id: The plan ID (update and delete)
+            course_id: The course ID (create)
+            intended_term: The term the student intends to take the course
+                (required for create, optional for update)
+            priority: Priority level (optional)
+            notes: Additional notes (optional)
+            
+    Returns:
+        JSON response with the number of created, updated and deleted plans
+        and all of the student's course plans with course details
+    """
+    student_id = get_student_id_from_header()
+    if not isinstance(student_id, int):
+        return student_id  # This is an error response
+    
+    try:
+        # Parse request data
+        data = request.json
+        if not data or 'operations' not in data or not isinstance(data['operations'], list):
+            return jsonify({'error': 'Invalid request. Expected "operations" array.'}), 400
+        
+        # Validate all operations in one call, reporting every invalid item
+        try:
+            operations = plan_operation_batch_validator.validate(data['operations'])
+        except BatchValidationError as e:
+            return batch_validation_error_response(e)
+        
+        # Check that all courses of new plans exist (one lookup)
+        course_service = current_app.course_service
+        courses = course_service.get_courses_by_ids(
+            [operation.course_id for operation in operations if operation.op == 'create']
+        )
+        unknown_courses = [
+            {
+                'index': index,
+                'field': 'course_id',
+                'message': f'Course with ID {operation.course_id} not found'
+            }
+            for index, operation in enumerate(operations)
+            if operation.op == 'create' and operation.course_id not in courses
+        ]
+        if unknown_courses:
+            return batch_validation_error_response(BatchValidationError(unknown_courses, len(operations)))
+        
+        # Apply the operations with bulk ownership checks and bulk writes
+        try:
+            result = current_app.student_service.apply_plan_operations(
+                student_id,
+                [operation.model_dump(exclude_unset=True) for operation in operations]
+            )
+        except BatchValidationError as e:
+            return batch_validation_error_response(e)
+        
+        # Add course information to all plans
+        plans = result['plans']
+        courses = course_service.get_courses_by_ids([plan['course_id'] for plan in plans])
+        result['plans'] = [
+            dict(plan, course=courses[plan['course_id']]) if plan['course_id'] in courses else plan
+            for plan in plans
+        ]
+        
+        return jsonify({
+            'message': (f"Successfully applied {len(operations)} operations: {result['created']} created, "
+                        f"{result['updated']} updated, {result['deleted']} deleted"),
+            **result
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Error applying course plan operations in batch: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
+@student_courses_bp.route('/batch/enrollments', methods=['PATCH'])
+def batch_update_enrollments():
+    """
+    Update the grade and/or status of several enrollments for a student in a single request.
+    
+    Headers:
+        X-Student-NetID: The student's NetID
+        
+    Request Body:
+        updates: List of change objects, each containing:
+            enrollment_id: The enrollment ID
+            grade: The grade received (optional)
+            status: The enrollment status (optional, e.g. 'Completed')
+            
+    Returns:
+        JSON response with one result per change ('updated', 'unchanged' or 'not_found')
+    """
+    student_id = get_student_id_from_header()
+    if not isinstance(student_id, int):
+        return student_id  # This is an error response
+    
+    try:
+        # Parse request data
+        data = request.json
+        if not data or 'updates' not in data or not isinstance(data['updates'], list):
+            return jsonify({'error': 'Invalid request. Expected "updates" array.'}), 400
+        
+        # Validate all changes in one call, reporting every invalid item
+        try:
+            updates = grade_update_batch_validator.validate(data['updates'])
+        except BatchValidationError as e:
+            return batch_validation_error_response(e)
+        
+        seen = set()
+        duplicates = []
+        for index, update in enumerate(updates):
+            if update.enrollment_id in seen:
+                duplicates.append({
+                    'index': index,
+                    'field': 'enrollment_id',
+                    'message': f'Enrollment {update.enrollment_id} appears in more than one update'
+                })
+            seen.add(update.enrollment_id)
+        if duplicates:
+            return batch_validation_error_response(BatchValidationError(duplicates, len(updates)))
+        
+        # Apply all changes with one read and one write
+        results = current_app.student_service.update_enrollment_grades(
+            student_id,
+            [update.model_dump(exclude_unset=True) for update in updates]
+        )
+        
+        # Enrollments changed: drop data cached for this request, once for the whole batch
+        get_student_context().invalidate()
+        
+        updated_count = sum(1 for result in results if result['result'] == 'updated')
+        return jsonify({
+            'message': f'Successfully updated {updated_count} enrollments',
+            'results': results
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Error updating enrollments in batch: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @student_courses_bp.route('/batch/delete-enrollments', methods=['POST'])
 def batch_delete_enrollments():
     """
@@ -669,33 +892,20 @@ def batch_delete_enrollments():
         # Connect to the database
         supabase = current_app.config['supabase']
         
-        # First check which enrollments exist and belong to this student
-        in_clause = f"({','.join([str(id) for id in enrollment_ids])})"
-        check_response = supabase.table('studentcourseenrollments')\
-            .select('enrollment_id')\
+        # Delete only the enrollments that belong to this student; the deleted rows tell which existed
+        response = supabase.table('studentcourseenrollments')\
+            .delete()\
             .eq('student_id', student_id)\
             .in_('enrollment_id', enrollment_ids)\
             .execute()
         
-        if not check_response.data:
+        if not response.data:
             return jsonify({
                 'error': 'Enrollments not found',
                 'message': 'No enrollments found with the provided IDs for this student'
             }), 404
         
-        # Get the IDs that were found
-        found_ids = [enrollment['enrollment_id'] for enrollment in check_response.data]
-        
-        # Delete the enrollments
-        response = supabase.table('studentcourseenrollments')\
-            .delete()\
-            .eq('student_id', student_id)\
-            .in_('enrollment_id', found_ids)\
-            .execute()
-        
-        if not response.data:
-            return jsonify({'error': 'Failed to delete enrollments'}), 500
-        
+        found_ids = [enrollment['enrollment_id'] for enrollment in response.data]
         deleted_count = len(response.data)
         not_found = [id for id in enrollment_ids if id not in found_ids]
         
@@ -707,4 +917,55 @@ def batch_delete_enrollments():
         
     except Exception as e:
         current_app.logger.error(f"Error deleting enrollments in batch: {str(e)}")
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
\ No newline at end of file
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+@student_courses_bp.route('/import-transcript', methods=['POST'])
+def import_transcript():
+    """
+    Import a student's transcript as course enrollments, idempotently.
+    
+    Headers:
+        X-Student-NetID: The student's NetID
+        
+    Request Body:
+        Either JSON with a "rows" array, or CSV (Content-Type: text/csv) with a
+        header row; each row contains:
+            course: The course ID or code (e.g. 'CPSC 201')
+            term: The term the course was taken (e.g. 'Fall 2022')
+            grade: The grade received (optional)
+            status: The enrollment status (optional, default: 'Completed')
+            
+    Returns:
+        JSON response with the number of inserted, updated and skipped rows
+        and the written enrollments
+    """
+    student_id = get_student_id_from_header()
+    if not isinstance(student_id, int):
+        return student_id  # This is an error response
+    
+    try:
+        transcript_service = current_app.transcript_service
+        
+        # Parse request data
+        if request.mimetype == 'text/csv':
+            rows = transcript_service.parse_csv(request.get_data(as_text=True))
+        else:
+            data = request.get_json(silent=True)
+            if not data or 'rows' not in data or not isinstance(data['rows'], list):
+                return jsonify({'error': 'Invalid request. Expected "rows" array or a CSV body.'}), 400
+            rows = data['rows']
+        
+        try:
+            result = transcript_service.import_transcript(student_id, rows)
+        except BatchValidationError as e:
+            return batch_validation_error_response(e)
+        
+        return jsonify({
+            'message': (f"Imported {len(rows)} rows: {result['inserted']} inserted, "
+                        f"{result['updated']} updated, {result['skipped']} skipped"),
+            **result
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Error importing transcript: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
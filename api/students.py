@@ -4,6 +4,9 @@ from flask import Blueprint, request, jsonify, current_app
 from pydantic import ValidationError
 
 from services.student_service import StudentService
+from utils.fieldsets import get_fields_arg
+from utils.query_args import get_list_arg
+from utils.student_context import get_student_context
 
 
 # Create Blueprint
@@ -22,14 +25,14 @@ def get_student_info():
         JSON response with student information
     """
     try:
-        # Get student NetID from header
-        net_id = request.headers.get('X-Student-NetID')
+        # Get the authenticated student from the request context
+        context = get_student_context()
         
         # Get the student service from the app context
         student_service = current_app.student_service
         
         # Get student info
-        student_info = student_service.get_student_info(net_id)
+        student_info = student_service.get_student_info(context.net_id, context)
         return jsonify(student_info)
         
     except ValueError as e:
@@ -56,13 +59,19 @@ def get_student_enrollments():
         
     Query Parameters:
         status: Optional filter for enrollment status
+        fields: Comma-separated course fields to include (default: all)
         
     Returns:
         JSON response with student enrollments
     """
     try:
-        # Get student NetID from header
-        net_id = request.headers.get('X-Student-NetID')
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        # Get the authenticated student from the request context
+        student_id = get_student_context().student_id
         
         # Get the student service from the app context
         student_service = current_app.student_service
@@ -70,12 +79,8 @@ def get_student_enrollments():
         # Get status filter if provided
         status = request.args.get('status')
         
-        # First get the student to find their ID
-        student_info = student_service.get_student_info(net_id)
-        student_id = student_info['student']['student_id']
-        
         # Get enrollments
-        enrollments = student_service.get_student_enrollments(student_id, status)
+        enrollments = student_service.get_student_enrollments(student_id, status, fields)
         
         return jsonify(enrollments)
         
@@ -93,6 +98,65 @@ def get_student_enrollments():
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+@students_bp.route('/eligible-courses', methods=['GET'])
+def get_eligible_courses():
+    """
+    Get the courses a student can take next, i.e. whose prerequisites are all met.
+    
+    Completed and in-progress enrollments count as taken; taken courses are
+    not listed.
+    
+    Headers:
+        X-Student-NetID: The student's NetID (required)
+        
+    Query Parameters:
+        subject_code: Subject code(s) to filter by (repeat or comma-separate)
+        distribution: Distribution code(s) to filter by
+        level: Level band(s) to filter by ('100', '200', '300', '400+')
+        page: The page number (default: 1)
+        per_page: The number of courses per page (default: 50)
+        fields: Comma-separated course fields to return (default: all)
+        
+    Returns:
+        JSON response with the paginated eligible courses
+    """
+    try:
+        fields = get_fields_arg()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    try:
+        # Get the authenticated student from the request context
+        context = get_student_context()
+        taken_course_ids = [
+            enrollment['course_id'] for enrollment in context.enrollments()
+            if enrollment.get('status') in ('Completed', 'Enrolled')
+        ]
+        
+        # Get the course service from the app context
+        course_service = current_app.course_service
+        
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+        
+        courses = course_service.get_eligible_courses(
+            taken_course_ids,
+            subject_codes=get_list_arg('subject_code'),
+            distributions=get_list_arg('distribution'),
+            levels=get_list_arg('level'),
+            page=page, per_page=per_page, fields=fields
+        )
+        
+        return jsonify(courses)
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+        
+    except Exception as e:
+        current_app.logger.error(f"Error retrieving eligible courses: {str(e)}")
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
 @students_bp.route('/gpa', methods=['GET'])
 def get_student_gpa():
     """
@@ -105,16 +169,14 @@ def get_student_gpa():
         JSON response with student GPA
     """
     try:
-        # Get student NetID from header
-        net_id = request.headers.get('X-Student-NetID')
+        # Get the authenticated student from the request context
+        context = get_student_context()
+        student_id = context.student_id
+        net_id = context.net_id
         
         # Get the student service from the app context
         student_service = current_app.student_service
         
-        # First get the student to find their ID
-        student_info = student_service.get_student_info(net_id)
-        student_id = student_info['student']['student_id']
-        
         # Calculate GPA
         gpa = student_service.calculate_student_gpa(student_id)
         
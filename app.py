@@ -8,8 +8,14 @@ from supabase import create_client
 
 from config import active_config
 from api import blueprints
+from utils.auth import Authenticator
+from utils.auth_cache import AuthCache
+from utils.compression import compress_response
+from utils.http_cache import ResponseCache
+from utils.json_provider import FastJSONProvider
+from utils.session_tokens import SessionTokenSigner
 from repositories import StudentRepository, MajorRepository, CourseRepository, DistributionRepository
-from services import StudentService, MajorService, CourseService, DegreeAuditService, DistributionService
+from services import StudentService, MajorService, CourseService, DegreeAuditService, DistributionService, CourseCatalog, TranscriptService, PlanValidationService
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +39,9 @@ def create_app(config=None):
         # Initialize Flask application
         app = Flask(__name__)
         
+        # Encode JSON responses with orjson when it is installed
+        app.json = FastJSONProvider(app)
+        
         # Configure the application
         if config is None:
             config = active_config
@@ -64,10 +73,42 @@ def create_app(config=None):
         course_repo = CourseRepository(supabase)
         distribution_repo = DistributionRepository(supabase)
         
+        # Shared in-memory course catalog (loaded lazily on first use)
+        app.course_catalog = CourseCatalog(
+            course_repo,
+            refresh_interval=app.config['CATALOG_REFRESH_SECONDS'],
+            search_index_path=app.config['SEARCH_INDEX_PATH']
+        )
+        
+        # Encoded responses of read-only catalog endpoints
+        app.response_cache = ResponseCache(
+            max_entries=app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+            max_bytes=app.config['RESPONSE_CACHE_MAX_BYTES']
+        )
+        
+        # Cache of authentication lookups shared by the middleware and the student service
+        app.auth_cache = AuthCache(
+            ttl=app.config['AUTH_CACHE_TTL'],
+            negative_ttl=app.config['AUTH_CACHE_NEGATIVE_TTL']
+        )
+        
+        # Signer for stateless session tokens (None unless token mode is enabled)
+        app.session_tokens = (
+            SessionTokenSigner(app.config['SECRET_KEY'], ttl=app.config['SESSION_TOKEN_TTL'])
+            if app.config['SESSION_TOKENS_ENABLED'] else None
+        )
+        
+        # Single authentication path for the middleware and auth_required
+        app.authenticator = Authenticator(student_repo, app.auth_cache, app.session_tokens)
+        
         # Initialize services
-        app.student_service = StudentService(student_repo, course_repo)
+        app.student_service = StudentService(student_repo, course_repo, app.auth_cache)
         app.major_service = MajorService(major_repo, course_repo)
-        app.course_service = CourseService(course_repo)
+        app.course_service = CourseService(
+            course_repo,
+            app.course_catalog,
+            search_backend=app.config['COURSE_SEARCH_BACKEND']
+        )
         app.degree_audit_service = DegreeAuditService(
             student_repo,
             major_repo,
@@ -79,6 +120,12 @@ def create_app(config=None):
             student_repo,
             course_repo
         )
+        app.transcript_service = TranscriptService(
+            student_repo,
+            app.course_service,
+            chunk_size=app.config['IMPORT_BATCH_SIZE']
+        )
+        app.plan_validation_service = PlanValidationService(app.course_catalog)
         
         logger.info("Successfully initialized all services")
         
@@ -99,51 +146,28 @@ def create_app(config=None):
             if request.method == 'OPTIONS':
                 return None
             
-            # Get student NetID from header
-            net_id = request.headers.get('X-Student-NetID')
-            
-            if not net_id:
-                return jsonify({
-                    'error': 'Unauthorized',
-                    'message': 'Authentication required. Please provide X-Student-NetID header'
-                }), 401
-            
-            try:
-                # Check if student exists and is logged in
-                response = supabase.table('students')\
-                    .select('*')\
-                    .eq('net_id', net_id)\
-                    .eq('logged', True)\
-                    .execute()
-                
-                if not response.data:
-                    return jsonify({
-                        'error': 'Unauthorized',
-                        'message': 'User is not logged in or does not exist'
-                    }), 401
-                
-                # Store the student data in request for later use
-                request.student = response.data[0]
-            except Exception as e:
-                logger.error("Authentication error: %s", str(e))
-                return jsonify({
-                    'error': 'Authentication error',
-                    'message': 'An error occurred during authentication'
-                }), 500
+            return app.authenticator.authenticate()
+        
+        # Compress large responses for clients that accept it
+        app.after_request(compress_response)
         
         # Add CORS support
         @app.after_request
         def add_cors_headers(response):
             response.headers.add('Access-Control-Allow-Origin', '*')
             response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization,X-Student-NetID')
-            response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+            response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,PATCH,POST,DELETE,OPTIONS')
             return response
         
         # Add health check endpoint
         @app.route('/health', methods=['GET'])
         def health_check():
             """Health check endpoint."""
-            return {'status': 'healthy', 'service': 'yale-degree-audit'}, 200
+            return {
+                'status': 'healthy',
+                'service': 'yale-degree-audit',
+                'auth': app.authenticator.stats()
+            }, 200
         
         @app.errorhandler(404)
         def not_found(error):
@@ -0,0 +1,247 @@
+"""Yale Degree Audit Application - ASGI Entry Point.
+
+Serves the degree audit and student info endpoints natively on the event loop,
+with async repositories that fetch independent data concurrently, and every
+other route through the Flask application (run in a thread pool).
+
+Run with an ASGI server, e.g.:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+from supabase import AsyncClient, acreate_client
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
+
+from app import create_app
+from repositories.async_repositories import AsyncStudentRepository, AsyncMajorRepository, AsyncCourseRepository
+from services.async_degree_audit_service import AsyncDegreeAuditService
+from utils.auth import parse_bearer_token
+from utils.auth_cache import AuthCache
+from utils.compression import COMPRESSIBLE_MIMETYPES, compress, negotiate_encoding
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDegreeAuditApp:
+    """
+    ASGI application wrapping the Flask application.
+
+    GET /api/degree-audit and GET /api/students are handled with async
+    repositories on a shared AsyncClient, so a single worker can keep many of
+    these requests waiting on Supabase at once. Authentication, JSON encoding,
+    compression and CORS headers match the Flask application; all other
+    requests go to Flask.
+    """
+
+    def __init__(self, flask_app: Flask):
+        """
+        Initialize with the configured Flask application.
+
+        Args:
+            flask_app: Application created by create_app (its caches, session
+                token signer, authenticator counters and distribution service
+                are shared with the async routes)
+        """
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+
+        self._client: Optional[AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self.student_repo: Optional[AsyncStudentRepository] = None
+        self.audit_service: Optional[AsyncDegreeAuditService] = None
+
+        # Routes served natively, by path (GET only)
+        self.routes = {
+            '/api/degree-audit': self.degree_audit,
+            '/api/students': self.student_info
+        }
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        route = self.routes.get(scope.get('path'))
+        if scope['type'] != 'http' or scope['method'] != 'GET' or route is None:
+            await self.wsgi(scope, receive, send)
+            return
+
+        headers = Headers([(key.decode('latin-1'), value.decode('latin-1')) for key, value in scope['headers']])
+        await self._ensure_client()
+
+        body, status = await self._authenticate(scope, headers)
+        if body is None:
+            try:
+                body, status = await route(scope, headers)
+            except Exception as e:
+                self.flask_app.logger.error("Unhandled error in %s: %s", scope['path'], str(e))
+                body, status = {'error': 'Server error', 'message': 'An internal server error occurred'}, 500
+
+        await self._send_json(send, headers, body, status)
+
+    async def _lifespan(self, receive, send) -> None:
+        """Handle the ASGI lifespan protocol (the async client is created at startup)."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await self._ensure_client()
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _ensure_client(self) -> None:
+        """Create the async Supabase client and repositories on first use."""
+        if self._client is not None:
+            return
+
+        async with self._client_lock:
+            if self._client is not None:
+                return
+
+            config = self.flask_app.config
+            client = await acreate_client(config['SUPABASE_URL'], config['SUPABASE_KEY'])
+
+            self.student_repo = AsyncStudentRepository(client)
+            self.audit_service = AsyncDegreeAuditService(
+                self.student_repo,
+                AsyncMajorRepository(client),
+                AsyncCourseRepository(client),
+                self.flask_app.distribution_service
+            )
+            self._client = client
+            logger.info("Successfully initialized async Supabase client")
+
+    async def _authenticate(self, scope: Dict[str, Any], headers: Headers) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Authenticate a request the same way as the Flask Authenticator, whose
+        token verification is shared.
+
+        On success, scope['student'] holds the student (only the IDs for
+        session tokens) and scope['student_complete'] whether it is the full row.
+
+        Returns:
+            Tuple of (None, 200) if authenticated, otherwise (error body, status)
+        """
+        authenticator = self.flask_app.authenticator
+
+        # Session tokens are verified without touching the database
+        token = parse_bearer_token(headers.get('Authorization'))
+        if token and authenticator.session_tokens is not None:
+            claims = authenticator.verify_token(token)
+            if claims is None:
+                return authenticator.TOKEN_REJECTED, 401
+
+            scope['student'] = authenticator.token_student(claims)
+            scope['student_complete'] = False
+            return None, 200
+
+        net_id = headers.get('X-Student-NetID')
+        if not net_id:
+            authenticator.record('rejected')
+            return {
+                'error': 'Unauthorized',
+                'message': 'Authentication required. Please provide X-Student-NetID header'
+            }, 401
+
+        try:
+            # Check the shared cache before asking the database
+            auth_cache = self.flask_app.auth_cache
+            student = auth_cache.get(net_id)
+
+            if student is AuthCache.MISS:
+                authenticator.record('database')
+                student = await self.student_repo.get_logged_in(net_id)
+                auth_cache.set(net_id, student)
+            else:
+                authenticator.record('cache')
+
+            if student is None:
+                authenticator.record('rejected')
+                return {
+                    'error': 'Unauthorized',
+                    'message': 'User is not logged in or does not exist'
+                }, 401
+
+            scope['student'] = student
+            scope['student_complete'] = True
+            return None, 200
+
+        except Exception as e:
+            authenticator.record('errors')
+            self.flask_app.logger.error("Authentication error: %s", str(e))
+            return {
+                'error': 'Authentication error',
+                'message': 'An error occurred during authentication'
+            }, 500
+
+    async def degree_audit(self, scope: Dict[str, Any], headers: Headers) -> Tuple[Any, int]:
+        """GET /api/degree-audit (see api/degree_audit.py)."""
+        try:
+            result = await self.audit_service.check_degree_completion(scope['student'], scope['student_complete'])
+            return result, 200
+
+        except ValueError as e:
+            return {'error': str(e), 'message': str(e)}, 404
+
+        except Exception as e:
+            self.flask_app.logger.error(f"Error checking degree completion: {str(e)}")
+            return {
+                'error': 'Server error',
+                'message': f'An error occurred while checking degree completion'
+            }, 500
+
+    async def student_info(self, scope: Dict[str, Any], headers: Headers) -> Tuple[Any, int]:
+        """GET /api/students (see api/students.py)."""
+        try:
+            result = await self.audit_service.get_student_info(scope['student'], scope['student_complete'])
+            return result, 200
+
+        except ValueError as e:
+            return {'error': str(e)}, 404
+
+        except Exception as e:
+            self.flask_app.logger.error(f"Error retrieving student info: {str(e)}")
+            return {'error': f'Server error: {str(e)}'}, 500
+
+    async def _send_json(self, send, headers: Headers, body: Any, status: int) -> None:
+        """Encode a JSON response with the Flask JSON provider, compress it if accepted, and send it."""
+        flask_app = self.flask_app
+        encoded = flask_app.json.response(body)
+        data, mimetype = encoded.get_data(), encoded.mimetype
+
+        response_headers: List[Tuple[bytes, bytes]] = [
+            (b'content-type', mimetype.encode('latin-1')),
+            (b'access-control-allow-origin', b'*'),
+            (b'access-control-allow-headers', b'Content-Type,Authorization,X-Student-NetID'),
+            (b'access-control-allow-methods', b'GET,PUT,PATCH,POST,DELETE,OPTIONS')
+        ]
+
+        if flask_app.config['COMPRESSION_ENABLED'] and mimetype in COMPRESSIBLE_MIMETYPES:
+            response_headers.append((b'vary', b'Accept-Encoding'))
+
+            if status == 200 and len(data) >= flask_app.config['COMPRESSION_MIN_SIZE']:
+                with flask_app.app_context():
+                    encoding = negotiate_encoding(parse_accept_header(headers.get('Accept-Encoding')))
+                    if encoding:
+                        data = compress(data, encoding)
+                        response_headers.append((b'content-encoding', encoding.encode('latin-1')))
+
+        response_headers.append((b'content-length', str(len(data)).encode('latin-1')))
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': response_headers})
+        await send({'type': 'http.response.body', 'body': data})
+
+
+app = AsyncDegreeAuditApp(create_app())
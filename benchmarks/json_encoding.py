@@ -0,0 +1,140 @@
+"""
+Compare Flask's default JSON provider with FastJSONProvider.
+
+Encodes payloads shaped like the API's largest responses (a subject's course
+list, student info with embedded enrollments and plans, and a degree audit)
+and reports the time per response for each provider.
+
+Usage:
+    python benchmarks/json_encoding.py [--courses N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import date
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_provider import FastJSONProvider, orjson  # noqa: E402
+
+
+DESCRIPTION = (
+    "An introduction to the theory and practice of the discipline, covering its "
+    "central methods, classic results and open questions. Weekly problem sets and "
+    "a final project. Enrollment limited; preference to majors. "
+) * 3
+
+
+def make_course(course_id):
+    """Build a course row as returned by the courses table."""
+    return {
+        'course_id': course_id,
+        'subject_code': ('CPSC', 'MATH', 'ENGL', 'HIST', 'ECON')[course_id % 5],
+        'course_number': str(100 + course_id % 400),
+        'course_title': f"Topics in Subject {course_id}",
+        'description': DESCRIPTION,
+        'credits': Decimal('1.0'),
+        'distribution': ('QR', 'Hu', 'So', 'Sc', 'WR, Hu')[course_id % 5]
+    }
+
+
+def make_payloads(course_count):
+    """Build the benchmark payloads."""
+    courses = [make_course(course_id) for course_id in range(1, course_count + 1)]
+
+    student_info = {
+        'student': {'student_id': 1001, 'net_id': 'abc123', 'class_year': 2027, 'logged': True},
+        'majors': [{
+            'major_version_id': 1,
+            'declaration_date': date(2024, 9, 1),
+            'majorversions': {'majors': {'major_name': 'Computer Science', 'major_code': 'CPSC'}}
+        }],
+        'enrollments': [
+            {
+                'enrollment_id': i,
+                'student_id': 1001,
+                'course_id': course['course_id'],
+                'term_taken': f"Fall {2023 + i % 4}",
+                'grade': 'A-',
+                'status': 'Completed',
+                'course': course
+            }
+            for i, course in enumerate(courses[:40])
+        ],
+        'plans': [
+            {'plan_id': i, 'course_id': course['course_id'], 'intended_term': 'Spring 2027', 'course': course}
+            for i, course in enumerate(courses[40:60])
+        ]
+    }
+
+    audit = {
+        'status': 'Not Completed',
+        'major_requirements': {
+            'status': 'Not Completed',
+            'unfulfilled_requirements': [
+                {
+                    'major': 'Computer Science',
+                    'requirement_name': f"Requirement {r}",
+                    'groups': [
+                        {
+                            'group_name': f"Group {g}",
+                            'courses_completed': 1,
+                            'courses_required': 3,
+                            'courses_remaining': 2,
+                            'completed_courses': [f"{c['subject_code']} {c['course_number']}: {c['course_title']}" for c in courses[:2]],
+                            'available_courses': [f"{c['subject_code']} {c['course_number']}: {c['course_title']}" for c in courses[:60]]
+                        }
+                        for g in range(4)
+                    ]
+                }
+                for r in range(5)
+            ]
+        }
+    }
+
+    return {
+        'course list': courses,
+        'student info': student_info,
+        'degree audit': audit
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--courses', type=int, default=2000, help='Courses in the course list payload')
+    parser.add_argument('--repeat', type=int, default=50, help='Encodings per measurement')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    providers = {
+        'default': DefaultJSONProvider(app),
+        'fast': FastJSONProvider(app)
+    }
+
+    print(f"orjson: {'installed' if orjson is not None else 'not installed (stdlib fallback)'}")
+
+    with app.app_context():
+        for name, payload in make_payloads(args.courses).items():
+            # The default provider writes Decimals as strings, so compare sizes only
+            timings = {}
+            for provider_name, provider in providers.items():
+                body = provider.response(payload).get_data()
+                seconds = min(timeit.repeat(lambda: provider.response(payload), number=args.repeat, repeat=3))
+                timings[provider_name] = (seconds / args.repeat * 1000, len(body))
+
+            default_ms, default_size = timings['default']
+            fast_ms, fast_size = timings['fast']
+            print(
+                f"{name:>13}: default {default_ms:8.3f} ms ({default_size} B)  "
+                f"fast {fast_ms:8.3f} ms ({fast_size} B)  speedup {default_ms / fast_ms:5.1f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
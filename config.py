@@ -7,6 +7,9 @@ from dotenv import load_dotenv
 if os.environ.get('FLASK_ENV') != 'production':
     load_dotenv()
 
+# Fallback SECRET_KEY for local development; refused wherever the key protects anything
+DEFAULT_SECRET_KEY = "dev-key-not-for-production"
+
 class Config:
     """Base configuration class."""
     
@@ -17,22 +20,67 @@ class Config:
     # Flask configuration
     DEBUG = False
     TESTING = False
-    SECRET_KEY = os.environ.get("SECRET_KEY", "dev-key-not-for-production")
+    SECRET_KEY = os.environ.get("SECRET_KEY", DEFAULT_SECRET_KEY)
+    
+    # Whether a secure SECRET_KEY is required even without session tokens
+    REQUIRE_SECRET_KEY = False
     
     # API configuration
     PORT = int(os.environ.get("PORT", "5000"))
     
-    @staticmethod
-    def validate():
+    # Authentication cache (seconds a NetID lookup is reused; 0 disables the cache)
+    AUTH_CACHE_TTL = float(os.environ.get("AUTH_CACHE_TTL", "30"))
+    AUTH_CACHE_NEGATIVE_TTL = float(os.environ.get("AUTH_CACHE_NEGATIVE_TTL", "5"))
+    
+    # Stateless session tokens signed with SECRET_KEY (issued by POST /api/auth/token)
+    SESSION_TOKENS_ENABLED = os.environ.get("SESSION_TOKENS_ENABLED", "false").lower() == "true"
+    SESSION_TOKEN_TTL = int(os.environ.get("SESSION_TOKEN_TTL", "900"))
+    
+    # Course catalog cache (seconds before the in-memory snapshot is reloaded)
+    CATALOG_REFRESH_SECONDS = int(os.environ.get("CATALOG_REFRESH_SECONDS", "3600"))
+    
+    # Version of the reference data (majors, requirements, distributions); bump it after
+    # re-importing so catalog ETags and cached responses change
+    CATALOG_VERSION = os.environ.get("CATALOG_VERSION", "1")
+    
+    # Encoded responses of catalog endpoints kept in memory (0 disables the cache)
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+    RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    
+    # Response compression negotiated through Accept-Encoding (brotli only if installed)
+    COMPRESSION_ENABLED = os.environ.get("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_LEVEL = int(os.environ.get("COMPRESSION_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", "5"))
+    
+    # Rows fetched per round trip by the NDJSON export endpoints
+    EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", "1000"))
+    
+    # Rows written per upsert request by the transcript import
+    IMPORT_BATCH_SIZE = int(os.environ.get("IMPORT_BATCH_SIZE", "500"))
+    
+    # Optional file for sharing the serialized full-text search index between workers
+    SEARCH_INDEX_PATH = os.environ.get("SEARCH_INDEX_PATH")
+    
+    # Course search backend: 'memory', 'database' (see migration/course_search.sql) or 'sqlite'
+    COURSE_SEARCH_BACKEND = os.environ.get("COURSE_SEARCH_BACKEND", "memory")
+    
+    @classmethod
+    def validate(cls):
         """Validate that all required configuration values are present."""
         missing_vars = []
-        if not Config.SUPABASE_URL:
+        if not cls.SUPABASE_URL:
             missing_vars.append("SUPABASE_URL")
-        if not Config.SUPABASE_KEY:
+        if not cls.SUPABASE_KEY:
             missing_vars.append("SUPABASE_KEY")
         
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+        
+        # Anyone knowing the default key could forge session tokens for any student
+        if (cls.SESSION_TOKENS_ENABLED or cls.REQUIRE_SECRET_KEY) \
+                and (not cls.SECRET_KEY or cls.SECRET_KEY == DEFAULT_SECRET_KEY):
+            raise ValueError("A secure SECRET_KEY is required in production and when SESSION_TOKENS_ENABLED is set")
 
 
 class DevelopmentConfig(Config):
@@ -50,10 +98,7 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     TESTING = False
-    
-    def __init__(self):
-        if not self.SECRET_KEY or self.SECRET_KEY == "dev-key-not-for-production":
-            raise ValueError("Production environment requires a secure SECRET_KEY")
+    REQUIRE_SECRET_KEY = True
 
 
 # Dictionary of available configurations
@@ -0,0 +1,76 @@
+-- Course search pushdown (used when COURSE_SEARCH_BACKEND=database)
+-- Run after mock_database_init.sql. Safe to re-run.
+-- Columns are cast explicitly so the functions match their declared result types.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1. Full-text search vector: code and title rank above the description
+ALTER TABLE Courses ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(subject_code, '') || ' ' || coalesce(course_number, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(course_title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS courses_search_vector_idx ON Courses USING GIN (search_vector);
+
+-- 2. Trigram indexes for typo-tolerant matching on "SUBJ NUM" codes and titles
+CREATE INDEX IF NOT EXISTS courses_code_trgm_idx
+    ON Courses USING GIN ((lower(subject_code || ' ' || course_number)) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS courses_title_trgm_idx
+    ON Courses USING GIN (lower(course_title) gin_trgm_ops);
+
+-- 3. Ranked full-text search, called through PostgREST as rpc('search_courses')
+-- Terms are OR-ed (like the in-memory BM25 index) and ranked with ts_rank_cd.
+CREATE OR REPLACE FUNCTION search_courses(search_query TEXT, max_results INTEGER DEFAULT 10)
+RETURNS TABLE (
+    course_id INTEGER,
+    subject_code VARCHAR,
+    course_number VARCHAR,
+    course_title VARCHAR,
+    description TEXT,
+    credits NUMERIC,
+    distribution VARCHAR,
+    score REAL
+)
+LANGUAGE sql STABLE AS $$
+    WITH query AS (
+        SELECT nullif(replace(plainto_tsquery('english', search_query)::text, '&', '|'), '')::tsquery AS tsq
+    )
+    SELECT c.course_id::INTEGER, c.subject_code::VARCHAR, c.course_number::VARCHAR,
+           c.course_title::VARCHAR, c.description::TEXT, c.credits::NUMERIC, c.distribution::VARCHAR,
+           ts_rank_cd(c.search_vector, query.tsq)::REAL AS score
+    FROM Courses c, query
+    WHERE query.tsq IS NOT NULL AND c.search_vector @@ query.tsq
+    ORDER BY score DESC, c.course_id
+    LIMIT greatest(1, least(max_results, 100));
+$$;
+
+-- 4. Typo-tolerant search, called through PostgREST as rpc('search_courses_fuzzy')
+CREATE OR REPLACE FUNCTION search_courses_fuzzy(search_query TEXT, max_results INTEGER DEFAULT 10)
+RETURNS TABLE (
+    course_id INTEGER,
+    subject_code VARCHAR,
+    course_number VARCHAR,
+    course_title VARCHAR,
+    description TEXT,
+    credits NUMERIC,
+    distribution VARCHAR,
+    score REAL
+)
+LANGUAGE sql STABLE AS $$
+    SELECT c.course_id::INTEGER, c.subject_code::VARCHAR, c.course_number::VARCHAR,
+           c.course_title::VARCHAR, c.description::TEXT, c.credits::NUMERIC, c.distribution::VARCHAR,
+           greatest(
+               similarity(lower(c.subject_code || ' ' || c.course_number), lower(search_query)),
+               word_similarity(lower(search_query), lower(c.course_title))
+           )::REAL AS score
+    FROM Courses c
+    WHERE lower(c.subject_code || ' ' || c.course_number) % lower(search_query)
+       OR lower(search_query) <% lower(c.course_title)
+    ORDER BY score DESC, c.course_id
+    LIMIT greatest(1, least(max_results, 100));
+$$;
+
+GRANT EXECUTE ON FUNCTION search_courses(TEXT, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION search_courses_fuzzy(TEXT, INTEGER) TO anon, authenticated;
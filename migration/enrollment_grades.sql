@@ -0,0 +1,23 @@
+-- Batch grade and status changes (used by PATCH /api/student-courses/batch/enrollments)
+-- Run after mock_database_init.sql. Safe to re-run.
+
+-- Applies every change in one UPDATE statement, called through PostgREST as
+-- rpc('apply_enrollment_grade_changes'). p_changes is a JSON array of objects
+-- with enrollment_id and the grade and/or status to set; only the keys present
+-- are written. Rows are matched by enrollment_id and the student, so changes to
+-- enrollments that do not exist (or belong to another student) match nothing
+-- and never create a row. Returns the updated enrollments.
+CREATE OR REPLACE FUNCTION apply_enrollment_grade_changes(
+    p_student_id INTEGER,
+    p_changes JSONB
+)
+RETURNS SETOF StudentCourseEnrollments
+LANGUAGE sql AS $$
+    UPDATE StudentCourseEnrollments e SET
+        grade = CASE WHEN c.change ? 'grade' THEN c.change->>'grade' ELSE e.grade END,
+        status = CASE WHEN c.change ? 'status' THEN c.change->>'status' ELSE e.status END
+    FROM jsonb_array_elements(coalesce(p_changes, '[]'::JSONB)) AS c(change)
+    WHERE e.student_id = p_student_id
+      AND e.enrollment_id = (c.change->>'enrollment_id')::INTEGER
+    RETURNING e.*;
+$$;
@@ -0,0 +1,67 @@
+-- Atomic batch of course plan operations (used by POST /api/student-courses/batch/plans)
+-- Run after mock_database_init.sql. Safe to re-run.
+
+-- Applies deletes, then updates, then creates in one transaction, called through
+-- PostgREST as rpc('apply_course_plan_operations'). Every statement is scoped to
+-- the student. Updates only set the columns present in each update object, and
+-- never recreate a row. If any plan to update no longer exists (deleted by a
+-- concurrent request), the function raises P0002 with the plan_id as DETAIL and
+-- nothing is written.
+CREATE OR REPLACE FUNCTION apply_course_plan_operations(
+    p_student_id INTEGER,
+    p_deletes INTEGER[],
+    p_updates JSONB,
+    p_creates JSONB
+)
+RETURNS JSONB
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_deleted INTEGER;
+    v_update JSONB;
+    v_row StudentCoursePlans%ROWTYPE;
+    v_updated JSONB := '[]'::JSONB;
+    v_created JSONB;
+BEGIN
+    -- 1. Deletes (plans already gone are simply not counted)
+    DELETE FROM StudentCoursePlans
+    WHERE student_id = p_student_id
+      AND plan_id = ANY(coalesce(p_deletes, '{}'));
+    GET DIAGNOSTICS v_deleted = ROW_COUNT;
+
+    -- 2. Updates of the given columns only
+    FOR v_update IN SELECT * FROM jsonb_array_elements(coalesce(p_updates, '[]'::JSONB)) LOOP
+        UPDATE StudentCoursePlans SET
+            intended_term = CASE WHEN v_update ? 'intended_term'
+                                 THEN v_update->>'intended_term' ELSE intended_term END,
+            priority = CASE WHEN v_update ? 'priority'
+                            THEN (v_update->>'priority')::INTEGER ELSE priority END,
+            notes = CASE WHEN v_update ? 'notes'
+                         THEN v_update->>'notes' ELSE notes END
+        WHERE student_id = p_student_id
+          AND plan_id = (v_update->>'plan_id')::INTEGER
+        RETURNING * INTO v_row;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'No course plan found with ID % for this student', v_update->>'plan_id'
+                USING ERRCODE = 'P0002', DETAIL = v_update->>'plan_id';
+        END IF;
+
+        v_updated := v_updated || jsonb_build_array(to_jsonb(v_row));
+    END LOOP;
+
+    -- 3. Creates
+    WITH created AS (
+        INSERT INTO StudentCoursePlans (student_id, course_id, intended_term, priority, notes)
+        SELECT p_student_id,
+               (item->>'course_id')::INTEGER,
+               item->>'intended_term',
+               (item->>'priority')::INTEGER,
+               item->>'notes'
+        FROM jsonb_array_elements(coalesce(p_creates, '[]'::JSONB)) AS item
+        RETURNING *
+    )
+    SELECT coalesce(jsonb_agg(to_jsonb(created)), '[]'::JSONB) INTO v_created FROM created;
+
+    RETURN jsonb_build_object('deleted', v_deleted, 'updated', v_updated, 'created', v_created);
+END;
+$$;
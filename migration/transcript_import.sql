@@ -0,0 +1,22 @@
+-- Natural key for student course enrollments (used by the transcript import upsert)
+-- Run after mock_database_init.sql. Safe to re-run.
+
+-- 1. Drop duplicate enrollments left by replayed imports, keeping the oldest row
+DELETE FROM StudentCourseEnrollments e
+USING StudentCourseEnrollments d
+WHERE e.student_id = d.student_id
+  AND e.course_id = d.course_id
+  AND e.term_taken = d.term_taken
+  AND e.enrollment_id > d.enrollment_id;
+
+-- 2. One enrollment per student, course and term
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'studentcourseenrollments_student_course_term_key'
+    ) THEN
+        ALTER TABLE StudentCourseEnrollments
+            ADD CONSTRAINT studentcourseenrollments_student_course_term_key
+            UNIQUE (student_id, course_id, term_taken);
+    END IF;
+END $$;
@@ -5,3 +5,4 @@ from .student_repository import StudentRepository
 from .major_repository import MajorRepository
 from .course_repository import CourseRepository
 from .distribution_repository import DistributionRepository
+from .sqlite_search_repository import SqliteCourseSearchRepository
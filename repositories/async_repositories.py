@@ -0,0 +1,242 @@
+"""Async repositories on the Supabase AsyncClient, used by the ASGI serving mode."""
+
+from typing import Dict, List, Any, Iterable, Optional
+from supabase import AsyncClient
+
+
+class AsyncBaseRepository:
+    """Base class for async repositories with common read operations."""
+
+    def __init__(self, supabase_client: AsyncClient, table_name: str):
+        """
+        Initialize the repository with an async Supabase client and table name.
+
+        Args:
+            supabase_client: The async Supabase client
+            table_name: The name of the database table
+        """
+        self.supabase = supabase_client
+        self.table_name = table_name
+
+    async def get_by_id(self, id_value: int, id_column: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a record by its ID.
+
+        Args:
+            id_value: The ID value to look up
+            id_column: The name of the ID column (defaults to table_name + '_id')
+
+        Returns:
+            Dictionary representing the record, or None if not found
+        """
+        if id_column is None:
+            id_column = f"{self.table_name.rstrip('s')}_id"
+
+        response = await self.supabase.table(self.table_name).select('*').eq(id_column, id_value).execute()
+
+        if response.data:
+            return response.data[0]
+        return None
+
+    async def get_in(self, table_name: str, column: str, values: Iterable[Any],
+                     columns: str = '*') -> List[Dict[str, Any]]:
+        """
+        Get the rows of a table whose column is one of the given values.
+
+        Args:
+            table_name: The table to query
+            column: The column to filter on
+            values: The accepted values
+            columns: Columns to select (a PostgREST select clause)
+
+        Returns:
+            List of dictionaries representing the matching rows (no query is
+            made for an empty list of values)
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return []
+
+        response = await self.supabase.table(table_name)\
+            .select(columns)\
+            .in_(column, values)\
+            .execute()
+
+        return response.data if response.data else []
+
+
+class AsyncStudentRepository(AsyncBaseRepository):
+    """Async repository for student-related reads."""
+
+    def __init__(self, supabase_client: AsyncClient):
+        """Initialize with the async Supabase client."""
+        super().__init__(supabase_client, 'students')
+
+    async def get_by_net_id(self, net_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a student by NetID.
+
+        Args:
+            net_id: The student's NetID
+
+        Returns:
+            Dictionary representing the student, or None if not found
+        """
+        response = await self.supabase.table(self.table_name).select('*').eq('net_id', net_id).execute()
+
+        if response.data:
+            return response.data[0]
+        return None
+
+    async def get_logged_in(self, net_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a student by NetID if they are logged in.
+
+        Args:
+            net_id: The student's NetID
+
+        Returns:
+            Dictionary representing the student, or None if not found or not logged in
+        """
+        response = await self.supabase.table(self.table_name)\
+            .select('*')\
+            .eq('net_id', net_id)\
+            .eq('logged', True)\
+            .execute()
+
+        if response.data:
+            return response.data[0]
+        return None
+
+    async def get_declared_majors(self, student_id: int) -> List[Dict[str, Any]]:
+        """
+        Get a student's declared majors with their major versions.
+
+        Args:
+            student_id: The student's ID
+
+        Returns:
+            List of dictionaries representing the student's majors
+        """
+        response = await self.supabase.table('studentmajors')\
+            .select('*, majorversions(*, majors(*))')\
+            .eq('student_id', student_id)\
+            .execute()
+
+        return response.data if response.data else []
+
+    async def get_course_enrollments(self, student_id: int, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get a student's course enrollments, optionally filtered by status.
+
+        Args:
+            student_id: The student's ID
+            status: Optional enrollment status to filter by
+
+        Returns:
+            List of dictionaries representing the student's enrollments
+        """
+        query = self.supabase.table('studentcourseenrollments')\
+            .select('*')\
+            .eq('student_id', student_id)
+
+        if status:
+            query = query.eq('status', status)
+
+        response = await query.execute()
+        return response.data if response.data else []
+
+    async def get_course_plans(self, student_id: int) -> List[Dict[str, Any]]:
+        """
+        Get a student's course plans.
+
+        Args:
+            student_id: The student's ID
+
+        Returns:
+            List of dictionaries representing the student's course plans
+        """
+        response = await self.supabase.table('studentcourseplans')\
+            .select('*')\
+            .eq('student_id', student_id)\
+            .execute()
+
+        return response.data if response.data else []
+
+
+class AsyncMajorRepository(AsyncBaseRepository):
+    """Async repository for major requirement reads, batched across majors."""
+
+    def __init__(self, supabase_client: AsyncClient):
+        """Initialize with the async Supabase client."""
+        super().__init__(supabase_client, 'majors')
+
+    async def get_requirements_for_versions(self, major_version_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get the requirements of several major versions in one query.
+
+        Args:
+            major_version_ids: The major versions' IDs
+
+        Returns:
+            List of dictionaries representing the major requirements
+        """
+        return await self.get_in('majorrequirements', 'major_version_id', major_version_ids)
+
+    async def get_requirement_rules_for_versions(self, major_version_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get the requirement rules of several major versions in one query.
+
+        Args:
+            major_version_ids: The major versions' IDs
+
+        Returns:
+            List of dictionaries representing the requirement rules
+        """
+        return await self.get_in('requirementrules', 'major_version_id', major_version_ids)
+
+    async def get_requirement_groups_for(self, requirement_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get the groups of several requirements in one query.
+
+        Args:
+            requirement_ids: The requirements' IDs
+
+        Returns:
+            List of dictionaries representing the requirement groups
+        """
+        return await self.get_in('requirementgroups', 'requirement_id', requirement_ids)
+
+
+class AsyncCourseRepository(AsyncBaseRepository):
+    """Async repository for course reads."""
+
+    def __init__(self, supabase_client: AsyncClient):
+        """Initialize with the async Supabase client."""
+        super().__init__(supabase_client, 'courses')
+
+    async def get_by_ids(self, course_ids: Iterable[int],
+                         columns: str = 'course_id, subject_code, course_number, course_title') -> List[Dict[str, Any]]:
+        """
+        Get multiple courses by their IDs in one query.
+
+        Args:
+            course_ids: The course IDs
+            columns: Columns to select (a PostgREST select clause, '*' for all)
+
+        Returns:
+            List of dictionaries representing the courses
+        """
+        return await self.get_in(self.table_name, 'course_id', course_ids, columns)
+
+    async def get_group_courses_for(self, requirement_group_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """
+        Get the courses of several requirement groups in one query.
+
+        Args:
+            requirement_group_ids: The requirement groups' IDs
+
+        Returns:
+            List of dictionaries mapping requirement groups to course IDs
+        """
+        return await self.get_in('requirementgroupcourses', 'requirement_group_id', requirement_group_ids)
@@ -1,6 +1,6 @@
 """Base repository class with common database operations."""
 
-from typing import Dict, List, Any, Optional, TypeVar, Generic, Type
+from typing import Dict, List, Any, Iterator, Optional, Sequence, TypeVar, Generic, Type
 from supabase import Client
 
 T = TypeVar('T')
@@ -49,17 +49,18 @@ class BaseRepository(Generic[T]):
             return response.data[0]
         return None
     
-    def filter_by(self, **kwargs) -> List[Dict[str, Any]]:
+    def filter_by(self, columns: str = '*', **kwargs) -> List[Dict[str, Any]]:
         """
         Filter records by the given criteria.
         
         Args:
+            columns: Columns to select (a PostgREST select clause)
             **kwargs: Column-value pairs to filter by
             
         Returns:
             List of dictionaries representing the filtered records
         """
-        query = self.supabase.table(self.table_name).select('*')
+        query = self.supabase.table(self.table_name).select(columns)
         
         for column, value in kwargs.items():
             query = query.eq(column, value)
@@ -121,3 +122,35 @@ class BaseRepository(Generic[T]):
         response = self.supabase.table(self.table_name).delete().eq(id_column, id_value).execute()
         
         return bool(response.data)
+    
+    def iter_rows(self, order_by: Sequence[str], columns: str = '*', batch_size: int = 1000,
+                  table_name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all records of a table, fetching them in ranges.
+        
+        Only one batch is held in memory at a time and no count query is made.
+        The offset advances by the number of rows actually returned, so a
+        server-side row limit below `batch_size` does not end the scan early.
+        
+        Args:
+            order_by: Columns giving a stable, unique order (e.g. the primary key)
+            columns: Columns to select (a PostgREST select clause)
+            batch_size: Number of records requested per round trip
+            table_name: Table to read (defaults to this repository's table)
+            
+        Yields:
+            Dict[str, Any]: Each record, in order
+        """
+        start = 0
+        while True:
+            query = self.supabase.table(table_name or self.table_name).select(columns)
+            for column in order_by:
+                query = query.order(column)
+            
+            response = query.range(start, start + batch_size - 1).execute()
+            rows = response.data or []
+            if not rows:
+                return
+            
+            yield from rows
+            start += len(rows)
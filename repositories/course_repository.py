@@ -1,6 +1,6 @@
 """Repository for course-related database operations."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from supabase import Client
 
 from .base import BaseRepository
@@ -62,12 +62,14 @@ class CourseRepository(BaseRepository[Course]):
             'courses': response.data if response.data else []
         }
     
-    def get_by_ids(self, course_ids: List[int]) -> List[Dict[str, Any]]:
+    def get_by_ids(self, course_ids: List[int],
+                   columns: str = 'course_id, subject_code, course_number, course_title') -> List[Dict[str, Any]]:
         """
         Get courses by list of IDs.
         
         Args:
             course_ids: List of course IDs
+            columns: Columns to select (a PostgREST select clause, '*' for all)
             
         Returns:
             List of dictionaries representing the courses
@@ -76,12 +78,84 @@ class CourseRepository(BaseRepository[Course]):
             return []
             
         response = self.supabase.table(self.table_name)\
-            .select('course_id, subject_code, course_number, course_title')\
+            .select(columns)\
             .in_('course_id', course_ids)\
             .execute()
             
         return response.data if response.data else []
     
+    def search_substring(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search courses by case-insensitive substring of title, subject code, or course number.
+        
+        A "SUBJ NUM" query (e.g. "CPSC 36") is matched against subject code and course
+        number prefixes together.
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of dictionaries representing the matching courses
+        """
+        # Characters with a meaning in PostgREST filter syntax cannot appear in the pattern
+        pattern = ''.join(char for char in query if char not in ',()*%"\\').strip()
+        if not pattern:
+            return []
+        
+        query_builder = self.supabase.table(self.table_name).select('*')
+        
+        parts = pattern.split()
+        if len(parts) == 2 and parts[0].isalpha() and parts[1][:1].isdigit():
+            query_builder = query_builder\
+                .ilike('subject_code', f"{parts[0]}%")\
+                .ilike('course_number', f"{parts[1]}%")
+        else:
+            query_builder = query_builder.or_(
+                f"course_title.ilike.*{pattern}*,"
+                f"subject_code.ilike.*{pattern}*,"
+                f"course_number.ilike.*{pattern}*"
+            )
+        
+        response = query_builder.order('course_id').limit(limit).execute()
+        return response.data if response.data else []
+    
+    def search_full_text(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank courses with the database's full-text index (see migration/course_search.sql).
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of course dictionaries with a 'score' key, best match first
+        """
+        response = self.supabase.rpc('search_courses', {
+            'search_query': query,
+            'max_results': limit
+        }).execute()
+        
+        return response.data if response.data else []
+    
+    def search_fuzzy(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank courses by trigram similarity in the database (see migration/course_search.sql).
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of course dictionaries with a 'score' key, best match first
+        """
+        response = self.supabase.rpc('search_courses_fuzzy', {
+            'search_query': query,
+            'max_results': limit
+        }).execute()
+        
+        return response.data if response.data else []
+    
     def get_prerequisites(self, course_id: int) -> List[Dict[str, Any]]:
         """
         Get all prerequisites for a course.
@@ -99,6 +173,24 @@ class CourseRepository(BaseRepository[Course]):
             
         return response.data if response.data else []
     
+    def iter_prerequisites(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all prerequisite relationships.
+        
+        Args:
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Dict[str, Any]: Each courseprerequisites row (course_id,
+            prereq_course_id, concurrency_allowed)
+        """
+        return self.iter_rows(
+            ('course_id', 'prereq_course_id'),
+            columns='course_id, prereq_course_id, concurrency_allowed',
+            batch_size=batch_size,
+            table_name='courseprerequisites'
+        )
+    
     def get_group_courses(self, requirement_group_id: int) -> List[Dict[str, Any]]:
         """
         Get all courses for a requirement group.
@@ -116,6 +208,22 @@ class CourseRepository(BaseRepository[Course]):
             
         return response.data if response.data else []
     
+    def iter_group_courses(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all requirement group to course mappings.
+        
+        Args:
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            Dict[str, Any]: Each requirementgroupcourses row
+        """
+        return self.iter_rows(
+            ('requirement_group_id', 'course_id'),
+            batch_size=batch_size,
+            table_name='requirementgroupcourses'
+        )
+    
     def get_equivalent_courses(self, course_id: int) -> List[Dict[str, Any]]:
         """
         Get all equivalent courses for a given course.
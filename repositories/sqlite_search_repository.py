@@ -0,0 +1,85 @@
+"""In-process SQLite FTS5 stand-in for the database course search functions."""
+
+import re
+import sqlite3
+import threading
+from typing import List, Dict, Any
+
+
+class SqliteCourseSearchRepository:
+    """
+    Local equivalent of the search_courses RPC in migration/course_search.sql.
+
+    Courses are copied into an in-memory SQLite FTS5 table so the database search
+    path can be exercised and benchmarked without a PostgreSQL instance. Like the
+    RPC, query terms are OR-ed and code/title matches outrank description matches.
+    """
+
+    # bm25() column weights for (code, title, description)
+    COLUMN_WEIGHTS = (2.0, 2.0, 1.0)
+
+    _TERM_RE = re.compile(r'[A-Za-z0-9]+')
+
+    def __init__(self, courses: List[Dict[str, Any]]):
+        """
+        Initialize the search table from a list of courses.
+
+        Args:
+            courses: Course rows (e.g. the cached catalog)
+        """
+        self._lock = threading.Lock()
+        self._courses_by_id = {course['course_id']: course for course in courses}
+
+        self._connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self._connection.execute(
+            "CREATE VIRTUAL TABLE course_fts USING fts5("
+            "code, title, description, tokenize = 'porter unicode61')"
+        )
+        self._connection.executemany(
+            "INSERT INTO course_fts (rowid, code, title, description) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    course['course_id'],
+                    f"{course.get('subject_code', '')} {course.get('course_number', '')}",
+                    course.get('course_title') or '',
+                    course.get('description') or ''
+                )
+                for course in courses
+            ]
+        )
+        self._connection.commit()
+
+    def search_full_text(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Rank courses with the FTS5 index.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+
+        Returns:
+            List of course dictionaries with a 'score' key, best match first
+        """
+        terms = self._TERM_RE.findall(query)
+        if not terms:
+            return []
+
+        match_expression = ' OR '.join(f'"{term}"' for term in terms)
+        weights = ', '.join(str(weight) for weight in self.COLUMN_WEIGHTS)
+
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT rowid, -bm25(course_fts, {weights}) AS score FROM course_fts "
+                "WHERE course_fts MATCH ? ORDER BY score DESC, rowid LIMIT ?",
+                (match_expression, max(1, min(limit, 100)))
+            ).fetchall()
+
+        results = []
+        for course_id, score in rows:
+            course = self._courses_by_id.get(course_id)
+            if course:
+                result = course.copy()
+                result['score'] = round(score, 4)
+                results.append(result)
+
+        return results
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Any, Optional
 from supabase import Client
+from postgrest.exceptions import APIError
 
 from .base import BaseRepository
 from models.student import Student
@@ -30,6 +31,46 @@ class StudentRepository(BaseRepository[Student]):
             return response.data[0]
         return None
     
+    def get_logged_in(self, net_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a student by NetID if they are logged in.
+        
+        Args:
+            net_id: The student's NetID
+            
+        Returns:
+            Dictionary representing the student, or None if not found or not logged in
+        """
+        response = self.supabase.table(self.table_name)\
+            .select('*')\
+            .eq('net_id', net_id)\
+            .eq('logged', True)\
+            .execute()
+        
+        if response.data:
+            return response.data[0]
+        return None
+    
+    def set_logged(self, net_id: str, logged: bool) -> Optional[Dict[str, Any]]:
+        """
+        Set the `logged` flag of a student.
+        
+        Args:
+            net_id: The student's NetID
+            logged: Whether the student is logged in
+            
+        Returns:
+            Dictionary representing the updated student, or None if not found
+        """
+        response = self.supabase.table(self.table_name)\
+            .update({'logged': logged})\
+            .eq('net_id', net_id)\
+            .execute()
+        
+        if response.data:
+            return response.data[0]
+        return None
+    
     def get_declared_majors(self, student_id: int) -> List[Dict[str, Any]]:
         """
         Get all majors declared by a student.
@@ -107,3 +148,107 @@ class StudentRepository(BaseRepository[Student]):
             .execute()
             
         return response.data if response.data else []
+    
+    def upsert_enrollments(self, enrollments: List[Dict[str, Any]], chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """
+        Insert or update enrollments on their natural key (student, course, term).
+        
+        Requires the unique constraint from migration/transcript_import.sql.
+        
+        Args:
+            enrollments: Enrollment rows with student_id, course_id and term_taken
+            chunk_size: Maximum number of rows written per request
+            
+        Returns:
+            List of dictionaries representing the written enrollments
+        """
+        written = []
+        for start in range(0, len(enrollments), chunk_size):
+            response = self.supabase.table('studentcourseenrollments')\
+                .upsert(enrollments[start:start + chunk_size], on_conflict='student_id,course_id,term_taken')\
+                .execute()
+            written.extend(response.data or [])
+        
+        return written
+    
+    def apply_course_plan_operations(self, student_id: int, deletes: List[int],
+                                     updates: List[Dict[str, Any]],
+                                     creates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply course plan deletes, updates and creates in one transaction
+        (see migration/plan_operations.sql).
+        
+        Args:
+            student_id: The student's ID
+            deletes: IDs of the plans to delete
+            updates: Dictionaries with 'plan_id' and only the fields to change
+            creates: Course plans to create (course_id, intended_term, priority, notes)
+            
+        Returns:
+            Dictionary with the 'deleted' count and the 'updated' and 'created' plans
+            
+        Raises:
+            LookupError: If a plan to update no longer belongs to the student
+                (its plan_id is the error's argument); nothing is written
+        """
+        try:
+            response = self.supabase.rpc('apply_course_plan_operations', {
+                'p_student_id': student_id,
+                'p_deletes': deletes,
+                'p_updates': updates,
+                'p_creates': creates
+            }).execute()
+        except APIError as e:
+            if e.code == 'P0002' and e.details and e.details.isdigit():
+                raise LookupError(int(e.details)) from e
+            raise
+        
+        return response.data or {'deleted': 0, 'updated': [], 'created': []}
+    
+    def get_enrollments_by_ids(self, student_id: int, enrollment_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get several enrollments of a student by their IDs.
+        
+        Args:
+            student_id: The student's ID
+            enrollment_ids: IDs of the enrollments to get
+            
+        Returns:
+            List of dictionaries representing the enrollments that exist and
+            belong to the student
+        """
+        if not enrollment_ids:
+            return []
+        
+        response = self.supabase.table('studentcourseenrollments')\
+            .select('*')\
+            .eq('student_id', student_id)\
+            .in_('enrollment_id', enrollment_ids)\
+            .execute()
+        return response.data if response.data else []
+    
+    def apply_enrollment_grade_changes(self, student_id: int,
+                                       changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Set the grade and/or status of several enrollments of a student in one
+        statement (see migration/enrollment_grades.sql).
+        
+        Only the given columns are written, and only rows that still exist and
+        belong to the student are matched.
+        
+        Args:
+            student_id: The student's ID
+            changes: Dictionaries with 'enrollment_id' and the 'grade' and/or
+                'status' to set
+            
+        Returns:
+            List of dictionaries representing the updated enrollments
+        """
+        if not changes:
+            return []
+        
+        response = self.supabase.rpc('apply_enrollment_grade_changes', {
+            'p_student_id': student_id,
+            'p_changes': changes
+        }).execute()
+        return response.data if response.data else []
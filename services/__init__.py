@@ -5,3 +5,6 @@ from .major_service import MajorService
 from .course_service import CourseService
 from .degree_audit_service import DegreeAuditService
 from .distribution_service import DistributionService
+from .course_catalog import CourseCatalog
+from .transcript_service import TranscriptService
+from .plan_validation_service import PlanValidationService
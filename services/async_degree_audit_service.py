@@ -0,0 +1,292 @@
+"""Async degree audit and student info for the ASGI serving mode."""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+from repositories.async_repositories import AsyncStudentRepository, AsyncMajorRepository, AsyncCourseRepository
+from services.degree_audit_service import DegreeAuditService
+from services.distribution_service import DistributionService
+
+
+class AsyncDegreeAuditService:
+    """
+    Degree audit that fetches independent data concurrently.
+
+    Instead of one query per requirement, group and rule, the audit loads
+    everything in a few waves of batched queries, each wave issued with
+    asyncio.gather, then evaluates the requirements in memory with the same
+    helpers as DegreeAuditService. While a request waits on Supabase the event
+    loop serves others, so one worker can hold many audits in flight.
+    """
+
+    def __init__(self, student_repository: AsyncStudentRepository,
+                 major_repository: AsyncMajorRepository,
+                 course_repository: AsyncCourseRepository,
+                 distribution_service: DistributionService):
+        """
+        Initialize with async repositories.
+
+        Args:
+            student_repository: Async repository for student data
+            major_repository: Async repository for major requirement data
+            course_repository: Async repository for course data
+            distribution_service: Distribution service (its configuration is
+                cached at startup, so computing a status does no I/O)
+        """
+        self.student_repo = student_repository
+        self.major_repo = major_repository
+        self.course_repo = course_repository
+        self.distribution_service = distribution_service
+
+    async def _get_student(self, student: Dict[str, Any], complete: bool) -> Dict[str, Any]:
+        """Get the full student row, loading it if only the IDs are known."""
+        if complete:
+            return student
+
+        row = await self.student_repo.get_by_id(student['student_id'], 'student_id')
+        if not row:
+            raise ValueError(f"No student found with NetID: {student['net_id']}")
+        return row
+
+    async def get_student_info(self, student: Dict[str, Any], complete: bool = True) -> Dict[str, Any]:
+        """
+        Get comprehensive information about a student.
+
+        Args:
+            student: The authenticated student (only the IDs if not complete)
+            complete: Whether `student` is the full student row
+
+        Returns:
+            Dictionary with student information, declared majors, course
+            enrollments and plans (same shape as StudentService.get_student_info)
+
+        Raises:
+            ValueError: If the student is not found
+        """
+        student_id = student['student_id']
+
+        student, majors, enrollments, plans = await asyncio.gather(
+            self._get_student(student, complete),
+            self.student_repo.get_declared_majors(student_id),
+            self.student_repo.get_course_enrollments(student_id),
+            self.student_repo.get_course_plans(student_id)
+        )
+
+        # Fetch the course details of all enrollments and plans in one query
+        course_ids = [row['course_id'] for row in enrollments + plans]
+        courses = await self.course_repo.get_by_ids(course_ids, '*')
+        courses_by_id = {course['course_id']: course for course in courses}
+
+        def with_course(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return [
+                dict(row, course=courses_by_id[row['course_id']])
+                for row in rows if row['course_id'] in courses_by_id
+            ]
+
+        return {
+            'student': student,
+            'majors': majors,
+            'enrollments': with_course(enrollments),
+            'plans': with_course(plans)
+        }
+
+    async def check_degree_completion(self, student: Dict[str, Any], complete: bool = True) -> Dict[str, Any]:
+        """
+        Check if a student has completed their major and distribution requirements.
+
+        Args:
+            student: The authenticated student (only the IDs if not complete)
+            complete: Whether `student` is the full student row
+
+        Returns:
+            Dictionary with completion status, unfulfilled major requirements,
+            and distribution requirements status (same shape as
+            DegreeAuditService.check_degree_completion)
+
+        Raises:
+            ValueError: If the student is not found or has no declared majors
+        """
+        student_id = student['student_id']
+
+        # Wave 1: the student, their majors and their completed courses
+        student, student_majors, completed = await asyncio.gather(
+            self._get_student(student, complete),
+            self.student_repo.get_declared_majors(student_id),
+            self.student_repo.get_course_enrollments(student_id, 'Completed')
+        )
+
+        if not student_majors:
+            raise ValueError(f"Student has no declared majors")
+
+        # Wave 2: requirements and rules of all majors, distributions of completed courses
+        version_ids = [student_major['major_version_id'] for student_major in student_majors]
+        requirements, rules, distribution_courses = await asyncio.gather(
+            self.major_repo.get_requirements_for_versions(version_ids),
+            self.major_repo.get_requirement_rules_for_versions(version_ids),
+            self.course_repo.get_by_ids([enrollment['course_id'] for enrollment in completed],
+                                        'course_id, distribution')
+        )
+
+        # Wave 3: groups of all requirements, including those referenced by rules
+        groups = await self.major_repo.get_requirement_groups_for(
+            [requirement['requirement_id'] for requirement in requirements]
+            + [rule['requirement_id'] for rule in rules if rule.get('requirement_id')]
+        )
+
+        # Wave 4: courses of all groups, including those referenced by rules
+        group_courses = await self.course_repo.get_group_courses_for(
+            [group['requirement_group_id'] for group in groups]
+            + [rule['requirement_group_id'] for rule in rules if rule.get('requirement_group_id')]
+        )
+
+        # Wave 5: details of every course that can fulfill a group
+        courses_info = await self.course_repo.get_by_ids([item['course_id'] for item in group_courses])
+
+        # Index everything for the in-memory evaluation
+        requirements_by_version = defaultdict(list)
+        for requirement in requirements:
+            requirements_by_version[requirement['major_version_id']].append(requirement)
+        rules_by_version = defaultdict(list)
+        for rule in rules:
+            rules_by_version[rule['major_version_id']].append(rule)
+        groups_by_requirement = defaultdict(list)
+        for group in groups:
+            groups_by_requirement[group['requirement_id']].append(group)
+        courses_by_group = defaultdict(list)
+        for item in group_courses:
+            courses_by_group[item['requirement_group_id']].append(item['course_id'])
+        courses_info_dict = {course['course_id']: course for course in courses_info}
+
+        major_results = []
+        for student_major in student_majors:
+            major_name = student_major['majorversions']['majors']['major_name']
+            major_version_id = student_major['major_version_id']
+            major_results.append((major_name, self._evaluate_major(
+                requirements_by_version[major_version_id],
+                rules_by_version[major_version_id],
+                groups_by_requirement,
+                courses_by_group,
+                courses_info_dict,
+                completed
+            )))
+
+        courses_with_distributions = DistributionService.get_courses_with_distributions(
+            completed,
+            {course['course_id']: course for course in distribution_courses}
+        )
+        distribution_status = self.distribution_service.compute_distribution_status(
+            student,
+            courses_with_distributions
+        )
+
+        return DegreeAuditService.build_completion_response(major_results, distribution_status)
+
+    @staticmethod
+    def _evaluate_major(requirements: List[Dict[str, Any]], rules: List[Dict[str, Any]],
+                        groups_by_requirement: Dict[int, List[Dict[str, Any]]],
+                        courses_by_group: Dict[int, List[int]],
+                        courses_info_dict: Dict[int, Dict[str, Any]],
+                        completed: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Evaluate one major from prefetched data.
+
+        Mirrors DegreeAuditService.check_major_completion_with_details.
+
+        Args:
+            requirements: The major version's requirements
+            rules: The major version's requirement rules
+            groups_by_requirement: Requirement groups by requirement ID
+            courses_by_group: Course IDs by requirement group ID
+            courses_info_dict: Course information by course ID
+            completed: The student's completed enrollments
+
+        Returns:
+            Dictionary with completion status and unfulfilled requirements
+        """
+        if not requirements:
+            return {
+                'is_completed': False,
+                'unfulfilled_requirements': [
+                    {
+                        'requirement_name': 'No requirements found',
+                        'unfulfilled_groups': []
+                    }
+                ]
+            }
+
+        def completed_in(course_ids: List[int]) -> List[Dict[str, Any]]:
+            wanted = set(course_ids)
+            return [enrollment for enrollment in completed if enrollment['course_id'] in wanted]
+
+        all_requirements_met = True
+        unfulfilled_requirements = []
+
+        for requirement in requirements:
+            unfulfilled_groups = []
+
+            for group in groups_by_requirement.get(requirement['requirement_id'], []):
+                course_ids = courses_by_group.get(group['requirement_group_id'])
+                if not course_ids:
+                    continue
+
+                unfulfilled_group = DegreeAuditService.evaluate_group(
+                    group, course_ids, courses_info_dict, completed_in(course_ids)
+                )
+                if unfulfilled_group:
+                    unfulfilled_groups.append(unfulfilled_group)
+
+            if unfulfilled_groups:
+                all_requirements_met = False
+                unfulfilled_requirements.append({
+                    'requirement_name': requirement['requirement_name'],
+                    'unfulfilled_groups': unfulfilled_groups
+                })
+
+        # Check additional rules if all standard requirements are met
+        rule_violations = []
+
+        if all_requirements_met:
+            for rule in rules:
+                if rule.get('requirement_id'):
+                    courses_to_check = [
+                        course_id
+                        for group in groups_by_requirement.get(rule['requirement_id'], [])
+                        for course_id in courses_by_group.get(group['requirement_group_id'], [])
+                    ]
+                elif rule.get('requirement_group_id'):
+                    courses_to_check = courses_by_group.get(rule['requirement_group_id'], [])
+                else:
+                    courses_to_check = []
+
+                if not courses_to_check:
+                    continue  # No courses to check
+
+                completed_courses = completed_in(courses_to_check)
+                if rule['rule_type'] == 'MIN_GRADE':
+                    passes_rule = DegreeAuditService.passes_min_grade_rule(rule, completed_courses)
+                elif rule['rule_type'] == 'COURSE_LEVEL':
+                    course_details = [
+                        courses_info_dict[enrollment['course_id']]
+                        for enrollment in completed_courses if enrollment['course_id'] in courses_info_dict
+                    ]
+                    passes_rule = DegreeAuditService.passes_course_level_rule(rule, course_details)
+                else:
+                    continue
+
+                if not passes_rule:
+                    all_requirements_met = False
+                    rule_violations.append(DegreeAuditService.describe_rule_violation(rule))
+
+        # Add rule violations to unfulfilled requirements if any
+        if rule_violations:
+            unfulfilled_requirements.append({
+                'requirement_name': 'Additional Requirements',
+                'unfulfilled_groups': [],
+                'rule_violations': rule_violations
+            })
+
+        return {
+            'is_completed': all_requirements_met,
+            'unfulfilled_requirements': unfulfilled_requirements
+        }
@@ -0,0 +1,424 @@
+"""In-memory snapshot of the course catalog and its derived indexes."""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from repositories.course_repository import CourseRepository
+from utils.text_search import TrigramIndex, BM25Index, PrefixIndex, STOP_WORDS
+from utils.facets import FacetIndex
+from utils.prerequisite_graph import PrerequisiteGraph
+from utils.grade_utils import course_level_band
+
+logger = logging.getLogger(__name__)
+
+
+class CourseCatalog:
+    """
+    Cached copy of the course catalog shared by the course-related services.
+
+    The catalog changes a few times a year, so each worker loads it once and
+    reloads it after refresh_interval seconds (or when refresh() is called).
+    Search indexes are derived from the snapshot lazily and rebuilt whenever the
+    snapshot is reloaded.
+    """
+
+    # Facets available for browsing the catalog
+    FACETS = ('subject_code', 'distribution', 'level', 'credits')
+
+    # Field weights for full-text search: title and code matches outrank description matches
+    FULLTEXT_FIELD_WEIGHTS = {'title': 2.0, 'description': 1.0}
+
+    def __init__(self, course_repository: CourseRepository, refresh_interval: int = 3600,
+                 search_index_path: Optional[str] = None):
+        """
+        Initialize with repositories.
+
+        Args:
+            course_repository: Repository for course data
+            refresh_interval: Seconds before the snapshot is reloaded (0 disables reloads)
+            search_index_path: Optional file the full-text index is saved to and loaded
+                from, so workers can share it without re-tokenizing the catalog
+        """
+        self.course_repo = course_repository
+        self.refresh_interval = refresh_interval
+        self.search_index_path = search_index_path
+
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._courses: List[Dict[str, Any]] = []
+        self._courses_by_id: Dict[int, Dict[str, Any]] = {}
+        self._courses_by_code: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._version: Optional[str] = None
+
+        # Lazily built indexes (reset on every reload)
+        self._trigram_index: Optional[TrigramIndex] = None
+        self._bm25_index: Optional[BM25Index] = None
+        self._prefix_index: Optional[PrefixIndex] = None
+        self._suggestions: Dict[int, Dict[str, Any]] = {}
+        self._facet_index: Optional[FacetIndex] = None
+        self._prerequisite_graph: Optional[PrerequisiteGraph] = None
+
+    def _is_stale(self) -> bool:
+        """Check whether the snapshot needs to be (re)loaded."""
+        if self._loaded_at is None:
+            return True
+        if not self.refresh_interval:
+            return False
+        return time.monotonic() - self._loaded_at > self.refresh_interval
+
+    def ensure_loaded(self) -> None:
+        """Load the catalog snapshot if it has not been loaded or has expired."""
+        if self._is_stale():
+            with self._lock:
+                if self._is_stale():
+                    self.refresh()
+
+    def refresh(self) -> None:
+        """Reload the catalog snapshot from the database and drop derived indexes."""
+        with self._lock:
+            # Read in ranges: a single select would be truncated at PostgREST's max-rows
+            courses = list(self.course_repo.iter_rows(('course_id',)))
+            courses.sort(key=lambda course: course['course_id'])
+
+            self._courses = courses
+            self._courses_by_id = {course['course_id']: course for course in courses}
+            self._courses_by_code = {
+                (str(course['subject_code']).upper(), str(course['course_number']).upper()): course
+                for course in courses
+            }
+            self._version = self._compute_version(courses)
+            self._trigram_index = None
+            self._bm25_index = None
+            self._prefix_index = None
+            self._suggestions = {}
+            self._facet_index = None
+            self._prerequisite_graph = None
+            self._loaded_at = time.monotonic()
+
+            logger.info("Loaded course catalog: %d courses (version %s)", len(courses), self._version)
+
+    @staticmethod
+    def _compute_version(courses: List[Dict[str, Any]]) -> str:
+        """Compute a content hash identifying this catalog snapshot."""
+        payload = json.dumps(courses, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha1(payload).hexdigest()[:16]
+
+    @property
+    def version(self) -> str:
+        """Content hash of the current catalog snapshot."""
+        self.ensure_loaded()
+        return self._version
+
+    @property
+    def courses(self) -> List[Dict[str, Any]]:
+        """All courses in the catalog, ordered by course_id."""
+        self.ensure_loaded()
+        return self._courses
+
+    def snapshot(self) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Get the catalog version and its courses together, consistent with each other.
+
+        Returns:
+            Tuple of (version, courses ordered by course_id)
+        """
+        self.ensure_loaded()
+        with self._lock:
+            return self._version, self._courses
+
+    def get(self, course_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a course from the catalog by its ID.
+
+        Args:
+            course_id: The course ID
+
+        Returns:
+            Dictionary representing the course, or None if not found
+        """
+        self.ensure_loaded()
+        return self._courses_by_id.get(course_id)
+
+    def get_by_code(self, subject_code: str, course_number: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a course from the catalog by its code (e.g. 'CPSC', '201').
+
+        Args:
+            subject_code: The subject code (case-insensitive)
+            course_number: The course number (case-insensitive)
+
+        Returns:
+            Dictionary representing the course, or None if not found
+        """
+        self.ensure_loaded()
+        return self._courses_by_code.get((subject_code.upper(), course_number.upper()))
+
+    def get_many(self, course_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get several courses from the catalog in one lookup.
+
+        Args:
+            course_ids: The course IDs
+
+        Returns:
+            Dictionary of the courses found, by course ID (unknown IDs are left out)
+        """
+        self.ensure_loaded()
+        courses_by_id = self._courses_by_id
+        return {course_id: courses_by_id[course_id] for course_id in set(course_ids) if course_id in courses_by_id}
+
+    @property
+    def trigram_index(self) -> TrigramIndex:
+        """Trigram index over course titles and "SUBJ NUM" codes."""
+        self.ensure_loaded()
+        index = self._trigram_index
+        if index is None:
+            with self._lock:
+                if self._trigram_index is None:
+                    self._trigram_index = self._build_trigram_index(self._courses)
+                index = self._trigram_index
+        return index
+
+    @staticmethod
+    def _build_trigram_index(courses: List[Dict[str, Any]]) -> TrigramIndex:
+        """Build the trigram index for a list of courses."""
+        index = TrigramIndex()
+        for course in courses:
+            code = f"{course.get('subject_code', '')} {course.get('course_number', '')}"
+            index.add(course['course_id'], [code, course.get('course_title')])
+        return index
+
+    @property
+    def bm25_index(self) -> BM25Index:
+        """Full-text BM25 index over course codes, titles and descriptions."""
+        self.ensure_loaded()
+        index = self._bm25_index
+        if index is None:
+            with self._lock:
+                if self._bm25_index is None:
+                    self._bm25_index = self._load_bm25_index() or self._build_bm25_index()
+                index = self._bm25_index
+        return index
+
+    def _build_bm25_index(self) -> BM25Index:
+        """Build the full-text index from the snapshot and save it if a path is configured."""
+        index = BM25Index(self.FULLTEXT_FIELD_WEIGHTS)
+        for course in self._courses:
+            index.add(course['course_id'], {
+                'title': f"{course.get('subject_code', '')} {course.get('course_number', '')} "
+                         f"{course.get('course_title') or ''}",
+                'description': course.get('description')
+            })
+
+        if self.search_index_path:
+            try:
+                temp_path = f"{self.search_index_path}.{os.getpid()}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as index_file:
+                    json.dump({'version': self._version, 'bm25': index.to_dict()}, index_file)
+                os.replace(temp_path, self.search_index_path)
+            except OSError as e:
+                logger.warning("Could not save search index to %s: %s", self.search_index_path, str(e))
+
+        return index
+
+    def _load_bm25_index(self) -> Optional[BM25Index]:
+        """Load a saved full-text index if one exists for the current catalog version."""
+        if not self.search_index_path or not os.path.exists(self.search_index_path):
+            return None
+
+        try:
+            with open(self.search_index_path, 'r', encoding='utf-8') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load search index from %s: %s", self.search_index_path, str(e))
+            return None
+
+        if data.get('version') != self._version:
+            return None
+
+        return BM25Index.from_dict(data['bm25'])
+
+    @property
+    def prefix_index(self) -> PrefixIndex:
+        """Prefix index over "SUBJ NUM" codes and title word prefixes, for autocomplete."""
+        self.ensure_loaded()
+        index = self._prefix_index
+        if index is None:
+            with self._lock:
+                if self._prefix_index is None:
+                    self._suggestions = {
+                        course['course_id']: {
+                            'course_id': course['course_id'],
+                            'code': f"{course.get('subject_code', '')} {course.get('course_number', '')}",
+                            'title': course.get('course_title')
+                        }
+                        for course in self._courses
+                    }
+                    self._prefix_index = self._build_prefix_index(self._courses)
+                index = self._prefix_index
+        return index
+
+    def get_suggestion(self, course_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the minimal autocomplete entry (course_id, code, title) for a course.
+
+        Args:
+            course_id: The course ID
+
+        Returns:
+            Prebuilt suggestion dictionary, or None if not found
+        """
+        # Suggestions are built together with the prefix index
+        _ = self.prefix_index
+        return self._suggestions.get(course_id)
+
+    @staticmethod
+    def _build_prefix_index(courses: List[Dict[str, Any]]) -> PrefixIndex:
+        """Build the autocomplete index for a list of courses."""
+        index = PrefixIndex()
+        for course in courses:
+            course_id = course['course_id']
+            subject = course.get('subject_code', '')
+            number = course.get('course_number', '')
+
+            # "CPSC 223", "CPSC223" and "223"
+            index.add(f"{subject} {number}", course_id)
+            index.add(f"{subject}{number}", course_id)
+            index.add(number, course_id)
+
+            # The title from each significant word on ("data struct", "struct")
+            words = (course.get('course_title') or '').split()
+            for i, word in enumerate(words):
+                if i == 0 or word.lower() not in STOP_WORDS:
+                    index.add(' '.join(words[i:]), course_id)
+
+        # Sorted here, under the catalog lock, so lookups never write
+        index.freeze()
+        return index
+
+    @property
+    def facet_index(self) -> FacetIndex:
+        """Per-facet-value bitmaps over the catalog (bit i is courses[i])."""
+        self.ensure_loaded()
+        index = self._facet_index
+        if index is None:
+            with self._lock:
+                if self._facet_index is None:
+                    self._facet_index = self._build_facet_index(self._courses)
+                index = self._facet_index
+        return index
+
+    @property
+    def prerequisite_graph(self) -> PrerequisiteGraph:
+        """Prerequisites of all catalog courses, with their transitive closure (bit i is courses[i])."""
+        self.ensure_loaded()
+        graph = self._prerequisite_graph
+        if graph is None:
+            with self._lock:
+                if self._prerequisite_graph is None:
+                    self._prerequisite_graph = PrerequisiteGraph(
+                        [course['course_id'] for course in self._courses],
+                        self.course_repo.iter_prerequisites()
+                    )
+                    logger.info("Built prerequisite graph for %d courses", len(self._courses))
+                graph = self._prerequisite_graph
+        return graph
+
+    def facet_snapshot(self) -> Tuple[List[Dict[str, Any]], FacetIndex]:
+        """
+        Get the courses and facet index of one snapshot.
+
+        Returns:
+            Tuple of (courses ordered by course_id, facet index)
+        """
+        while True:
+            with self._lock:
+                courses = self.courses
+                facet_index = self.facet_index
+                # Holding the lock only blocks other threads; retry if this one reloaded
+                if self._courses is courses:
+                    return courses, facet_index
+
+    def eligibility_snapshot(self) -> Tuple[List[Dict[str, Any]], FacetIndex, PrerequisiteGraph]:
+        """
+        Get the courses, facet index and prerequisite graph of one snapshot.
+
+        Bit positions of the indexes refer to the returned courses. Reading the
+        three separately could mix snapshots if the catalog is reloaded in between.
+
+        Returns:
+            Tuple of (courses ordered by course_id, facet index, prerequisite graph)
+        """
+        while True:
+            with self._lock:
+                courses = self.courses
+                facet_index = self.facet_index
+                graph = self.prerequisite_graph
+                # Holding the lock only blocks other threads; retry if this one reloaded
+                if self._courses is courses:
+                    return courses, facet_index, graph
+
+    @classmethod
+    def facet_values(cls, course: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Get the facet values of a course.
+
+        Args:
+            course: The course dictionary
+
+        Returns:
+            Mapping of facet name to the course's values (a course can have
+            several distribution codes, e.g. "QR, Sc")
+        """
+        values = {name: [] for name in cls.FACETS}
+
+        if course.get('subject_code'):
+            values['subject_code'].append(course['subject_code'])
+
+        if course.get('distribution'):
+            values['distribution'] = [code.strip() for code in course['distribution'].split(',') if code.strip()]
+
+        level = course_level_band(course.get('course_number'))
+        if level:
+            values['level'].append(level)
+
+        if course.get('credits') is not None:
+            values['credits'].append(cls.credits_value(course['credits']))
+
+        return values
+
+    @staticmethod
+    def credits_value(credits: Any) -> str:
+        """
+        Format a credit amount as its credits facet value.
+
+        Args:
+            credits: The amount, as a number or numeric string (e.g. 1.0 or '0.50')
+
+        Returns:
+            The facet value (e.g. '1' or '0.5')
+
+        Raises:
+            ValueError: If the amount is not a finite number
+        """
+        try:
+            value = float(credits)
+        except (TypeError, ValueError):
+            value = math.nan
+        if not math.isfinite(value):
+            raise ValueError(f"Invalid credits value: {credits}")
+        return f"{value:g}"
+
+    @classmethod
+    def _build_facet_index(cls, courses: List[Dict[str, Any]]) -> FacetIndex:
+        """Build the facet bitmaps for a list of courses."""
+        index = FacetIndex(cls.FACETS, len(courses))
+        for position, course in enumerate(courses):
+            index.add(position, cls.facet_values(course))
+        return index
@@ -1,51 +1,137 @@
 """Service for course-related functionality."""
 
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from repositories.course_repository import CourseRepository
+from repositories.sqlite_search_repository import SqliteCourseSearchRepository
+from services.course_catalog import CourseCatalog
 from models.course import CoursePaginatedResponse
+from utils.facets import iter_bits
+from utils.fieldsets import project, select_clause
 
 
 class CourseService:
     """Service for course-related functionality."""
     
-    def __init__(self, course_repository: CourseRepository):
+    # Supported search modes
+    SEARCH_MODES = ('substring', 'fuzzy', 'fulltext')
+    
+    # Supported search backends:
+    #   memory   - indexes built from the in-memory catalog
+    #   database - pushed down to PostgreSQL (migration/course_search.sql); no catalog needed
+    #   sqlite   - full-text search through a local SQLite FTS5 stand-in for the database
+    SEARCH_BACKENDS = ('memory', 'database', 'sqlite')
+    
+    def __init__(self, course_repository: CourseRepository, course_catalog: Optional[CourseCatalog] = None,
+                 search_backend: str = 'memory'):
         """
         Initialize with repositories.
         
         Args:
             course_repository: Repository for course data
+            course_catalog: Optional shared in-memory catalog (created if not given)
+            search_backend: Where searches run ('memory', 'database' or 'sqlite')
+            
+        Raises:
+            ValueError: If the search backend is not supported
         """
+        if search_backend not in self.SEARCH_BACKENDS:
+            raise ValueError(f"Invalid search backend: {search_backend}. "
+                             f"Must be one of: {', '.join(self.SEARCH_BACKENDS)}")
+        
         self.course_repo = course_repository
+        self.catalog = course_catalog or CourseCatalog(course_repository)
+        self.search_backend = search_backend
+        
+        # SQLite stand-in as (catalog version, index), rebuilt whenever the catalog version changes
+        self._sqlite_search: Optional[Tuple[str, SqliteCourseSearchRepository]] = None
+        self._sqlite_search_lock = threading.Lock()
     
-    def get_all_courses(self, subject_code: Optional[str] = None, 
-                         distribution: Optional[str] = None,
-                         page: int = 1, per_page: int = 50) -> Dict[str, Any]:
+    def get_all_courses(self, subject_codes: Optional[List[str]] = None,
+                        distributions: Optional[List[str]] = None,
+                        page: int = 1, per_page: int = 50,
+                        levels: Optional[List[str]] = None,
+                        credits: Optional[List[str]] = None,
+                        fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
-        Get all courses with optional filtering and pagination.
+        Get all courses with optional faceted filtering and pagination.
+        
+        Filtering and facet counts are computed in memory from the catalog's facet
+        bitmaps; values are OR-ed within a facet and AND-ed across facets.
         
         Args:
-            subject_code: Optional subject code to filter by
-            distribution: Optional distribution requirement to filter by
+            subject_codes: Optional subject codes to filter by
+            distributions: Optional distribution requirement codes to filter by
             page: The page number
             per_page: The number of records per page
+            levels: Optional level bands to filter by ('100', '200', '300', '400+')
+            credits: Optional credit values to filter by, formatted with
+                CourseCatalog.credits_value (e.g. '1', '0.5')
+            fields: Optional course fields to return (all fields if not given)
             
         Returns:
-            Dictionary with pagination information and list of courses
+            Dictionary with pagination information, list of courses, and per-facet
+            value counts for the current filter
+        """
+        selections = {
+            'subject_code': subject_codes,
+            'distribution': distributions,
+            'level': levels,
+            'credits': credits
+        }
+        
+        courses, facet_index = self.catalog.facet_snapshot()
+        matches = facet_index.filter(selections)
+        
+        # Walk the matching positions in catalog order, keeping only this page
+        start = (page - 1) * per_page
+        page_courses = []
+        
+        for i, position in enumerate(iter_bits(matches)):
+            if i >= start + per_page:
+                break
+            if i >= start:
+                page_courses.append(project(courses[position], fields))
+        
+        return {
+            'page': page,
+            'per_page': per_page,
+            'total': matches.bit_count(),
+            'courses': page_courses,
+            'facets': facet_index.counts(selections)
+        }
+    
+    def get_courses_by_ids(self, course_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Look up several courses at once, e.g. to validate and hydrate a batch.
+        
+        Courses are read from the in-memory catalog; IDs missing from the
+        snapshot (courses added since it was loaded) are checked with a single
+        database query.
+        
+        Args:
+            course_ids: The course IDs
+        
+        Returns:
+            Dictionary of the existing courses, by course ID (unknown IDs are left out)
         """
-        return self.course_repo.get_paginated(
-            page=page,
-            per_page=per_page,
-            subject_code=subject_code,
-            distribution=distribution
-        )
+        courses = self.catalog.get_many(course_ids)
+        
+        missing = [course_id for course_id in set(course_ids) if course_id not in courses]
+        if missing:
+            for course in self.course_repo.get_by_ids(missing, '*'):
+                courses[course['course_id']] = course
+        
+        return courses
     
-    def get_course_details(self, course_id: int) -> Dict[str, Any]:
+    def get_course_details(self, course_id: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get detailed information about a course, including prerequisites and equivalents.
         
         Args:
             course_id: The course ID
+            fields: Optional course fields to select (all fields if not given)
             
         Returns:
             Dictionary with course information, prerequisites, and equivalent courses
@@ -53,7 +139,12 @@ class CourseService:
         Raises:
             ValueError: If the course is not found
         """
-        course = self.course_repo.get_by_id(course_id)
+        if fields:
+            rows = self.course_repo.get_by_ids([course_id], select_clause(fields))
+            course = rows[0] if rows else None
+        else:
+            course = self.course_repo.get_by_id(course_id)
+        
         if not course:
             raise ValueError(f"Course not found with ID: {course_id}")
         
@@ -69,34 +160,153 @@ class CourseService:
             'equivalents': equivalents
         }
     
-    def search_courses(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_prerequisite_chain(self, course_id: int) -> Dict[str, Any]:
+        """
+        Get the direct and transitive prerequisites of a course from the in-memory graph.
+        
+        Args:
+            course_id: The course ID
+            
+        Returns:
+            Dictionary with the course, its depth (longest prerequisite chain),
+            its direct prerequisites (with concurrency_allowed), all of its
+            prerequisites, and the chain of prerequisites grouped by depth
+            
+        Raises:
+            ValueError: If the course is not found
+        """
+        graph = self.catalog.prerequisite_graph
+        if course_id not in graph:
+            raise ValueError(f"Course not found with ID: {course_id}")
+        
+        def summary(prereq_id: int) -> Dict[str, Any]:
+            # The catalog may have been reloaded since the graph was read
+            course = self.catalog.get(prereq_id) or {'course_id': prereq_id}
+            return {key: course.get(key) for key in ('course_id', 'subject_code', 'course_number', 'course_title')}
+        
+        concurrent = graph.concurrent[graph.positions[course_id]]
+        return {
+            'course': summary(course_id),
+            'depth': graph.get_depth(course_id),
+            'prerequisites': [
+                dict(summary(prereq_id), concurrency_allowed=bool(concurrent & graph.mask([prereq_id])))
+                for prereq_id in graph.prerequisites(course_id)
+            ],
+            'all_prerequisites': [summary(prereq_id) for prereq_id in graph.prerequisites(course_id, transitive=True)],
+            'chain': graph.chain(course_id)
+        }
+    
+    def get_eligible_courses(self, taken_course_ids: List[int],
+                             subject_codes: Optional[List[str]] = None,
+                             distributions: Optional[List[str]] = None,
+                             levels: Optional[List[str]] = None,
+                             page: int = 1, per_page: int = 50,
+                             fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get the catalog courses a student can take next, with optional faceted filtering.
+        
+        Eligibility is computed for the whole catalog at once from the
+        prerequisite graph's bitmaps and intersected with the facet bitmaps, so
+        no course is checked individually and nothing is read from the database.
+        
+        Args:
+            taken_course_ids: IDs of the courses the student has taken (or is taking)
+            subject_codes: Optional subject codes to filter by
+            distributions: Optional distribution requirement codes to filter by
+            levels: Optional level bands to filter by ('100', '200', '300', '400+')
+            page: The page number
+            per_page: The number of records per page
+            fields: Optional course fields to return (all fields if not given)
+            
+        Returns:
+            Dictionary with pagination information and the list of eligible courses
+        """
+        courses, facet_index, graph = self.catalog.eligibility_snapshot()
+        eligible = graph.eligible(graph.mask(taken_course_ids))
+        
+        matches = eligible & facet_index.filter({
+            'subject_code': subject_codes,
+            'distribution': distributions,
+            'level': levels
+        })
+        
+        # Walk the matching positions in catalog order, keeping only this page
+        start = (page - 1) * per_page
+        page_courses = []
+        
+        for i, position in enumerate(iter_bits(matches)):
+            if i >= start + per_page:
+                break
+            if i >= start:
+                page_courses.append(project(courses[position], fields))
+        
+        return {
+            'page': page,
+            'per_page': per_page,
+            'total': matches.bit_count(),
+            'courses': page_courses
+        }
+    
+    def search_courses(self, query: str, limit: int = 10, mode: str = 'substring',
+                       fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Search for courses by title, subject code, or course number.
         
         Args:
             query: The search query
             limit: Maximum number of results to return
+            mode: 'substring' for exact substring matching, 'fuzzy' for
+                typo-tolerant matching ranked by similarity, or 'fulltext' for
+                BM25-ranked matching over codes, titles and descriptions
+            fields: Optional course fields to return (ranked modes keep 'score')
             
         Returns:
             List of dictionaries representing the matching courses
+            
+        Raises:
+            ValueError: If the search mode is not supported
         """
-        # In a real implementation, you would use a more efficient search mechanism,
-        # but for simplicity, we'll just filter in-memory
+        courses = self._search_courses(query, limit, mode)
+        
+        if fields is None:
+            return courses
         
-        # Get all courses (in a real app, you'd use a database search feature)
-        all_courses = self.course_repo.get_all()
+        fields = list(fields) + ['score']
+        return [project(course, fields) for course in courses]
+    
+    def _search_courses(self, query: str, limit: int, mode: str) -> List[Dict[str, Any]]:
+        """Run a search with the configured backend (see search_courses)."""
+        if mode not in self.SEARCH_MODES:
+            raise ValueError(f"Invalid search mode: {mode}. Must be one of: {', '.join(self.SEARCH_MODES)}")
+        
+        # Push the search down to the database when configured
+        if self.search_backend == 'database':
+            if mode == 'fulltext':
+                return self.course_repo.search_full_text(query, limit)
+            if mode == 'fuzzy':
+                return self.course_repo.search_fuzzy(query, limit)
+            return self.course_repo.search_substring(query, limit)
+        
+        if self.search_backend == 'sqlite' and mode == 'fulltext':
+            return self._get_sqlite_search().search_full_text(query, limit)
+        
+        if mode == 'fuzzy':
+            return self._fuzzy_search(query, limit)
         
-        # Filter courses by query
+        if mode == 'fulltext':
+            return self._fulltext_search(query, limit)
+        
+        # Filter the cached catalog by query
         query = query.lower()
         matching_courses = []
         
-        for course in all_courses:
-            title = course.get('course_title', '').lower()
-            subject = course.get('subject_code', '').lower()
-            number = course.get('course_number', '').lower()
+        for course in self.catalog.courses:
+            title = (course.get('course_title') or '').lower()
+            subject = (course.get('subject_code') or '').lower()
+            number = (course.get('course_number') or '').lower()
             
             if (query in title or query in subject or query in number or
-                query in f"{subject} {number}".lower()):
+                query in f"{subject} {number}"):
                 matching_courses.append(course)
                 
             if len(matching_courses) >= limit:
@@ -104,26 +314,126 @@ class CourseService:
         
         return matching_courses
     
-    def get_courses_by_subject(self, subject_code: str) -> List[Dict[str, Any]]:
+    def _fuzzy_search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Search the catalog's trigram index, tolerating typos in titles and codes.
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of course dictionaries with a 'score' key, best match first
+        """
+        matches = self.catalog.trigram_index.search(query, limit)
+        return self._scored_courses(matches)
+    
+    def _fulltext_search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Search the catalog's BM25 index over course codes, titles and descriptions.
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of course dictionaries with a 'score' key, best match first
+        """
+        matches = self.catalog.bm25_index.search(query, limit)
+        return self._scored_courses(matches)
+    
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest courses whose code or title starts with the typed prefix.
+        
+        Args:
+            prefix: The typed text (e.g. "CPSC 2" or "data str")
+            limit: Maximum number of suggestions to return
+            
+        Returns:
+            List of minimal suggestion dictionaries (course_id, code, title)
+        """
+        course_ids = self.catalog.prefix_index.complete(prefix, limit)
+        suggestions = (self.catalog.get_suggestion(course_id) for course_id in course_ids)
+        # Courses dropped by a catalog reload after the lookup have no suggestion
+        return [suggestion for suggestion in suggestions if suggestion is not None]
+    
+    def _get_sqlite_search(self) -> SqliteCourseSearchRepository:
+        """Get the SQLite search stand-in for the current catalog version."""
+        version = self.catalog.version
+        current = self._sqlite_search
+        if current is None or current[0] != version:
+            # Only one request rebuilds the index after a catalog reload
+            with self._sqlite_search_lock:
+                version, courses = self.catalog.snapshot()
+                current = self._sqlite_search
+                if current is None or current[0] != version:
+                    current = (version, SqliteCourseSearchRepository(courses))
+                    self._sqlite_search = current
+        return current[1]
+    
+    def _scored_courses(self, matches: List[Tuple[int, float]]) -> List[Dict[str, Any]]:
+        """Attach catalog rows to (course_id, score) search matches."""
+        results = []
+        for course_id, score in matches:
+            course = self.catalog.get(course_id)
+            if course:
+                result = course.copy()
+                result['score'] = score
+                results.append(result)
+        
+        return results
+    
+    def get_courses_by_subject(self, subject_code: str,
+                               fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all courses for a specific subject.
         
         Args:
             subject_code: The subject code
+            fields: Optional course fields to select (all fields if not given)
             
         Returns:
             List of dictionaries representing the courses
         """
-        return self.course_repo.filter_by(subject_code=subject_code)
+        return self.course_repo.filter_by(select_clause(fields), subject_code=subject_code)
     
-    def get_courses_by_distribution(self, distribution: str) -> List[Dict[str, Any]]:
+    def get_courses_by_distribution(self, distribution: str,
+                                    fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all courses that fulfill a specific distribution requirement.
         
         Args:
             distribution: The distribution requirement code
+            fields: Optional course fields to select (all fields if not given)
             
         Returns:
             List of dictionaries representing the courses
         """
-        return self.course_repo.filter_by(distribution=distribution)
+        return self.course_repo.filter_by(select_clause(fields), distribution=distribution)
+    
+    def export_courses(self, fields: Optional[List[str]] = None,
+                       batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every course straight from the database, in course_id order.
+        
+        Args:
+            fields: Optional course fields to select (all fields if not given)
+            batch_size: Number of courses fetched per round trip
+            
+        Returns:
+            Iterator over course dictionaries
+        """
+        return self.course_repo.iter_rows(('course_id',), select_clause(fields), batch_size)
+    
+    def export_group_courses(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every requirement group to course mapping.
+        
+        Args:
+            batch_size: Number of mappings fetched per round trip
+            
+        Returns:
+            Iterator over requirementgroupcourses rows
+        """
+        return self.course_repo.iter_group_courses(batch_size)
@@ -1,6 +1,6 @@
 """Service for degree audit functionality."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from repositories.student_repository import StudentRepository
 from repositories.major_repository import MajorRepository
@@ -9,6 +9,7 @@ from repositories.distribution_repository import DistributionRepository
 from services.distribution_service import DistributionService
 from models.degree_audit import DegreeAuditResponse, MajorCompletionResult
 from utils.grade_utils import meets_min_grade, extract_course_level
+from utils.student_context import StudentContext
 
 
 class DegreeAuditService:
@@ -36,12 +37,14 @@ class DegreeAuditService:
             course_repository
         )
     
-    def check_degree_completion(self, net_id: str) -> Dict[str, Any]:
+    def check_degree_completion(self, net_id: str, context: Optional[StudentContext] = None) -> Dict[str, Any]:
         """
         Check if a student has completed their major requirements and distribution requirements.
         
         Args:
             net_id: The student's NetID
+            context: Optional request context of the student; the student, majors
+                and enrollments are read from it instead of being fetched again
             
         Returns:
             Dictionary with completion status, unfulfilled major requirements,
@@ -51,25 +54,48 @@ class DegreeAuditService:
             ValueError: If the student is not found or has no declared majors
         """
         # Get student info
-        student = self.student_repo.get_by_net_id(net_id)
-        if not student:
-            raise ValueError(f"No student found with NetID: {net_id}")
+        if context is None:
+            student = self.student_repo.get_by_net_id(net_id)
+            if not student:
+                raise ValueError(f"No student found with NetID: {net_id}")
+            context = StudentContext(student, self.student_repo)
         
-        student_id = student['student_id']
+        student_id = context.student_id
         
         # Get student's declared majors
-        student_majors = self.student_repo.get_declared_majors(student_id)
+        student_majors = context.majors
         if not student_majors:
             raise ValueError(f"Student has no declared majors")
         
         # Process each major
-        all_completed = True
-        unfulfilled_requirements = []
-        
+        major_results = []
         for student_major in student_majors:
             major_name = student_major['majorversions']['majors']['major_name']
-            result = self.check_major_completion_with_details(student_id, student_major)
+            major_results.append((major_name, self.check_major_completion_with_details(student_id, student_major, context)))
+        
+        # Get distribution requirements status
+        distribution_status = self.distribution_service.get_student_distribution_status(student_id, context)
+        
+        return self.build_completion_response(major_results, distribution_status)
+    
+    @staticmethod
+    def build_completion_response(major_results: List[Tuple[str, Dict[str, Any]]],
+                                  distribution_status: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Combine per-major results and the distribution status into the audit response.
+        
+        Args:
+            major_results: List of tuples (major name, major completion result)
+            distribution_status: The student's distribution requirement status
             
+        Returns:
+            Dictionary with completion status, unfulfilled major requirements,
+            and distribution requirements status
+        """
+        all_completed = True
+        unfulfilled_requirements = []
+        
+        for major_name, result in major_results:
             if not result['is_completed']:
                 all_completed = False
                 
@@ -81,9 +107,6 @@ class DegreeAuditService:
                         'groups': req['unfulfilled_groups']
                     })
         
-        # Get distribution requirements status
-        distribution_status = self.distribution_service.get_student_distribution_status(student_id)
-        
         # Check if all distribution requirements are met
         distribution_completed = True
         for year_progress in distribution_status['year_progress'].values():
@@ -116,7 +139,8 @@ class DegreeAuditService:
         
         return response
     
-    def check_major_completion_with_details(self, student_id: int, student_major: Dict[str, Any]) -> Dict[str, Any]:
+    def check_major_completion_with_details(self, student_id: int, student_major: Dict[str, Any],
+                                            context: Optional[StudentContext] = None) -> Dict[str, Any]:
         """
         Check if a student has completed all requirements for a specific major,
         and return details about any unfulfilled requirements.
@@ -124,6 +148,7 @@ class DegreeAuditService:
         Args:
             student_id: The student's ID
             student_major: The student's major data from the database
+            context: Optional request context used to match completed courses in memory
             
         Returns:
             Dictionary with completion status and unfulfilled requirements
@@ -164,8 +189,6 @@ class DegreeAuditService:
             
             for group in groups:
                 group_id = group['requirement_group_id']
-                group_name = group['group_name']
-                min_courses = group['min_courses_in_group']
                 
                 # Get courses that belong to this requirement group
                 group_courses = self.course_repo.get_group_courses(group_id)
@@ -181,39 +204,12 @@ class DegreeAuditService:
                 courses_info_dict = {course['course_id']: course for course in courses_info}
                 
                 # Get completed courses that fulfill this requirement
-                completed_courses = self.student_repo.get_completed_courses(student_id, course_ids)
-                courses_completed = len(completed_courses)
-                group_met = courses_completed >= min_courses
+                completed_courses = self._get_completed_courses(student_id, course_ids, context)
+                unfulfilled_group = self.evaluate_group(group, course_ids, courses_info_dict, completed_courses)
                 
-                if not group_met:
+                if unfulfilled_group:
                     requirement_met = False
-                    
-                    # Get available courses for this group
-                    available_courses = []
-                    for course_id in course_ids:
-                        if course_id in courses_info_dict:
-                            course = courses_info_dict[course_id]
-                            course_label = f"{course['subject_code']} {course['course_number']}: {course['course_title']}"
-                            available_courses.append(course_label)
-                    
-                    # Get courses already completed
-                    completed_course_labels = []
-                    for enrollment in completed_courses:
-                        course_id = enrollment['course_id']
-                        if course_id in courses_info_dict:
-                            course = courses_info_dict[course_id]
-                            course_label = f"{course['subject_code']} {course['course_number']}: {course['course_title']}"
-                            completed_course_labels.append(course_label)
-                    
-                    # Add unfulfilled group info
-                    unfulfilled_groups.append({
-                        'group_name': group_name,
-                        'courses_completed': courses_completed,
-                        'courses_required': min_courses,
-                        'courses_remaining': min_courses - courses_completed,
-                        'completed_courses': completed_course_labels,
-                        'available_courses': available_courses
-                    })
+                    unfulfilled_groups.append(unfulfilled_group)
             
             if not requirement_met:
                 all_requirements_met = False
@@ -235,22 +231,16 @@ class DegreeAuditService:
                 
                 # Process each rule type
                 if rule['rule_type'] == 'MIN_GRADE':
-                    passes_rule = self._check_min_grade_rule(student_id, rule)
+                    passes_rule = self._check_min_grade_rule(student_id, rule, context)
                     if not passes_rule:
                         all_requirements_met = False
-                        rule_violation = {
-                            'rule_type': 'Minimum Grade Requirement',
-                            'description': rule['notes'] or f"Minimum grade of {rule['value']} required"
-                        }
+                        rule_violation = self.describe_rule_violation(rule)
                 
                 elif rule['rule_type'] == 'COURSE_LEVEL':
-                    passes_rule = self._check_course_level_rule(student_id, rule)
+                    passes_rule = self._check_course_level_rule(student_id, rule, context)
                     if not passes_rule:
                         all_requirements_met = False
-                        rule_violation = {
-                            'rule_type': 'Course Level Requirement',
-                            'description': rule['notes'] or f"Minimum of {rule['value']} level courses required"
-                        }
+                        rule_violation = self.describe_rule_violation(rule)
                 
                 if rule_violation:
                     rule_violations.append(rule_violation)
@@ -268,26 +258,89 @@ class DegreeAuditService:
             'unfulfilled_requirements': unfulfilled_requirements
         }
     
-    def _check_min_grade_rule(self, student_id: int, rule: Dict[str, Any]) -> bool:
+    @staticmethod
+    def course_label(course: Dict[str, Any]) -> str:
+        """Format a course as 'SUBJ 123: Title'."""
+        return f"{course['subject_code']} {course['course_number']}: {course['course_title']}"
+    
+    @classmethod
+    def evaluate_group(cls, group: Dict[str, Any], course_ids: List[int],
+                       courses_info_dict: Dict[int, Dict[str, Any]],
+                       completed_courses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """
-        Check if a student meets the minimum grade requirement for certain courses.
+        Check a requirement group against the student's completed courses.
         
         Args:
-            student_id: The student's ID
-            rule: The requirement rule dictionary
+            group: The requirement group dictionary
+            course_ids: IDs of the courses that count towards the group
+            courses_info_dict: Course information by course ID
+            completed_courses: The student's completed enrollments in those courses
             
         Returns:
-            Boolean indicating if the rule is satisfied
+            Details of the unfulfilled group, or None if the group is met
         """
-        # Get courses associated with the rule
-        courses_to_check = self.major_repo.get_rule_courses(rule)
+        min_courses = group['min_courses_in_group']
+        courses_completed = len(completed_courses)
         
-        if not courses_to_check:
-            return True  # No courses to check
+        if courses_completed >= min_courses:
+            return None
         
-        # Get student's completed courses that match
-        completed_courses = self.student_repo.get_completed_courses(student_id, courses_to_check)
+        # Get available courses for this group
+        available_courses = [
+            cls.course_label(courses_info_dict[course_id])
+            for course_id in course_ids if course_id in courses_info_dict
+        ]
+        
+        # Get courses already completed
+        completed_course_labels = [
+            cls.course_label(courses_info_dict[enrollment['course_id']])
+            for enrollment in completed_courses if enrollment['course_id'] in courses_info_dict
+        ]
+        
+        return {
+            'group_name': group['group_name'],
+            'courses_completed': courses_completed,
+            'courses_required': min_courses,
+            'courses_remaining': min_courses - courses_completed,
+            'completed_courses': completed_course_labels,
+            'available_courses': available_courses
+        }
+    
+    @staticmethod
+    def describe_rule_violation(rule: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Describe a requirement rule the student does not satisfy.
+        
+        Args:
+            rule: The requirement rule dictionary
+            
+        Returns:
+            Dictionary with the rule type and description, or None for unknown rule types
+        """
+        if rule['rule_type'] == 'MIN_GRADE':
+            return {
+                'rule_type': 'Minimum Grade Requirement',
+                'description': rule['notes'] or f"Minimum grade of {rule['value']} required"
+            }
+        if rule['rule_type'] == 'COURSE_LEVEL':
+            return {
+                'rule_type': 'Course Level Requirement',
+                'description': rule['notes'] or f"Minimum of {rule['value']} level courses required"
+            }
+        return None
+    
+    @staticmethod
+    def passes_min_grade_rule(rule: Dict[str, Any], completed_courses: List[Dict[str, Any]]) -> bool:
+        """
+        Check the completed courses covered by a rule against its minimum grade.
         
+        Args:
+            rule: The requirement rule dictionary
+            completed_courses: The student's completed enrollments in the rule's courses
+            
+        Returns:
+            Boolean indicating if the rule is satisfied
+        """
         if not completed_courses:
             return False  # No completed courses in this category
         
@@ -299,37 +352,22 @@ class DegreeAuditService:
         
         return True
     
-    def _check_course_level_rule(self, student_id: int, rule: Dict[str, Any]) -> bool:
+    @staticmethod
+    def passes_course_level_rule(rule: Dict[str, Any], course_details: List[Dict[str, Any]]) -> bool:
         """
-        Check if a student has taken enough courses at or above a specified level.
+        Check whether enough completed courses are at or above a rule's level.
         
         Args:
-            student_id: The student's ID
             rule: The requirement rule dictionary
+            course_details: Course information of the student's completed courses
+                covered by the rule
             
         Returns:
             Boolean indicating if the rule is satisfied
         """
-        # Get courses associated with the rule
-        courses_to_check = self.major_repo.get_rule_courses(rule)
-        
-        if not courses_to_check:
-            return True  # No courses to check
-        
-        # Get student's completed courses
-        completed_courses = self.student_repo.get_completed_courses(student_id, courses_to_check)
-        
-        if not completed_courses:
+        if not course_details:
             return False  # No completed courses
         
-        # Get course information for completed courses
-        course_details = []
-        for enrollment in completed_courses:
-            course_id = enrollment['course_id']
-            course = self.course_repo.get_by_id(course_id)
-            if course:
-                course_details.append(course)
-        
         # Count how many courses are at or above the required level
         min_level = int(rule['value'])  # e.g., '400'
         high_level_courses = 0
@@ -352,4 +390,78 @@ class DegreeAuditService:
         elif operator == '>':
             return high_level_courses > required_count
         
-        return False
\ No newline at end of file
+        return False
+    
+    def _get_completed_courses(self, student_id: int, course_ids: List[int],
+                               context: Optional[StudentContext] = None) -> List[Dict[str, Any]]:
+        """
+        Get the student's completed enrollments for the given course IDs.
+        
+        Args:
+            student_id: The student's ID
+            course_ids: List of course IDs to check
+            context: Optional request context; when given, its enrollments are
+                filtered in memory instead of querying once per group or rule
+            
+        Returns:
+            List of dictionaries representing the matching completed enrollments
+        """
+        if context is not None:
+            return context.completed_courses(course_ids)
+        return self.student_repo.get_completed_courses(student_id, course_ids)
+    
+    def _check_min_grade_rule(self, student_id: int, rule: Dict[str, Any],
+                              context: Optional[StudentContext] = None) -> bool:
+        """
+        Check if a student meets the minimum grade requirement for certain courses.
+        
+        Args:
+            student_id: The student's ID
+            rule: The requirement rule dictionary
+            context: Optional request context of the student
+            
+        Returns:
+            Boolean indicating if the rule is satisfied
+        """
+        # Get courses associated with the rule
+        courses_to_check = self.major_repo.get_rule_courses(rule)
+        
+        if not courses_to_check:
+            return True  # No courses to check
+        
+        # Get student's completed courses that match
+        completed_courses = self._get_completed_courses(student_id, courses_to_check, context)
+        
+        return self.passes_min_grade_rule(rule, completed_courses)
+    
+    def _check_course_level_rule(self, student_id: int, rule: Dict[str, Any],
+                                 context: Optional[StudentContext] = None) -> bool:
+        """
+        Check if a student has taken enough courses at or above a specified level.
+        
+        Args:
+            student_id: The student's ID
+            rule: The requirement rule dictionary
+            context: Optional request context of the student
+            
+        Returns:
+            Boolean indicating if the rule is satisfied
+        """
+        # Get courses associated with the rule
+        courses_to_check = self.major_repo.get_rule_courses(rule)
+        
+        if not courses_to_check:
+            return True  # No courses to check
+        
+        # Get student's completed courses
+        completed_courses = self._get_completed_courses(student_id, courses_to_check, context)
+        
+        # Get course information for completed courses
+        course_details = []
+        for enrollment in completed_courses:
+            course_id = enrollment['course_id']
+            course = self.course_repo.get_by_id(course_id)
+            if course:
+                course_details.append(course)
+        
+        return self.passes_course_level_rule(rule, course_details)
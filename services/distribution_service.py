@@ -6,6 +6,7 @@ from datetime import datetime
 from repositories.distribution_repository import DistributionRepository
 from repositories.student_repository import StudentRepository
 from repositories.course_repository import CourseRepository
+from utils.student_context import StudentContext
 
 
 class DistributionService:
@@ -167,33 +168,81 @@ class DistributionService:
         
         return assignments
 
-    def get_student_distribution_status(self, student_id: int) -> Dict[str, Any]:
+    def get_student_distribution_status(self, student_id: int,
+                                        context: Optional[StudentContext] = None) -> Dict[str, Any]:
         """
         Get a student's distribution requirement status by year.
         
         Args:
             student_id: The student ID
+            context: Optional request context of the student, reused instead of
+                fetching the student and their enrollments again
             
         Returns:
             Dictionary with detailed distribution status information
         """
         # Get student info to determine year
-        student = self.student_repo.get_by_id(student_id)
-        current_year_label = self.determine_year_label(student)
+        student = context.student if context else self.student_repo.get_by_id(student_id)
         
         # Get completed courses
-        enrollments = self.student_repo.get_course_enrollments(student_id, "Completed")
+        if context:
+            enrollments = context.enrollments("Completed")
+        else:
+            enrollments = self.student_repo.get_course_enrollments(student_id, "Completed")
+        
+        # Collect courses and their possible distribution types (one query for all courses)
+        course_ids = list({enrollment['course_id'] for enrollment in enrollments})
+        courses = self.course_repo.get_by_ids(course_ids, 'course_id, distribution')
+        courses_by_id = {course['course_id']: course for course in courses}
+        courses_with_distributions = self.get_courses_with_distributions(enrollments, courses_by_id)
+        
+        return self.compute_distribution_status(student, courses_with_distributions)
+    
+    @staticmethod
+    def get_courses_with_distributions(
+        enrollments: List[Dict[str, Any]],
+        courses_by_id: Dict[int, Dict[str, Any]]
+    ) -> List[Tuple[int, List[str]]]:
+        """
+        Pair completed courses with their possible distribution codes.
         
-        # Collect courses and their possible distribution types
+        Args:
+            enrollments: The student's completed enrollments
+            courses_by_id: Course rows by course ID (must include 'distribution')
+            
+        Returns:
+            List of tuples (course_id, list of possible distribution codes)
+        """
         courses_with_distributions = []
         for enrollment in enrollments:
             course_id = enrollment['course_id']
-            course = self.course_repo.get_by_id(course_id)
+            course = courses_by_id.get(course_id)
             
             if course and course.get('distribution'):
                 dist_codes = [code.strip() for code in course['distribution'].split(',')]
                 courses_with_distributions.append((course_id, dist_codes))
         
+        return courses_with_distributions
+    
+    def compute_distribution_status(
+        self,
+        student: Dict[str, Any],
+        courses_with_distributions: List[Tuple[int, List[str]]]
+    ) -> Dict[str, Any]:
+        """
+        Compute a student's distribution requirement status from their completed courses.
+        
+        Uses only the cached distribution configuration, so it does no I/O.
+        
+        Args:
+            student: The student data dictionary
+            courses_with_distributions: List of tuples (course_id, list of possible distribution codes)
+            
+        Returns:
+            Dictionary with detailed distribution status information
+        """
+        current_year_label = self.determine_year_label(student)
+        
         # Initialize fulfilled counts for all distribution types
         fulfilled_counts = {code: 0 for code in self.distribution_types.keys()}
         
@@ -275,19 +324,21 @@ class DistributionService:
         
         return results
     
-    def get_distribution_status_by_year(self, student_id: int, year: str) -> Dict[str, Any]:
+    def get_distribution_status_by_year(self, student_id: int, year: str,
+                                        context: Optional[StudentContext] = None) -> Dict[str, Any]:
         """
         Get a student's distribution requirement status for a specific year.
         
         Args:
             student_id: The student ID
             year: The academic year (Freshman, Sophomore, etc.)
+            context: Optional request context of the student
             
         Returns:
             Dictionary with distribution status for the specified year
         """
         # Get overall status first (more efficient than duplicating code)
-        status = self.get_student_distribution_status(student_id)
+        status = self.get_student_distribution_status(student_id, context)
         
         # Extract just the requested year's details
         if year not in status['year_progress']:
@@ -5,6 +5,7 @@ from typing import Dict, Any, List, Optional
 from repositories.major_repository import MajorRepository
 from repositories.course_repository import CourseRepository
 from models.major import MajorRequirementsResponse, MajorCoursesResponse
+from utils.fieldsets import select_clause
 
 
 class MajorService:
@@ -95,13 +96,15 @@ class MajorService:
             'requirements': requirements_with_groups
         }
     
-    def get_major_courses(self, major_id: int, requirement_type: Optional[str] = None) -> Dict[str, Any]:
+    def get_major_courses(self, major_id: int, requirement_type: Optional[str] = None,
+                          fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get all courses that can fulfill requirements for a specific major.
         
         Args:
             major_id: The major ID
             requirement_type: Optional requirement type to filter by
+            fields: Optional course fields to select (all fields if not given)
             
         Returns:
             Dictionary with major version information and courses
@@ -145,12 +148,10 @@ class MajorService:
         if not all_course_ids:
             raise ValueError(f"No courses found for this major")
         
-        # Get course details
-        course_details = []
-        for course_id in all_course_ids:
-            course = self.course_repo.get_by_id(course_id)
-            if course:
-                course_details.append(course)
+        # Get course details in one query, selecting only the requested fields
+        courses = self.course_repo.get_by_ids(list(all_course_ids), select_clause(fields))
+        courses_by_id = {course['course_id']: course for course in courses}
+        course_details = [courses_by_id[course_id] for course_id in all_course_ids if course_id in courses_by_id]
         
         return {
             'major_version': major_version,
@@ -0,0 +1,163 @@
+"""Service for checking course plans and enrollments against prerequisites."""
+
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+from services.course_catalog import CourseCatalog
+from utils.term_utils import parse_term
+
+
+class PlanValidationService:
+    """
+    Prerequisite checks for a student's enrollments and course plans.
+
+    Checks read the catalog's in-memory prerequisite graph and the rows the
+    caller already holds (usually from the request's StudentContext), so they
+    do no I/O. Completed enrollments satisfy prerequisites in every term;
+    in-progress enrollments and plans satisfy them from the following term on,
+    or in the same term where the prerequisite allows concurrent enrollment.
+    Withdrawn enrollments are ignored.
+    """
+
+    def __init__(self, course_catalog: CourseCatalog):
+        """
+        Initialize with the course catalog.
+
+        Args:
+            course_catalog: Shared in-memory course catalog
+        """
+        self.catalog = course_catalog
+
+    def _taken_masks(self, enrollments: List[Dict[str, Any]],
+                     plans: List[Dict[str, Any]]) -> Tuple[int, Dict[Tuple[int, int], int]]:
+        """
+        Get the bitmaps of the courses a student has completed and takes in each term.
+
+        In-progress enrollments with an unrecognized term count as completed;
+        plans with an unrecognized term are left out.
+
+        Returns:
+            Tuple of (completed bitmap, bitmap of courses by parsed term)
+        """
+        positions = self.catalog.prerequisite_graph.positions
+
+        completed = 0
+        by_term: Dict[Tuple[int, int], int] = defaultdict(int)
+        for enrollment in enrollments:
+            position = positions.get(enrollment['course_id'])
+            status = enrollment.get('status')
+            if position is None or status not in ('Completed', 'Enrolled'):
+                continue
+
+            term = parse_term(enrollment.get('term_taken')) if status == 'Enrolled' else None
+            if term is None:
+                completed |= 1 << position
+            else:
+                by_term[term] |= 1 << position
+
+        for plan in plans:
+            position = positions.get(plan['course_id'])
+            term = parse_term(plan.get('intended_term'))
+            if position is not None and term is not None:
+                by_term[term] |= 1 << position
+
+        return completed, by_term
+
+    def _summary(self, course_id: int) -> Dict[str, Any]:
+        """Get the course ID, code and title of a catalog course."""
+        course = self.catalog.get(course_id) or {'course_id': course_id}
+        return {key: course.get(key) for key in ('course_id', 'subject_code', 'course_number', 'course_title')}
+
+    def validate_plans(self, enrollments: List[Dict[str, Any]],
+                       plans: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Check every course plan of a student against its prerequisites.
+
+        Plans are grouped by their parsed intended_term and the terms walked in
+        order, carrying a bitmap of the courses taken so far, so each plan is
+        checked with a few bitmap operations.
+
+        Args:
+            enrollments: The student's enrollments (course_id, term_taken, status)
+            plans: The student's course plans (plan_id, course_id, intended_term)
+
+        Returns:
+            Dictionary with 'valid' and the list of 'violations', in term
+            order; each violation names the plan and either its missing
+            prerequisites (with the term each is planned for, if any) or an
+            unrecognized intended_term
+        """
+        graph = self.catalog.prerequisite_graph
+        completed, by_term = self._taken_masks(enrollments, plans)
+
+        violations = []
+        plans_by_term: Dict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
+        planned_terms: Dict[int, Tuple[Tuple[int, int], str]] = {}
+        for plan in plans:
+            term = parse_term(plan.get('intended_term'))
+            if term is None:
+                violations.append({
+                    'plan_id': plan.get('plan_id'),
+                    'course_id': plan['course_id'],
+                    'intended_term': plan.get('intended_term'),
+                    'reason': 'unrecognized_term'
+                })
+                continue
+
+            plans_by_term[term].append(plan)
+            planned = planned_terms.get(plan['course_id'])
+            if planned is None or term < planned[0]:
+                planned_terms[plan['course_id']] = (term, plan['intended_term'])
+
+        # Walk the terms in order; only the distinct terms are sorted
+        taken = completed
+        for term in sorted(by_term):
+            same_term = by_term[term]
+            for plan in plans_by_term.get(term, ()):
+                missing = graph.missing(plan['course_id'], taken, same_term)
+                if missing:
+                    violations.append({
+                        'plan_id': plan.get('plan_id'),
+                        'course_id': plan['course_id'],
+                        'intended_term': plan['intended_term'],
+                        'reason': 'missing_prerequisites',
+                        'missing_prerequisites': [
+                            dict(self._summary(prereq_id), planned_term=planned_terms.get(prereq_id, (None, None))[1])
+                            for prereq_id in graph.ids(missing)
+                        ]
+                    })
+            taken |= same_term
+
+        return {
+            'valid': not violations,
+            'violations': violations
+        }
+
+    def check_course(self, course_id: int, term: Optional[str], enrollments: List[Dict[str, Any]],
+                     plans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Get the prerequisites a student would be missing to take a course in a term.
+
+        Args:
+            course_id: The course ID
+            term: The term the course would be taken in; if not recognized,
+                only completed and in-progress courses count
+            enrollments: The student's enrollments (course_id, term_taken, status)
+            plans: The student's course plans (course_id, intended_term)
+
+        Returns:
+            List of the missing direct prerequisites (empty if the course can be taken)
+        """
+        graph = self.catalog.prerequisite_graph
+        parsed = parse_term(term)
+
+        # Without a term, plans cannot be placed before the course
+        completed, by_term = self._taken_masks(enrollments, plans if parsed is not None else [])
+
+        taken = completed
+        for term_key, mask in by_term.items():
+            if parsed is None or term_key < parsed:
+                taken |= mask
+        same_term = by_term.get(parsed, 0) if parsed is not None else 0
+
+        return [self._summary(prereq_id) for prereq_id in graph.ids(graph.missing(course_id, taken, same_term))]
@@ -5,47 +5,86 @@ from typing import Dict, Any, List, Optional
 from repositories.student_repository import StudentRepository
 from repositories.course_repository import CourseRepository
 from models.student import StudentResponse
+from utils.auth_cache import AuthCache
+from utils.fieldsets import select_clause
+from utils.student_context import StudentContext
+from utils.validation import BatchValidationError
 
 
 class StudentService:
     """Service for student-related functionality."""
     
-    def __init__(self, student_repository: StudentRepository, course_repository: CourseRepository):
+    # Course plan fields a batch update may change
+    PLAN_FIELDS = ('intended_term', 'priority', 'notes')
+    
+    def __init__(self, student_repository: StudentRepository, course_repository: CourseRepository,
+                 auth_cache: Optional[AuthCache] = None):
         """
         Initialize with repositories.
         
         Args:
             student_repository: Repository for student data
             course_repository: Repository for course data
+            auth_cache: Optional authentication cache to invalidate on login/logout
         """
         self.student_repo = student_repository
         self.course_repo = course_repository
+        self.auth_cache = auth_cache
     
-    def get_student_info(self, net_id: str) -> Dict[str, Any]:
+    def set_logged_in(self, net_id: str, logged: bool) -> Dict[str, Any]:
         """
-        Get comprehensive information about a student.
+        Mark a student as logged in or out, invalidating their cached authentication.
         
         Args:
             net_id: The student's NetID
+            logged: Whether the student is logged in
             
         Returns:
-            Dictionary with student information, declared majors, and course enrollments
+            Dictionary representing the updated student
             
         Raises:
             ValueError: If the student is not found
         """
-        # Get student by NetID
-        student = self.student_repo.get_by_net_id(net_id)
+        student = self.student_repo.set_logged(net_id, logged)
+        
+        if self.auth_cache is not None:
+            self.auth_cache.invalidate(net_id)
+        
         if not student:
             raise ValueError(f"No student found with NetID: {net_id}")
         
-        student_id = student['student_id']
+        return student
+    
+    def get_student_info(self, net_id: str, context: Optional[StudentContext] = None) -> Dict[str, Any]:
+        """
+        Get comprehensive information about a student.
+        
+        Args:
+            net_id: The student's NetID
+            context: Optional request context of the authenticated student, used
+                instead of looking the student up again
+            
+        Returns:
+            Dictionary with student information, declared majors, and course enrollments
+            
+        Raises:
+            ValueError: If the student is not found
+        """
+        if context is None:
+            # Get student by NetID
+            student = self.student_repo.get_by_net_id(net_id)
+            if not student:
+                raise ValueError(f"No student found with NetID: {net_id}")
+            
+            context = StudentContext(student, self.student_repo)
+        
+        student = context.student
         
         # Get student's declared majors
-        majors = self.student_repo.get_declared_majors(student_id)
+        majors = context.majors
         
         # Get student's course enrollments
-        enrollments = self.student_repo.get_course_enrollments(student_id)
+        enrollments = context.enrollments()
         
         # Enhance enrollments with course details
         enrollments_with_details = []
@@ -59,7 +98,7 @@ class StudentService:
                 enrollments_with_details.append(enrollment_with_details)
         
         # Get student's course plans
-        plans = self.student_repo.get_course_plans(student_id)
+        plans = context.plans
         
         # Enhance plans with course details
         plans_with_details = []
@@ -82,24 +121,31 @@ class StudentService:
         
         return result
     
-    def get_student_enrollments(self, student_id: int, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_student_enrollments(self, student_id: int, status: Optional[str] = None,
+                                fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all course enrollments for a student with course details.
         
         Args:
             student_id: The student's ID
             status: Optional enrollment status to filter by
+            fields: Optional course fields to include in the course details
             
         Returns:
             List of dictionaries representing the student's course enrollments with course details
         """
         enrollments = self.student_repo.get_course_enrollments(student_id, status)
         
+        # Fetch the course details of all enrollments in one query
+        course_ids = list({enrollment['course_id'] for enrollment in enrollments})
+        courses = self.course_repo.get_by_ids(course_ids, select_clause(fields))
+        courses_by_id = {course['course_id']: course for course in courses}
+        
         # Enhance enrollments with course details
         enrollments_with_details = []
         for enrollment in enrollments:
             course_id = enrollment['course_id']
-            course = self.course_repo.get_by_id(course_id)
+            course = courses_by_id.get(course_id)
             
             if course:
                 enrollment_with_details = enrollment.copy()
@@ -108,6 +154,155 @@ class StudentService:
         
         return enrollments_with_details
     
+    def apply_plan_operations(self, student_id: int, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Apply a batch of course plan creates, updates and deletes.
+        
+        Ownership of every referenced plan is checked against one read of the
+        student's plans; then deletes, updates and creates are written in one
+        transaction by a single database function call. Updates only set the
+        given fields, so a plan deleted concurrently is never recreated.
+        
+        Args:
+            student_id: The student's ID
+            operations: Operation dictionaries with 'op' ('create', 'update' or
+                'delete'), 'plan_id' for updates and deletes, and the plan fields
+                to set ('course_id' and 'intended_term' are required for creates)
+                
+        Returns:
+            Dictionary with the created, updated and deleted counts and the
+            student's resulting course plans
+            
+        Raises:
+            BatchValidationError: If an operation references a plan the student
+                does not own, or the same plan more than once (nothing is written)
+        """
+        plans = {plan['plan_id']: plan for plan in self.student_repo.get_course_plans(student_id)}
+        
+        # Check ownership of all referenced plans before writing anything
+        errors = []
+        referenced = set()
+        for index, operation in enumerate(operations):
+            if operation['op'] == 'create':
+                continue
+            
+            plan_id = operation['plan_id']
+            if plan_id not in plans:
+                message = f'No course plan found with ID {plan_id} for this student'
+            elif plan_id in referenced:
+                message = f'Course plan {plan_id} appears in more than one operation'
+            else:
+                message = None
+            
+            if message:
+                errors.append({'index': index, 'field': 'plan_id', 'message': message})
+            referenced.add(plan_id)
+        
+        if errors:
+            raise BatchValidationError(errors, len(operations))
+        
+        to_create = []
+        to_update = []
+        to_delete = []
+        update_indexes = {}
+        for index, operation in enumerate(operations):
+            changes = {field: operation[field] for field in self.PLAN_FIELDS if field in operation}
+            
+            if operation['op'] == 'create':
+                to_create.append({
+                    'course_id': operation['course_id'],
+                    'intended_term': operation['intended_term'],
+                    'priority': operation.get('priority'),
+                    'notes': operation.get('notes')
+                })
+            elif operation['op'] == 'update':
+                to_update.append({'plan_id': operation['plan_id'], **changes})
+                update_indexes[operation['plan_id']] = index
+            else:
+                to_delete.append(operation['plan_id'])
+        
+        try:
+            result = self.student_repo.apply_course_plan_operations(student_id, to_delete, to_update, to_create)
+        except LookupError as e:
+            # A plan to update was deleted after the ownership check; the batch was rolled back
+            plan_id = e.args[0]
+            raise BatchValidationError([{
+                'index': update_indexes.get(plan_id),
+                'field': 'plan_id',
+                'message': f'No course plan found with ID {plan_id} for this student'
+            }], len(operations))
+        
+        for plan_id in to_delete:
+            plans.pop(plan_id, None)
+        for plan in result['updated']:
+            plans[plan['plan_id']] = plan
+        
+        return {
+            'created': len(result['created']),
+            'updated': len(result['updated']),
+            'deleted': result['deleted'],
+            'plans': list(plans.values()) + result['created']
+        }
+    
+    def update_enrollment_grades(self, student_id: int, changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply grade and status changes to several enrollments.
+        
+        Enrollments are read once; all of those that change are then updated
+        in one statement by a single database function call, which writes only
+        the grade and status columns and is scoped to the student.
+        
+        Args:
+            student_id: The student's ID
+            changes: Dictionaries with 'enrollment_id' and the 'grade' and/or
+                'status' to set
+                
+        Returns:
+            One result per change, in order, with the enrollment_id, the outcome
+            ('updated', 'unchanged' or 'not_found') and the resulting enrollment
+        """
+        enrollment_ids = [change['enrollment_id'] for change in changes]
+        enrollments = {
+            enrollment['enrollment_id']: enrollment
+            for enrollment in self.student_repo.get_enrollments_by_ids(student_id, enrollment_ids)
+        }
+        
+        to_write = []
+        for change in changes:
+            enrollment = enrollments.get(change['enrollment_id'])
+            if enrollment is None:
+                continue
+            
+            fields = {field: change[field] for field in ('grade', 'status') if field in change}
+            if any(enrollment.get(field) != value for field, value in fields.items()):
+                to_write.append({'enrollment_id': change['enrollment_id'], **fields})
+        
+        written = {
+            enrollment['enrollment_id']: enrollment
+            for enrollment in self.student_repo.apply_enrollment_grade_changes(student_id, to_write)
+        }
+        pending = {change['enrollment_id'] for change in to_write}
+        
+        results = []
+        for enrollment_id in enrollment_ids:
+            if enrollment_id in written:
+                results.append({
+                    'enrollment_id': enrollment_id,
+                    'result': 'updated',
+                    'enrollment': written[enrollment_id]
+                })
+            elif enrollment_id not in enrollments or enrollment_id in pending:
+                # Missing, or deleted before the update matched it
+                results.append({'enrollment_id': enrollment_id, 'result': 'not_found'})
+            else:
+                results.append({
+                    'enrollment_id': enrollment_id,
+                    'result': 'unchanged',
+                    'enrollment': enrollments[enrollment_id]
+                })
+        
+        return results
+    
     def calculate_student_gpa(self, student_id: int) -> float:
         """
         Calculate the GPA for a student based on completed courses.
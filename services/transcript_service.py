@@ -0,0 +1,178 @@
+"""Service for importing a student's transcript as course enrollments."""
+
+import csv
+import io
+import re
+from typing import Dict, Any, List, Optional, Union
+
+from pydantic import BaseModel
+
+from repositories.student_repository import StudentRepository
+from services.course_service import CourseService
+from utils.validation import BatchValidator, BatchValidationError
+
+
+# "CPSC 201", "cpsc201", "MATH 120L"
+COURSE_CODE_PATTERN = re.compile(r'^\s*([A-Za-z&]+)\s*([0-9][0-9A-Za-z]*)\s*$')
+
+
+class TranscriptRow(BaseModel):
+    """Schema for one row of an imported transcript."""
+    course: Union[int, str]  # course_id or "SUBJ NUM" code
+    term: str
+    grade: Optional[str] = None
+    status: str = "Completed"
+
+
+class TranscriptService:
+    """
+    Idempotent import of a whole transcript.
+
+    Rows are matched to courses through the course service, compared with
+    the student's existing enrollments and written with one chunked upsert on
+    (student_id, course_id, term_taken), so replaying an import changes nothing.
+    """
+
+    def __init__(self, student_repository: StudentRepository, course_service: CourseService,
+                 chunk_size: int = 500):
+        """
+        Initialize with repositories.
+
+        Args:
+            student_repository: Repository for student data
+            course_service: Course service (and its in-memory catalog) for resolving courses
+            chunk_size: Maximum number of rows written per upsert request
+        """
+        self.student_repo = student_repository
+        self.course_service = course_service
+        self.catalog = course_service.catalog
+        self.chunk_size = chunk_size
+        self.row_validator = BatchValidator(TranscriptRow)
+
+    @staticmethod
+    def parse_csv(text: str) -> List[Dict[str, Any]]:
+        """
+        Parse a CSV transcript with a header row (course, term, grade, status).
+
+        Args:
+            text: The CSV document
+
+        Returns:
+            List of row dictionaries (empty cells are left out, so defaults apply)
+        """
+        # Spreadsheet exports often start with a byte order mark
+        if text.startswith('\ufeff'):
+            text = text[1:]
+
+        reader = csv.DictReader(io.StringIO(text))
+        return [
+            {key.strip().lower(): value.strip() for key, value in row.items() if key and value and value.strip()}
+            for row in reader
+        ]
+
+    @staticmethod
+    def _parse_course_id(course: Union[int, str]) -> Optional[int]:
+        """Get the course ID a course reference names, or None if it is a code."""
+        if isinstance(course, int):
+            return course
+        course = course.strip()
+        return int(course) if course.isascii() and course.isdigit() else None
+
+    def resolve_courses(self, courses: List[Union[int, str]]) -> List[Optional[int]]:
+        """
+        Resolve course references to course IDs.
+
+        Course IDs are checked with CourseService.get_courses_by_ids, so courses
+        added since the catalog snapshot was loaded are found with one query;
+        codes are resolved through the in-memory catalog.
+
+        Args:
+            courses: Course IDs, or "SUBJ NUM" codes
+
+        Returns:
+            The course ID of each reference, in order (None if no such course exists)
+        """
+        course_ids = [self._parse_course_id(course) for course in courses]
+        known = self.course_service.get_courses_by_ids(
+            [course_id for course_id in course_ids if course_id is not None]
+        )
+
+        resolved = []
+        for course, course_id in zip(courses, course_ids):
+            if course_id is not None:
+                resolved.append(course_id if course_id in known else None)
+                continue
+
+            match = COURSE_CODE_PATTERN.match(course)
+            found = self.catalog.get_by_code(match.group(1), match.group(2)) if match else None
+            resolved.append(found['course_id'] if found else None)
+        return resolved
+
+    def import_transcript(self, student_id: int, rows: Any) -> Dict[str, Any]:
+        """
+        Import transcript rows as enrollments of a student.
+
+        A row whose course and term already have an enrollment with the same
+        grade and status is skipped; one with a different grade or status
+        updates it; any other row is inserted. If the same course and term
+        appear more than once, the last row wins.
+
+        Args:
+            student_id: The student's ID
+            rows: The raw transcript rows (dictionaries with course, term, grade, status)
+
+        Returns:
+            Dictionary with the inserted, updated and skipped counts and the
+            written enrollments
+
+        Raises:
+            BatchValidationError: If any row is invalid or names an unknown course
+                (nothing is written)
+        """
+        transcript = self.row_validator.validate(rows)
+
+        # Resolve all courses at once, reporting every unknown one
+        course_ids = self.resolve_courses([row.course for row in transcript])
+        unknown_courses = [
+            {'index': index, 'field': 'course', 'message': f'Course {row.course} not found'}
+            for index, (row, course_id) in enumerate(zip(transcript, course_ids)) if course_id is None
+        ]
+        if unknown_courses:
+            raise BatchValidationError(unknown_courses, len(transcript))
+
+        # Dedupe on the natural key; later rows replace earlier ones
+        wanted: Dict[tuple, Dict[str, Any]] = {}
+        for row, course_id in zip(transcript, course_ids):
+            wanted[(course_id, row.term)] = {
+                'student_id': student_id,
+                'course_id': course_id,
+                'term_taken': row.term,
+                'grade': row.grade,
+                'status': row.status
+            }
+
+        existing = {
+            (enrollment['course_id'], enrollment['term_taken']): enrollment
+            for enrollment in self.student_repo.get_course_enrollments(student_id)
+        }
+
+        to_write = []
+        inserted = updated = 0
+        for key, enrollment in wanted.items():
+            current = existing.get(key)
+            if current is None:
+                inserted += 1
+            elif current.get('grade') != enrollment['grade'] or current.get('status') != enrollment['status']:
+                updated += 1
+            else:
+                continue
+            to_write.append(enrollment)
+
+        written = self.student_repo.upsert_enrollments(to_write, self.chunk_size) if to_write else []
+
+        return {
+            'inserted': inserted,
+            'updated': updated,
+            'skipped': len(transcript) - inserted - updated,
+            'enrollments': written
+        }
@@ -1,4 +1,4 @@
 """Utility functions for the Yale Degree Audit application."""
 
-from .grade_utils import meets_min_grade, calculate_gpa, extract_course_level
+from .grade_utils import meets_min_grade, calculate_gpa, extract_course_level, course_level_band
 from .auth import auth_required
@@ -1,36 +1,190 @@
+"""Authentication of API requests by session token or NetID header."""
+
+import logging
+import threading
 from functools import wraps
-from flask import request, jsonify, current_app
+from typing import Any, Dict, Optional
 
-def auth_required(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
+from flask import g, request, jsonify, current_app
+
+from repositories.student_repository import StudentRepository
+from utils.auth_cache import AuthCache
+from utils.session_tokens import SessionTokenSigner
+
+logger = logging.getLogger(__name__)
+
+
+def parse_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Get the token of an Authorization header value, if it uses the Bearer scheme."""
+    scheme, _, token = (authorization or '').partition(' ')
+    if scheme.lower() != 'bearer' or not token.strip():
+        return None
+    return token.strip()
+
+
+def get_bearer_token() -> Optional[str]:
+    """Get the session token from the Authorization header, if any."""
+    return parse_bearer_token(request.headers.get('Authorization'))
+
+
+class Authenticator:
+    """
+    Single authentication path shared by the before_request middleware and
+    the auth_required decorator.
+    
+    The first call during a request resolves the principal and stores the
+    outcome on flask.g; later calls in the same request return the stored
+    outcome, so the students table is queried at most once per request. On
+    success, request.student holds the student (only the IDs for session
+    tokens) and request.session_token holds the token claims, if any.
+    """
+    
+    # Error body for a session token that fails verification
+    TOKEN_REJECTED = {
+        'error': 'Unauthorized',
+        'message': 'Session token is invalid, expired or revoked'
+    }
+    
+    def __init__(self, student_repository: StudentRepository, auth_cache: AuthCache,
+                 session_tokens: Optional[SessionTokenSigner] = None):
+        """
+        Initialize with the student repository and shared caches.
+        
+        Args:
+            student_repository: Repository used to look up logged-in students
+            auth_cache: Cache of NetID lookups
+            session_tokens: Signer for session tokens, or None if token mode is disabled
+        """
+        self.student_repo = student_repository
+        self.auth_cache = auth_cache
+        self.session_tokens = session_tokens
+        
+        self._lock = threading.Lock()
+        self._counts = {'token': 0, 'cache': 0, 'database': 0, 'rejected': 0, 'errors': 0}
+    
+    def authenticate(self):
+        """
+        Authenticate the current request, once.
+        
+        Returns:
+            None if the request is authenticated, otherwise the error response
+        """
+        if 'auth_error' not in g:
+            g.auth_error = self._authenticate()
+        return g.auth_error
+    
+    def record(self, outcome: str) -> None:
+        """
+        Increment an outcome counter.
+        
+        Args:
+            outcome: 'token', 'cache', 'database', 'rejected' or 'errors'
+        """
+        with self._lock:
+            self._counts[outcome] += 1
+    
+    def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a session token and count the outcome.
+        
+        Shared by the Flask middleware and the ASGI application.
+        
+        Args:
+            token: The Bearer token of the request
+            
+        Returns:
+            The token's claims, or None if the token is rejected
+        """
+        try:
+            claims = self.session_tokens.verify(token)
+        except Exception as e:
+            logger.warning("Session token verification failed: %s", str(e))
+            claims = None
+        
+        self.record('token' if claims is not None else 'rejected')
+        return claims
+    
+    @staticmethod
+    def token_student(claims: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the student IDs carried by verified token claims."""
+        return {'student_id': claims['sid'], 'net_id': claims['net']}
+    
+    def _authenticate(self):
+        """Resolve the principal of the current request."""
+        # Session tokens are verified without touching the database
+        token = get_bearer_token()
+        if token and self.session_tokens is not None:
+            claims = self.verify_token(token)
+            if claims is None:
+                return jsonify(self.TOKEN_REJECTED), 401
+            
+            # Only the IDs are known; the student context loads the row if needed
+            request.session_token = claims
+            request.student = self.token_student(claims)
+            return None
+        
         # Get student NetID from header
         net_id = request.headers.get('X-Student-NetID')
         
         if not net_id:
+            self.record('rejected')
             return jsonify({
                 'error': 'Unauthorized',
                 'message': 'Authentication required. Please provide X-Student-NetID header'
             }), 401
         
-        # Get Supabase client
-        supabase = current_app.config['supabase']
-        
-        # Check if student exists and is logged in
-        response = supabase.table('students')\
-            .select('*')\
-            .eq('net_id', net_id)\
-            .eq('logged', True)\
-            .execute()
+        try:
+            # Check the cache before asking the database
+            student = self.auth_cache.get(net_id)
+            
+            if student is AuthCache.MISS:
+                self.record('database')
+                student = self.student_repo.get_logged_in(net_id)
+                self.auth_cache.set(net_id, student)
+            else:
+                self.record('cache')
+            
+            if student is None:
+                self.record('rejected')
+                return jsonify({
+                    'error': 'Unauthorized',
+                    'message': 'User is not logged in or does not exist'
+                }), 401
+            
+            # Store the student data in request for later use
+            request.student = student
+            return None
         
-        if not response.data:
+        except Exception as e:
+            self.record('errors')
+            current_app.logger.error("Authentication error: %s", str(e))
             return jsonify({
-                'error': 'Unauthorized',
-                'message': 'User is not logged in or does not exist'
-            }), 401
+                'error': 'Authentication error',
+                'message': 'An error occurred during authentication'
+            }), 500
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get authentication counters.
         
-        # Store the student data in request for later use
-        request.student = response.data[0]
+        Returns:
+            Dictionary with the number of requests resolved per path (token,
+            cache, database), rejected and failed, plus the cache hit/miss counts
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        counts['cache_hits'] = self.auth_cache.hits
+        counts['cache_misses'] = self.auth_cache.misses
+        return counts
+
+
+def auth_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        # Reuses the middleware's result when it already ran for this request
+        error = current_app.authenticator.authenticate()
+        if error is not None:
+            return error
         
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
@@ -0,0 +1,104 @@
+"""Short-lived cache of authentication lookups keyed by NetID."""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class AuthCache:
+    """
+    TTL cache of the logged-in student row for each NetID.
+
+    Unknown or logged-out NetIDs are cached too (as None) with their own, shorter
+    TTL, so repeated requests with a bad header do not reach the database either.
+    Entries must be invalidated explicitly when a student's `logged` flag changes;
+    changes made outside this application are picked up when the TTL expires.
+    """
+
+    # Returned by get() when there is no usable entry
+    MISS = object()
+
+    def __init__(self, ttl: float = 30, negative_ttl: float = 5, max_size: int = 10000):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an authenticated student stays cached (0 disables caching)
+            negative_ttl: Seconds an unknown or logged-out NetID stays cached
+            max_size: Maximum number of cached NetIDs
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+        # Counters for monitoring the hit rate
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, net_id: str) -> Any:
+        """
+        Get the cached lookup result for a NetID.
+
+        Args:
+            net_id: The student's NetID
+
+        Returns:
+            The cached student dictionary, None if the NetID is cached as not
+            authenticated, or AuthCache.MISS if there is no fresh entry
+        """
+        with self._lock:
+            entry = self._entries.get(net_id)
+            if entry is not None:
+                expires_at, student = entry
+                if expires_at > time.monotonic():
+                    self.hits += 1
+                    return student
+                del self._entries[net_id]
+
+            self.misses += 1
+            return self.MISS
+
+    def set(self, net_id: str, student: Optional[Dict[str, Any]]) -> None:
+        """
+        Cache the lookup result for a NetID.
+
+        Args:
+            net_id: The student's NetID
+            student: The logged-in student, or None if the NetID is not authenticated
+        """
+        ttl = self.ttl if student is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if net_id not in self._entries and len(self._entries) >= self.max_size:
+                self._evict()
+            self._entries[net_id] = (time.monotonic() + ttl, student)
+
+    def invalidate(self, net_id: str) -> None:
+        """
+        Drop the cached entry for a NetID (e.g. after its `logged` flag changed).
+
+        Args:
+            net_id: The student's NetID
+        """
+        with self._lock:
+            self._entries.pop(net_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        """Remove expired entries, or the oldest entry if none have expired."""
+        now = time.monotonic()
+        expired = [net_id for net_id, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for net_id in expired:
+            del self._entries[net_id]
+
+        if not expired and self._entries:
+            del self._entries[next(iter(self._entries))]
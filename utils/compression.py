@@ -0,0 +1,133 @@
+"""Negotiated response compression (gzip, deflate and, if installed, brotli)."""
+
+import gzip
+import zlib
+from typing import Optional
+
+from flask import Response, request, current_app
+from werkzeug.datastructures import Accept
+
+try:
+    import brotli
+except ImportError:  # brotli is optional
+    brotli = None
+
+
+# Encodings in order of preference when the client accepts several equally
+ENCODINGS = ('br', 'gzip', 'deflate') if brotli is not None else ('gzip', 'deflate')
+
+# Mimetypes worth compressing
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/plain', 'text/html', 'text/csv')
+
+
+def negotiate_encoding(accept_encodings: Optional[Accept] = None) -> Optional[str]:
+    """
+    Pick the content coding for the current request from its Accept-Encoding.
+
+    Args:
+        accept_encodings: The parsed Accept-Encoding header (defaults to the
+            current request's)
+
+    Returns:
+        'br', 'gzip' or 'deflate', or None if compression is disabled or the
+        client accepts none of them
+    """
+    if not current_app.config['COMPRESSION_ENABLED']:
+        return None
+
+    if accept_encodings is None:
+        accept_encodings = request.accept_encodings
+
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress a response body.
+
+    Args:
+        data: The uncompressed body
+        encoding: 'br', 'gzip' or 'deflate'
+
+    Returns:
+        The compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=current_app.config['COMPRESSION_BROTLI_QUALITY'])
+    if encoding == 'gzip':
+        # mtime=0 keeps the output identical for identical input
+        return gzip.compress(data, compresslevel=current_app.config['COMPRESSION_LEVEL'], mtime=0)
+    if encoding == 'deflate':
+        return zlib.compress(data, current_app.config['COMPRESSION_LEVEL'])
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def should_compress(response: Response) -> bool:
+    """
+    Check whether a response is eligible for compression.
+
+    Args:
+        response: The response
+
+    Returns:
+        True for complete, uncompressed 200 responses with a compressible
+        mimetype and a body of at least COMPRESSION_MIN_SIZE bytes
+    """
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and 'Content-Encoding' not in response.headers
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+        and response.content_length is not None
+        and response.content_length >= current_app.config['COMPRESSION_MIN_SIZE']
+    )
+
+
+def set_encoded_body(response: Response, data: bytes, encoding: str) -> None:
+    """
+    Replace a response body with its compressed form and set the headers.
+
+    A strong ETag on the response gets the encoding appended, since the
+    compressed bytes are a different representation.
+
+    Args:
+        response: The response
+        data: The compressed body
+        encoding: The content coding of `data`
+    """
+    response.set_data(data)
+    response.headers['Content-Encoding'] = encoding
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f"{etag}-{encoding}")
+
+
+def compress_response(response: Response) -> Response:
+    """
+    after_request hook compressing eligible responses.
+
+    Args:
+        response: The response
+
+    Returns:
+        The (possibly compressed) response
+    """
+    if not current_app.config['COMPRESSION_ENABLED'] or response.is_streamed:
+        return response
+
+    if response.mimetype in COMPRESSIBLE_MIMETYPES:
+        response.vary.add('Accept-Encoding')
+
+    if should_compress(response):
+        encoding = negotiate_encoding()
+        if encoding:
+            set_encoded_body(response, compress(response.get_data(), encoding), encoding)
+
+    return response
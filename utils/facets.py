@@ -0,0 +1,112 @@
+"""Bitmap-based facet index for filtering and counting catalog rows in memory."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def iter_bits(bitmap: int) -> Iterator[int]:
+    """
+    Iterate over the positions of the set bits of a bitmap, lowest first.
+
+    Args:
+        bitmap: The bitmap (a non-negative int)
+
+    Yields:
+        int: Position of each set bit
+    """
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+class FacetIndex:
+    """
+    Per-facet-value bitmaps over a fixed list of rows.
+
+    Bit i of a value's bitmap is set when row i has that value. Filters are
+    OR-ed within a facet and AND-ed across facets; counts for a facet apply the
+    filters of every other facet, so clients can see how many rows each
+    alternative value would match.
+    """
+
+    def __init__(self, facet_names: Iterable[str], size: int):
+        """
+        Initialize an empty index.
+
+        Args:
+            facet_names: Names of the facets (e.g. 'subject_code', 'level')
+            size: Number of rows the bitmaps cover
+        """
+        self.facet_names = list(facet_names)
+        self.size = size
+        self.all_rows = (1 << size) - 1
+        self._bitmaps: Dict[str, Dict[str, int]] = {name: {} for name in self.facet_names}
+
+    def add(self, position: int, values: Dict[str, Iterable[str]]) -> None:
+        """
+        Record the facet values of one row.
+
+        Args:
+            position: The row's position (0 <= position < size)
+            values: Mapping of facet name to the row's values for that facet
+        """
+        bit = 1 << position
+        for name in self.facet_names:
+            bitmaps = self._bitmaps[name]
+            for value in values.get(name, ()):
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+
+    def _facet_filter(self, name: str, selected: Optional[List[str]]) -> int:
+        """Get the bitmap of rows matching any selected value of one facet."""
+        if not selected:
+            return self.all_rows
+
+        bitmaps = self._bitmaps[name]
+        result = 0
+        for value in selected:
+            result |= bitmaps.get(value, 0)
+        return result
+
+    def filter(self, selections: Dict[str, Optional[List[str]]]) -> int:
+        """
+        Get the bitmap of rows matching all facet selections.
+
+        Args:
+            selections: Mapping of facet name to the selected values (empty means no filter)
+
+        Returns:
+            int: Bitmap of matching rows
+        """
+        result = self.all_rows
+        for name in self.facet_names:
+            result &= self._facet_filter(name, selections.get(name))
+        return result
+
+    def counts(self, selections: Dict[str, Optional[List[str]]]) -> Dict[str, Dict[str, int]]:
+        """
+        Count matching rows per facet value under the current selections.
+
+        Args:
+            selections: Mapping of facet name to the selected values
+
+        Returns:
+            Mapping of facet name to {value: count}, omitting zero counts
+        """
+        facet_filters = {name: self._facet_filter(name, selections.get(name)) for name in self.facet_names}
+
+        result = {}
+        for name in self.facet_names:
+            # Apply every filter except this facet's own
+            others = self.all_rows
+            for other_name, other_filter in facet_filters.items():
+                if other_name != name:
+                    others &= other_filter
+
+            value_counts = {}
+            for value, bitmap in sorted(self._bitmaps[name].items()):
+                count = (bitmap & others).bit_count()
+                if count:
+                    value_counts[value] = count
+            result[name] = value_counts
+
+        return result
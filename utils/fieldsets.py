@@ -0,0 +1,91 @@
+"""Sparse fieldsets: parsing `?fields=` and projecting rows onto them."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from flask import request
+
+# Columns of the courses table that clients may select
+COURSE_FIELDS = (
+    'course_id', 'subject_code', 'course_number', 'course_title',
+    'description', 'credits', 'distribution'
+)
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str] = COURSE_FIELDS,
+                 always: Sequence[str] = ('course_id',)) -> Optional[List[str]]:
+    """
+    Parse a comma-separated `fields` query parameter.
+
+    Args:
+        raw: The parameter value (e.g. "course_id,course_title"), or None
+        allowed: Field names that may be selected
+        always: Fields included even if not requested (row identifiers)
+
+    Returns:
+        The selected fields in `allowed` order, or None if no selection was given
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not raw:
+        return None
+
+    requested = {name.strip() for name in raw.split(',') if name.strip()}
+    if not requested:
+        return None
+
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. "
+                         f"Must be among: {', '.join(allowed)}")
+
+    requested.update(always)
+    return [name for name in allowed if name in requested]
+
+
+def get_fields_arg(allowed: Sequence[str] = COURSE_FIELDS) -> Optional[List[str]]:
+    """
+    Parse the current request's `fields` query parameter.
+
+    Repeated parameters are merged (`?fields=a&fields=b` is `?fields=a,b`),
+    the same way the catalog ETag normalizes them.
+
+    Args:
+        allowed: Field names that may be selected
+
+    Returns:
+        The selected fields, or None if the parameter was not given
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    return parse_fields(','.join(request.args.getlist('fields')), allowed)
+
+
+def select_clause(fields: Optional[Iterable[str]]) -> str:
+    """
+    Build a PostgREST select clause for a fieldset.
+
+    Args:
+        fields: The selected fields, or None for all columns
+
+    Returns:
+        The select clause (e.g. "course_id,course_title" or "*")
+    """
+    return ','.join(fields) if fields else '*'
+
+
+def project(row: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Project a row onto a fieldset.
+
+    Args:
+        row: The row dictionary
+        fields: The selected fields, or None to keep the row as is
+
+    Returns:
+        A new dictionary with only the selected fields (or the row itself)
+    """
+    if fields is None:
+        return row
+    return {name: row[name] for name in fields if name in row}
@@ -77,3 +77,24 @@ def extract_course_level(course_number: str) -> Optional[int]:
     
     # Return the first 1-3 digits (course level)
     return int(digits[:3])
+
+
+def course_level_band(course_number: str) -> Optional[str]:
+    """
+    Get the level band of a course number ('100', '200', '300' or '400+').
+    
+    Args:
+        course_number: The course number string (e.g. '223', '490')
+        
+    Returns:
+        str: The level band, or None if no level can be extracted or it is below 100
+    """
+    level = extract_course_level(course_number or '')
+    
+    if level is None or level < 100:
+        return None
+    
+    if level >= 400:
+        return '400+'
+    
+    return str(level // 100 * 100)
@@ -0,0 +1,236 @@
+"""HTTP caching helpers for read-only catalog endpoints."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Optional, Sequence, Tuple
+
+from flask import request, current_app
+
+from utils.compression import ENCODINGS, COMPRESSIBLE_MIMETYPES, compress, negotiate_encoding, set_encoded_body
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded response bodies for read-only catalog endpoints.
+
+    Entries are keyed by ETag, which already covers the route, its recognized
+    arguments and the catalog version, and hold the body once per content
+    coding ('identity' plus any compressed variants served so far). The cache
+    is bounded both by the number of responses and by the total size of the
+    cached bodies; least recently used responses are evicted first. When the
+    catalog version changes, all entries are dropped at once.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (0 disables the cache)
+            max_bytes: Maximum total size of the cached bodies, all codings
+                included (0 disables the cache)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._entries: "OrderedDict[str, Tuple[str, Dict[str, bytes]]]" = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached bodies."""
+        return self._size
+
+    def _clear(self) -> None:
+        """Drop all entries (the lock must be held)."""
+        self._entries.clear()
+        self._size = 0
+
+    def get(self, version: str, etag: str, encoding: str = 'identity') -> Optional[Tuple[bytes, str]]:
+        """
+        Get a cached response body.
+
+        Args:
+            version: The current catalog version
+            etag: The response's ETag
+            encoding: The content coding of the body to get
+
+        Returns:
+            Tuple of (body, mimetype), or None if not cached
+        """
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+                return None
+
+            entry = self._entries.get(etag)
+            if entry is None or encoding not in entry[1]:
+                return None
+
+            self._entries.move_to_end(etag)
+            mimetype, bodies = entry
+            return bodies[encoding], mimetype
+
+    def set(self, version: str, etag: str, body: bytes, mimetype: str,
+            encoding: str = 'identity') -> None:
+        """
+        Cache a response body.
+
+        Args:
+            version: The catalog version the body was built from
+            etag: The response's ETag
+            body: The encoded response body
+            mimetype: The response's mimetype
+            encoding: The content coding of `body`
+        """
+        # A body that would fill the cache on its own is not worth evicting everything for
+        if self.max_entries <= 0 or len(body) > self.max_bytes // 4:
+            return
+
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+
+            if etag not in self._entries:
+                self._entries[etag] = (mimetype, {})
+            bodies = self._entries[etag][1]
+            self._size += len(body) - len(bodies.get(encoding, b''))
+            bodies[encoding] = body
+            self._entries.move_to_end(etag)
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= sum(len(evicted_body) for evicted_body in evicted.values())
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._clear()
+
+
+def get_catalog_version() -> str:
+    """
+    Get the version of the catalog data served by read-only endpoints.
+
+    Combines the configured CATALOG_VERSION (bumped when majors, requirements or
+    other reference data are re-imported) with the content hash of the in-memory
+    course catalog snapshot.
+
+    Returns:
+        The catalog version string
+    """
+    return f"{current_app.config['CATALOG_VERSION']}:{current_app.course_catalog.version}"
+
+
+def normalized_args(params: Sequence[str] = (), list_params: Sequence[str] = ()) -> str:
+    """
+    Get the current request's recognized query parameters in a canonical form.
+
+    Other parameters are ignored, so they cannot create new cache entries.
+
+    Args:
+        params: Single-valued parameters (the first value is used, stripped;
+            integers lose leading zeros)
+        list_params: Comma-separated multi-valued parameters (values are
+            deduplicated and sorted)
+
+    Returns:
+        The canonical parameter string
+    """
+    parts = []
+    for name in params:
+        value = (request.args.get(name) or '').strip()
+        if value.isascii() and value.isdigit():
+            value = str(int(value))
+        parts.append(f"{name}={value}")
+    for name in list_params:
+        values = {
+            value.strip()
+            for raw in request.args.getlist(name)
+            for value in raw.split(',') if value.strip()
+        }
+        parts.append(f"{name}={','.join(sorted(values))}")
+    return '&'.join(parts)
+
+
+def make_catalog_etag(version: str, params: Sequence[str] = (), list_params: Sequence[str] = ()) -> str:
+    """
+    Build the strong ETag of the current request for a catalog version.
+
+    Args:
+        version: The catalog version
+        params: Single-valued query parameters the endpoint recognizes
+        list_params: Comma-separated query parameters the endpoint recognizes
+
+    Returns:
+        The ETag value (unquoted)
+    """
+    key = f"{version}|{request.path}|{normalized_args(params, list_params)}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+
+def conditional_catalog_response(*params: str, list_params: Sequence[str] = ()):
+    """
+    Add an ETag to a catalog endpoint, answer If-None-Match with 304 and
+    serve repeated requests from the response cache.
+
+    The ETag depends only on the catalog version, the path and the query
+    parameters the endpoint declares (normalized), so a matching If-None-Match
+    or a cached body is served before the view (and any repository call) runs.
+    Only 200 responses are cached; compressed bodies are cached next to the
+    uncompressed one, so each is compressed once.
+
+    Args:
+        params: Single-valued query parameters the view reads
+        list_params: Comma-separated query parameters the view reads (e.g. 'fields')
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            version = get_catalog_version()
+            etag = make_catalog_etag(version, params, list_params)
+            response_cache = current_app.response_cache
+
+            # Compressed representations carry the encoding in their ETag
+            for tag in (etag,) + tuple(f"{etag}-{encoding}" for encoding in ENCODINGS):
+                if request.if_none_match.contains_weak(tag):
+                    response = current_app.response_class(status=304)
+                    response.set_etag(tag)
+                    response.headers['Cache-Control'] = 'private, no-cache'
+                    return response
+
+            cached = response_cache.get(version, etag)
+            if cached is not None:
+                body, mimetype = cached
+                response = current_app.response_class(body, mimetype=mimetype)
+            else:
+                response = current_app.make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body, mimetype = response.get_data(), response.mimetype
+                response_cache.set(version, etag, body, mimetype)
+
+            # Clients may keep the payload but must revalidate it on each use
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+
+            encoding = negotiate_encoding()
+            if (encoding and mimetype in COMPRESSIBLE_MIMETYPES
+                    and len(body) >= current_app.config['COMPRESSION_MIN_SIZE']):
+                cached = response_cache.get(version, etag, encoding)
+                if cached is not None:
+                    encoded = cached[0]
+                else:
+                    encoded = compress(body, encoding)
+                    response_cache.set(version, etag, encoded, mimetype, encoding)
+                set_encoded_body(response, encoded, encoding)
+
+            return response
+        return decorated_function
+    return decorator
@@ -0,0 +1,95 @@
+"""Flask JSON provider backed by orjson when it is installed."""
+
+import dataclasses
+import decimal
+import uuid
+from datetime import date, datetime, time
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is used instead
+    orjson = None
+
+
+def json_default(o: Any) -> Any:
+    """
+    Convert values the JSON encoders do not handle natively.
+
+    Dates and times become ISO 8601 strings and Decimals (numeric columns)
+    become numbers, with the same output from orjson and the stdlib encoder.
+
+    Args:
+        o: The value to convert
+
+    Returns:
+        A JSON-serializable value
+
+    Raises:
+        TypeError: If the value cannot be serialized
+    """
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, decimal.Decimal):
+        return int(o) if o == o.to_integral_value() else float(o)
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes responses with orjson when available.
+
+    Output matches the default provider (sorted keys, compact outside debug
+    mode) except that non-ASCII characters are written as UTF-8 rather than
+    escaped. Without orjson, or for values orjson rejects (e.g. integers
+    beyond 64 bits), it falls back to the stdlib encoder.
+    """
+
+    default = staticmethod(json_default)
+
+    def _dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 bytes, preferring orjson."""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=json_default, option=option)
+            except TypeError:
+                pass
+
+        dump_args = {'indent': 2} if indent else {'separators': (',', ':')}
+        return super().dumps(obj, **dump_args).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        if kwargs or orjson is None:
+            return super().dumps(obj, **kwargs)
+        return self._dumps_bytes(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes."""
+        if kwargs or orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize the arguments as JSON and return a response with the encoded bytes."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+
+        return self._app.response_class(
+            self._dumps_bytes(obj, indent) + b"\n", mimetype=self.mimetype
+        )
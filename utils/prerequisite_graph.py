@@ -0,0 +1,240 @@
+"""Prerequisite graph over the course catalog with a precomputed transitive closure."""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.facets import iter_bits
+
+logger = logging.getLogger(__name__)
+
+
+class PrerequisiteGraph:
+    """
+    Prerequisites of every catalog course, stored as bitmaps.
+
+    Courses are numbered by their position in the catalog (bit i is
+    courses[i]). For each course the graph keeps the bitmap of its direct
+    prerequisites, the subset of those that may be taken concurrently, and the
+    bitmap of all prerequisites, transitively, together with its depth (the
+    length of its longest prerequisite chain). For each course it also keeps
+    the bitmap of the courses that directly require it, so eligibility can be
+    decided for the whole catalog at once. Every course's prerequisites are
+    all required.
+    """
+
+    def __init__(self, course_ids: List[int], prerequisites: Iterable[Dict[str, Any]]):
+        """
+        Build the graph and its transitive closure.
+
+        Args:
+            course_ids: IDs of the catalog courses, in catalog order
+            prerequisites: courseprerequisites rows (course_id, prereq_course_id,
+                concurrency_allowed); rows naming unknown courses are ignored
+        """
+        self.course_ids = list(course_ids)
+        self.positions = {course_id: position for position, course_id in enumerate(self.course_ids)}
+
+        size = len(self.course_ids)
+        self.direct = [0] * size
+        self.concurrent = [0] * size
+        self.dependents = [0] * size
+        for row in prerequisites:
+            position = self.positions.get(row['course_id'])
+            prereq_position = self.positions.get(row['prereq_course_id'])
+            if position is None or prereq_position is None or position == prereq_position:
+                continue
+
+            self.direct[position] |= 1 << prereq_position
+            self.dependents[prereq_position] |= 1 << position
+            if row.get('concurrency_allowed'):
+                self.concurrent[position] |= 1 << prereq_position
+
+        # Courses that are a prerequisite of some course
+        self.required = 0
+        for direct in self.direct:
+            self.required |= direct
+
+        self.closure = [0] * size
+        self.depth = [0] * size
+        self._compute_closure()
+
+    def _compute_closure(self) -> None:
+        """Compute all prerequisites and depths, prerequisites first (Kahn's algorithm)."""
+        size = len(self.course_ids)
+        remaining = [direct.bit_count() for direct in self.direct]
+
+        ready = [position for position in range(size) if remaining[position] == 0]
+        done = 0
+        while ready:
+            position = ready.pop()
+            done += 1
+
+            closure = self.direct[position]
+            depth = 0
+            for prereq_position in iter_bits(self.direct[position]):
+                closure |= self.closure[prereq_position]
+                depth = max(depth, self.depth[prereq_position] + 1)
+            self.closure[position] = closure
+            self.depth[position] = depth
+
+            for dependent in iter_bits(self.dependents[position]):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if done < size:
+            self._close_cycles([position for position in range(size) if remaining[position]])
+
+    def _close_cycles(self, positions: List[int]) -> None:
+        """Close courses on (or behind) a prerequisite cycle by iterating to a fixed point."""
+        logger.warning("Prerequisite cycle among courses %s",
+                       sorted(self.course_ids[position] for position in positions))
+
+        for position in positions:
+            self.closure[position] = self.direct[position]
+
+        changed = True
+        while changed:
+            changed = False
+            for position in positions:
+                closure = self.closure[position]
+                for prereq_position in iter_bits(closure):
+                    closure |= self.closure[prereq_position]
+                if closure != self.closure[position]:
+                    self.closure[position] = closure
+                    changed = True
+
+        # Depth counts only the acyclic part of the chains
+        cyclic = set(positions)
+        for position in positions:
+            self.closure[position] &= ~(1 << position)
+            self.depth[position] = max(
+                (self.depth[prereq_position] + 1 for prereq_position in iter_bits(self.direct[position])
+                 if prereq_position not in cyclic),
+                default=0
+            )
+
+    def __contains__(self, course_id: int) -> bool:
+        return course_id in self.positions
+
+    def mask(self, course_ids: Iterable[int]) -> int:
+        """
+        Get the bitmap of a set of courses.
+
+        Args:
+            course_ids: Course IDs (unknown IDs are ignored)
+
+        Returns:
+            The bitmap with the bits of those courses set
+        """
+        mask = 0
+        positions = self.positions
+        for course_id in course_ids:
+            position = positions.get(course_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def ids(self, mask: int) -> List[int]:
+        """
+        Get the course IDs of a bitmap, in catalog order.
+
+        Args:
+            mask: A bitmap of courses
+
+        Returns:
+            List of course IDs
+        """
+        course_ids = self.course_ids
+        return [course_ids[position] for position in iter_bits(mask)]
+
+    def prerequisites(self, course_id: int, transitive: bool = False) -> List[int]:
+        """
+        Get the prerequisites of a course.
+
+        Args:
+            course_id: The course ID
+            transitive: Whether to include prerequisites of prerequisites
+
+        Returns:
+            List of prerequisite course IDs (empty for unknown courses)
+        """
+        position = self.positions.get(course_id)
+        if position is None:
+            return []
+        return self.ids(self.closure[position] if transitive else self.direct[position])
+
+    def get_depth(self, course_id: int) -> Optional[int]:
+        """
+        Get the length of a course's longest prerequisite chain.
+
+        Args:
+            course_id: The course ID
+
+        Returns:
+            0 for courses without prerequisites, or None for unknown courses
+        """
+        position = self.positions.get(course_id)
+        return self.depth[position] if position is not None else None
+
+    def chain(self, course_id: int) -> List[List[int]]:
+        """
+        Get all prerequisites of a course grouped by depth.
+
+        Args:
+            course_id: The course ID
+
+        Returns:
+            List of levels, each a list of course IDs; level 0 holds the
+            prerequisites with no prerequisites of their own, and each later
+            level only needs courses from earlier levels
+        """
+        position = self.positions.get(course_id)
+        if position is None:
+            return []
+
+        levels: Dict[int, List[int]] = {}
+        for prereq_position in iter_bits(self.closure[position]):
+            levels.setdefault(self.depth[prereq_position], []).append(self.course_ids[prereq_position])
+        return [levels[depth] for depth in sorted(levels)]
+
+    def missing(self, course_id: int, completed: int, concurrent: int = 0) -> int:
+        """
+        Get the direct prerequisites of a course a student still lacks.
+
+        Args:
+            course_id: The course ID
+            completed: Bitmap of courses completed before the course's term
+            concurrent: Bitmap of courses taken in the same term as the course
+
+        Returns:
+            Bitmap of the unmet direct prerequisites (0 if the course can be taken)
+        """
+        position = self.positions.get(course_id)
+        if position is None:
+            return 0
+
+        direct = self.direct[position]
+        return direct & ~completed & ~(concurrent & self.concurrent[position])
+
+    def eligible(self, completed: int) -> int:
+        """
+        Get every course whose direct prerequisites have all been completed.
+
+        Instead of testing each course, the courses requiring any prerequisite
+        the student lacks are OR-ed together; each OR covers the whole catalog,
+        a machine word of courses at a time.
+
+        Args:
+            completed: Bitmap of the courses the student has completed
+
+        Returns:
+            Bitmap of the eligible courses, excluding those already completed
+        """
+        blocked = 0
+        dependents = self.dependents
+        for prereq_position in iter_bits(self.required & ~completed):
+            blocked |= dependents[prereq_position]
+
+        everything = (1 << len(self.course_ids)) - 1
+        return everything & ~blocked & ~completed
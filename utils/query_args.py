@@ -0,0 +1,21 @@
+"""Parsing of multi-valued query parameters shared by the API blueprints."""
+
+from typing import List, Optional
+
+from flask import request
+
+
+def get_list_arg(name: str) -> Optional[List[str]]:
+    """
+    Get a multi-valued query parameter (repeated and/or comma-separated).
+
+    Args:
+        name: The parameter name (e.g. 'subject_code')
+
+    Returns:
+        The stripped, non-empty values in request order, or None if there are none
+    """
+    values = []
+    for raw in request.args.getlist(name):
+        values.extend(value.strip() for value in raw.split(',') if value.strip())
+    return values or None
@@ -0,0 +1,157 @@
+"""Stateless HMAC-signed session tokens."""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+def _b64encode(data: bytes) -> str:
+    """Encode bytes as unpadded URL-safe base64."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(data: str) -> bytes:
+    """Decode unpadded URL-safe base64."""
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+class SessionTokenSigner:
+    """
+    Issues and verifies short-lived session tokens signed with HMAC-SHA256.
+
+    A token is `<payload>.<signature>`, where the payload is base64url-encoded
+    JSON with the student's ID and NetID, a unique token ID and the issue and
+    expiry times. Verification needs no database access. Tokens revoked before
+    they expire (logout) are remembered in memory until their expiry, as is the
+    time each student last logged out, which invalidates every token issued to
+    them before it. The revocation lists are per process: with several workers,
+    keep the TTL short or share revocations through the `logged` flag.
+    """
+
+    def __init__(self, secret_key: str, ttl: int = 900):
+        """
+        Initialize with the signing key.
+
+        Args:
+            secret_key: Key used to sign tokens (the app's SECRET_KEY)
+            ttl: Seconds an issued token stays valid
+
+        Raises:
+            ValueError: If the key is empty
+        """
+        if not secret_key:
+            raise ValueError("Session tokens require a SECRET_KEY")
+
+        self._key = secret_key.encode('utf-8')
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, float] = {}
+        self._logged_out: Dict[int, float] = {}
+
+    def _sign(self, payload: str) -> str:
+        """Compute the signature of an encoded payload."""
+        digest = hmac.new(self._key, payload.encode('ascii'), hashlib.sha256).digest()
+        return _b64encode(digest)
+
+    def issue(self, student: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Issue a token for a student.
+
+        Args:
+            student: The student dictionary (needs student_id and net_id)
+
+        Returns:
+            Dictionary with the token and its expiry (Unix time)
+        """
+        issued_at = time.time()
+        expires_at = int(issued_at) + self.ttl
+        claims = {
+            'sid': student['student_id'],
+            'net': student['net_id'],
+            'jti': secrets.token_urlsafe(12),
+            'iat': issued_at,
+            'exp': expires_at
+        }
+        payload = _b64encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))
+
+        return {
+            'token': f"{payload}.{self._sign(payload)}",
+            'expires_at': expires_at
+        }
+
+    def verify(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify a token.
+
+        Args:
+            token: The token string
+
+        Returns:
+            The token's claims (sid, net, jti, iat, exp), or None if the token
+            is malformed, forged, expired or revoked
+        """
+        payload, _, signature = token.partition('.')
+        if not payload or not signature:
+            return None
+
+        # Tokens are ASCII; anything else cannot have been issued here
+        if not (payload.isascii() and signature.isascii()):
+            return None
+
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError:
+            return None
+
+        if not isinstance(claims, dict) or claims.get('exp', 0) <= time.time():
+            return None
+
+        if claims.get('jti') in self._revoked:
+            return None
+
+        logged_out_at = self._logged_out.get(claims.get('sid'))
+        if logged_out_at is not None and claims.get('iat', 0) <= logged_out_at:
+            return None
+
+        return claims
+
+    def revoke(self, claims: Dict[str, Any]) -> None:
+        """
+        Revoke a verified token before it expires.
+
+        Args:
+            claims: The claims returned by verify()
+        """
+        now = time.time()
+        with self._lock:
+            # Drop revocations of tokens that have expired anyway
+            expired = [jti for jti, expires_at in self._revoked.items() if expires_at <= now]
+            for jti in expired:
+                del self._revoked[jti]
+
+            self._revoked[claims['jti']] = claims['exp']
+
+    def revoke_student(self, student_id: int) -> None:
+        """
+        Revoke every token issued to a student so far (on logout).
+
+        Args:
+            student_id: The student's ID
+        """
+        now = time.time()
+        with self._lock:
+            # Tokens issued more than a TTL ago have expired anyway
+            expired = [sid for sid, logged_out_at in self._logged_out.items() if logged_out_at + self.ttl <= now]
+            for sid in expired:
+                del self._logged_out[sid]
+
+            self._logged_out[student_id] = now
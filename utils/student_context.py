@@ -0,0 +1,131 @@
+"""Request-scoped context for the authenticated student."""
+
+from typing import Any, Dict, List, Optional
+
+from flask import g, request, current_app
+
+from repositories.student_repository import StudentRepository
+
+
+class StudentContext:
+    """
+    The student making the current request, with related data loaded on demand.
+
+    The authentication middleware has already loaded the student row, so routes
+    and services read the student ID from here instead of looking the student up
+    again. Majors, enrollments and plans are each fetched at most once per
+    request, and only if something actually uses them.
+    """
+
+    def __init__(self, student: Dict[str, Any], student_repository: StudentRepository,
+                 complete: bool = True):
+        """
+        Initialize with the authenticated student.
+
+        Args:
+            student: The student row loaded during authentication, or just its
+                student_id and net_id when authenticated by a session token
+            student_repository: Repository for student data
+            complete: Whether `student` is the full row; if not, the row is
+                loaded the first time something other than the IDs is needed
+        """
+        self._student = student
+        self._complete = complete
+        self.student_repo = student_repository
+
+        self._majors: Optional[List[Dict[str, Any]]] = None
+        self._enrollments: Optional[List[Dict[str, Any]]] = None
+        self._plans: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def student(self) -> Dict[str, Any]:
+        """The full student row."""
+        if not self._complete:
+            student = self.student_repo.get_by_id(self._student['student_id'], 'student_id')
+            if not student:
+                raise ValueError(f"No student found with NetID: {self._student['net_id']}")
+            self._student = student
+            self._complete = True
+        return self._student
+
+    @property
+    def student_id(self) -> int:
+        """The student's ID."""
+        return self._student['student_id']
+
+    @property
+    def net_id(self) -> str:
+        """The student's NetID."""
+        return self._student['net_id']
+
+    @property
+    def majors(self) -> List[Dict[str, Any]]:
+        """The student's declared majors (with major versions)."""
+        if self._majors is None:
+            self._majors = self.student_repo.get_declared_majors(self.student_id)
+        return self._majors
+
+    def enrollments(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get the student's course enrollments, optionally filtered by status.
+
+        All enrollments are fetched once; status filtering happens in memory.
+
+        Args:
+            status: Optional enrollment status to filter by (e.g. 'Completed')
+
+        Returns:
+            List of dictionaries representing the student's enrollments
+        """
+        if self._enrollments is None:
+            self._enrollments = self.student_repo.get_course_enrollments(self.student_id)
+
+        if status is None:
+            return self._enrollments
+        return [enrollment for enrollment in self._enrollments if enrollment.get('status') == status]
+
+    def completed_courses(self, course_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get the student's completed enrollments for the given course IDs.
+
+        Args:
+            course_ids: List of course IDs to check
+
+        Returns:
+            List of dictionaries representing the matching completed enrollments
+        """
+        wanted = set(course_ids)
+        return [enrollment for enrollment in self.enrollments('Completed') if enrollment['course_id'] in wanted]
+
+    @property
+    def plans(self) -> List[Dict[str, Any]]:
+        """The student's course plans."""
+        if self._plans is None:
+            self._plans = self.student_repo.get_course_plans(self.student_id)
+        return self._plans
+
+    def invalidate(self) -> None:
+        """Forget loaded related data (call after modifying enrollments or plans)."""
+        self._majors = None
+        self._enrollments = None
+        self._plans = None
+
+
+def get_student_context() -> Optional[StudentContext]:
+    """
+    Get the context for the student authenticated on the current request.
+
+    Returns:
+        The request's StudentContext, or None if the request is not authenticated
+    """
+    if 'student_context' not in g:
+        student = getattr(request, 'student', None)
+        g.student_context = (
+            StudentContext(
+                student,
+                current_app.student_service.student_repo,
+                complete=getattr(request, 'session_token', None) is None
+            )
+            if student else None
+        )
+    return g.student_context
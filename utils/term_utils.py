@@ -0,0 +1,54 @@
+"""Utility functions for parsing and ordering academic terms."""
+
+import re
+from typing import Dict, Optional, Tuple
+
+# Order of the seasons within a calendar year
+SEASON_ORDER: Dict[str, int] = {
+    'winter': 0,
+    'spring': 1,
+    'summer': 2,
+    'fall': 3,
+    'autumn': 3
+}
+
+# Yale term codes (YYYYTT) by season suffix
+TERM_CODE_SEASONS: Dict[str, int] = {'01': 1, '02': 2, '03': 3}
+
+# "Fall 2025", "fall 2025", "2025 Fall"
+SEASON_YEAR_PATTERN = re.compile(r'^\s*([A-Za-z]+)\s+(\d{4})\s*$')
+YEAR_SEASON_PATTERN = re.compile(r'^\s*(\d{4})\s+([A-Za-z]+)\s*$')
+# "202503"
+TERM_CODE_PATTERN = re.compile(r'^\s*(\d{4})(\d{2})\s*$')
+
+
+def parse_term(term: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse a term into a sortable (year, season) key.
+
+    Args:
+        term: A term such as 'Fall 2025', '2025 Fall' or the term code '202503'
+
+    Returns:
+        Tuple of (year, season order), or None if the term is not recognized
+    """
+    if not term:
+        return None
+
+    match = SEASON_YEAR_PATTERN.match(term)
+    if match:
+        season, year = match.groups()
+    else:
+        match = YEAR_SEASON_PATTERN.match(term)
+        if match:
+            year, season = match.groups()
+        else:
+            match = TERM_CODE_PATTERN.match(term)
+            if match and match.group(2) in TERM_CODE_SEASONS:
+                return int(match.group(1)), TERM_CODE_SEASONS[match.group(2)]
+            return None
+
+    season_order = SEASON_ORDER.get(season.lower())
+    if season_order is None:
+        return None
+    return int(year), season_order
@@ -0,0 +1,471 @@
+"""Utility functions and indexes for course text search (fuzzy, full-text, prefix)."""
+
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9 ]+')
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normalize text for matching (lowercase, alphanumerics only, single spaces).
+
+    Args:
+        text: The text to normalize (can be None)
+
+    Returns:
+        str: The normalized text
+    """
+    if not text:
+        return ''
+
+    text = _NON_ALNUM_RE.sub(' ', text.lower())
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Get the character trigrams of already-normalized text.
+
+    Each word is padded with two leading spaces and one trailing space (the same
+    scheme used by PostgreSQL's pg_trgm), so short words and word starts still
+    produce distinctive trigrams.
+
+    Args:
+        text: Normalized text (see normalize_text)
+
+    Returns:
+        Set of trigram strings
+    """
+    result = set()
+    for word in text.split(' '):
+        if not word:
+            continue
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            result.add(padded[i:i + 3])
+    return result
+
+
+def edit_distance(source: str, target: str, max_distance: Optional[int] = None) -> int:
+    """
+    Compute the optimal string alignment distance between two strings.
+
+    This is the Levenshtein distance extended with adjacent transpositions, so
+    "cspc" -> "cpsc" costs 1 rather than 2.
+
+    Args:
+        source: The first string
+        target: The second string
+        max_distance: Optional cutoff; once every cell in a row exceeds it the
+            computation stops and max_distance + 1 is returned
+
+    Returns:
+        int: The edit distance (or max_distance + 1 if the cutoff was exceeded)
+    """
+    if source == target:
+        return 0
+
+    len_source = len(source)
+    len_target = len(target)
+
+    if max_distance is not None and abs(len_source - len_target) > max_distance:
+        return max_distance + 1
+    if not len_source:
+        return len_target
+    if not len_target:
+        return len_source
+
+    previous_previous: List[int] = []
+    previous = list(range(len_target + 1))
+
+    for i in range(1, len_source + 1):
+        current = [i] * (len_target + 1)
+        source_char = source[i - 1]
+        row_min = i
+
+        for j in range(1, len_target + 1):
+            target_char = target[j - 1]
+
+            # Substitution, deletion, insertion
+            value = previous[j - 1] if source_char == target_char else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+
+            # Adjacent transposition
+            if (i > 1 and j > 1 and source_char == target[j - 2]
+                    and source[i - 2] == target_char and previous_previous[j - 2] + 1 < value):
+                value = previous_previous[j - 2] + 1
+
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        if max_distance is not None and row_min > max_distance:
+            return max_distance + 1
+
+        previous_previous, previous = previous, current
+
+    return previous[len_target]
+
+
+class TrigramIndex:
+    """
+    Precomputed character-trigram index for typo-tolerant lookups.
+
+    Each document is a list of searchable strings (e.g. a course's "SUBJ NUM" code
+    and its title). Lookups gather candidates from the trigram posting lists,
+    keep only the best max_candidates by trigram overlap, and rank that bounded
+    set by a blend of trigram overlap and edit distance.
+    """
+
+    def __init__(self, max_candidates: int = 50, min_score: float = 0.35):
+        """
+        Initialize an empty index.
+
+        Args:
+            max_candidates: Maximum number of candidates scored by edit distance
+            min_score: Minimum combined score (0-1) for a result to be returned
+        """
+        self.max_candidates = max_candidates
+        self.min_score = min_score
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._documents: Dict[int, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, doc_id: int, fields: Iterable[Optional[str]]) -> None:
+        """
+        Add a document to the index.
+
+        Args:
+            doc_id: The document identifier (e.g. course_id)
+            fields: The document's searchable strings
+        """
+        normalized = [normalize_text(field) for field in fields]
+        normalized = [field for field in normalized if field]
+        self._documents[doc_id] = normalized
+
+        doc_trigrams = set()
+        for field in normalized:
+            doc_trigrams |= trigrams(field)
+
+        for trigram in doc_trigrams:
+            self._postings[trigram].append(doc_id)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        Find the documents that best match a possibly misspelled query.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+
+        Returns:
+            List of (doc_id, score) tuples, best match first
+        """
+        query = normalize_text(query)
+        query_trigrams = trigrams(query)
+        if not query_trigrams:
+            return []
+
+        # Count shared trigrams per document
+        overlaps: Dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for doc_id in self._postings.get(trigram, ()):
+                overlaps[doc_id] += 1
+
+        if not overlaps:
+            return []
+
+        # Bound the expensive edit distance step to the best candidates
+        candidates = heapq.nlargest(self.max_candidates, overlaps.items(), key=lambda item: item[1])
+
+        query_word_count = query.count(' ') + 1
+        max_distance = max(1, len(query) // 2)
+        scored = []
+
+        for doc_id, overlap in candidates:
+            overlap_score = overlap / len(query_trigrams)
+
+            best_distance = max_distance + 1
+            best_length = len(query)
+            for candidate in self._candidate_strings(doc_id, query_word_count):
+                distance = edit_distance(query, candidate, best_distance - 1)
+                if distance < best_distance:
+                    best_distance = distance
+                    best_length = max(len(query), len(candidate))
+                    if distance == 0:
+                        break
+
+            distance_score = max(0.0, 1.0 - best_distance / best_length)
+            score = 0.5 * overlap_score + 0.5 * distance_score
+
+            if score >= self.min_score:
+                scored.append((doc_id, round(score, 4)))
+
+        return heapq.nlargest(limit, scored, key=lambda item: item[1])
+
+    def _candidate_strings(self, doc_id: int, word_count: int) -> Iterable[str]:
+        """
+        Yield the strings of a document that a query should be compared against.
+
+        Whole fields are yielded first, followed by every run of word_count
+        consecutive words, so a one-word query can match one word of a title.
+        """
+        for field in self._documents.get(doc_id, ()):
+            yield field
+            words = field.split(' ')
+            if len(words) > word_count:
+                for i in range(len(words) - word_count + 1):
+                    yield ' '.join(words[i:i + word_count])
+
+
+# Common English words that carry no weight in course descriptions
+STOP_WORDS = frozenset("""
+    a about above after again against all also an and any are as at be because been before
+    being between both but by can course courses did do does during each either emphasis
+    for from further had has have how i if in including into is it its itself may more
+    most no nor not of on one only or other our out over own same should so some student
+    students such than that the their them then there these they this those through to
+    too topics under until up upon use used very via was we were what when where which
+    while who whom why will with within without would you your
+""".split())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into normalized, stop-word-filtered search terms.
+
+    A light suffix rule folds simple plurals ("algorithms" -> "algorithm") so
+    queries and descriptions agree on the common case.
+
+    Args:
+        text: The text to tokenize (can be None)
+
+    Returns:
+        List of terms in document order
+    """
+    terms = []
+    for word in normalize_text(text).split(' '):
+        if not word or word in STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 scoring over one or more weighted fields.
+
+    Each field keeps its own posting lists and length statistics; a document's
+    score is the weighted sum of its per-field BM25 scores. Only documents that
+    appear in a query term's posting list are ever scored, and the top results
+    are selected with a bounded heap.
+    """
+
+    def __init__(self, field_weights: Dict[str, float], k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            field_weights: Mapping of field name to its weight in the combined score
+            k1: BM25 term-frequency saturation parameter
+            b: BM25 length normalization parameter
+        """
+        self.field_weights = dict(field_weights)
+        self.k1 = k1
+        self.b = b
+        # field -> term -> list of [doc_id, term frequency]
+        self._postings: Dict[str, Dict[str, List[List[int]]]] = {field: {} for field in field_weights}
+        # field -> doc_id -> field length in terms
+        self._lengths: Dict[str, Dict[int, int]] = {field: {} for field in field_weights}
+        self._average_lengths: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(set().union(*(lengths.keys() for lengths in self._lengths.values())))
+
+    def add(self, doc_id: int, fields: Dict[str, Optional[str]]) -> None:
+        """
+        Add a document to the index.
+
+        Args:
+            doc_id: The document identifier (e.g. course_id)
+            fields: Mapping of field name to the field's text
+        """
+        for field in self.field_weights:
+            terms = tokenize(fields.get(field))
+            self._lengths[field][doc_id] = len(terms)
+
+            self._average_lengths.pop(field, None)
+
+            frequencies: Dict[str, int] = defaultdict(int)
+            for term in terms:
+                frequencies[term] += 1
+
+            postings = self._postings[field]
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append([doc_id, frequency])
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """
+        Rank documents against a free-text query.
+
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+
+        Returns:
+            List of (doc_id, score) tuples, best match first
+        """
+        query_terms = set(tokenize(query))
+        if not query_terms:
+            return []
+
+        scores: Dict[int, float] = defaultdict(float)
+
+        for field, weight in self.field_weights.items():
+            lengths = self._lengths[field]
+            doc_count = len(lengths)
+            if not doc_count:
+                continue
+
+            average_length = self._average_lengths.get(field)
+            if average_length is None:
+                average_length = (sum(lengths.values()) / doc_count) or 1.0
+                self._average_lengths[field] = average_length
+            postings = self._postings[field]
+
+            for term in query_terms:
+                term_postings = postings.get(term)
+                if not term_postings:
+                    continue
+
+                document_frequency = len(term_postings)
+                idf = math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+                for doc_id, frequency in term_postings:
+                    norm = self.k1 * (1 - self.b + self.b * lengths[doc_id] / average_length)
+                    scores[doc_id] += weight * idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(doc_id, round(score, 4)) for doc_id, score in top]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the index to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary that from_dict can load without re-tokenizing any text
+        """
+        return {
+            'field_weights': self.field_weights,
+            'k1': self.k1,
+            'b': self.b,
+            'postings': self._postings,
+            'lengths': {
+                field: [[doc_id, length] for doc_id, length in lengths.items()]
+                for field, lengths in self._lengths.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BM25Index':
+        """
+        Load an index previously serialized with to_dict.
+
+        Args:
+            data: The serialized index
+
+        Returns:
+            The loaded BM25Index
+        """
+        index = cls(data['field_weights'], data['k1'], data['b'])
+        index._postings = data['postings']
+        index._lengths = {
+            field: {doc_id: length for doc_id, length in lengths}
+            for field, lengths in data['lengths'].items()
+        }
+        return index
+
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index for autocomplete.
+
+    Keys are normalized strings kept in one sorted list; a prefix lookup is two
+    binary searches plus a slice, so suggestions cost O(log n + k). Keys are
+    added in a batch and sorted once by freeze(); lookups never modify the
+    index, so a frozen index can be shared between threads.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._pending: List[Tuple[str, int]] = []
+        self._entries: List[Tuple[str, int]] = []
+        self._keys: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: Optional[str], doc_id: int) -> None:
+        """
+        Add a key for a document (a document may have several keys).
+
+        Args:
+            key: The string to complete (normalized before indexing)
+            doc_id: The document identifier (e.g. course_id); the key is only
+                found after the next freeze()
+        """
+        key = normalize_text(key)
+        if key:
+            self._pending.append((key, doc_id))
+
+    def freeze(self) -> None:
+        """Sort the keys added so far into the lookup arrays (call once after adding)."""
+        entries = sorted(self._entries + self._pending)
+        self._keys = [key for key, _ in entries]
+        self._entries = entries
+        self._pending = []
+
+    def complete(self, prefix: str, limit: int = 10) -> List[int]:
+        """
+        Get the documents with a key starting with the given prefix.
+
+        Args:
+            prefix: The typed prefix
+            limit: Maximum number of documents to return
+
+        Returns:
+            List of distinct doc_ids in key order
+        """
+        prefix = normalize_text(prefix)
+        if not prefix:
+            return []
+
+        keys, entries = self._keys, self._entries
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + '\uffff', start)
+
+        results = []
+        seen = set()
+        for i in range(start, end):
+            doc_id = entries[i][1]
+            if doc_id not in seen:
+                seen.add(doc_id)
+                results.append(doc_id)
+                if len(results) >= limit:
+                    break
+
+        return results
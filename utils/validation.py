@@ -0,0 +1,84 @@
+"""Bulk request validation with compiled Pydantic type adapters."""
+
+from typing import Any, Dict, Generic, List, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class BatchValidationError(ValueError):
+    """Raised when one or more items of a batch are invalid."""
+
+    def __init__(self, errors: List[Dict[str, Any]], item_count: int):
+        """
+        Initialize with the per-item errors.
+
+        Args:
+            errors: One entry per error, with the item index, field and message
+            item_count: Number of items in the batch
+        """
+        self.errors = errors
+        self.invalid_items = sorted({error['index'] for error in errors if error['index'] is not None})
+        super().__init__(f"{len(self.invalid_items)} of {item_count} items are invalid")
+
+
+class BatchValidator(Generic[T]):
+    """
+    Validates a whole list of request items in one call.
+
+    The TypeAdapter for List[model] is built once, so each request pays only
+    for pydantic-core's compiled validation of the array, and every invalid
+    item is reported instead of only the first.
+    """
+
+    def __init__(self, item_model: Type[T]):
+        """
+        Compile the validator for a list of items.
+
+        Args:
+            item_model: The Pydantic model of one item
+        """
+        self.item_model = item_model
+        self._adapter = TypeAdapter(List[item_model])
+
+    def validate(self, items: Any) -> List[T]:
+        """
+        Validate a batch.
+
+        Args:
+            items: The raw list of item dictionaries from the request body
+
+        Returns:
+            List of validated models, in request order
+
+        Raises:
+            BatchValidationError: If any item is invalid (lists all errors)
+        """
+        try:
+            return self._adapter.validate_python(items)
+        except ValidationError as e:
+            raise BatchValidationError(self.format_errors(e), len(items) if isinstance(items, list) else 0)
+
+    @staticmethod
+    def format_errors(error: ValidationError) -> List[Dict[str, Any]]:
+        """
+        Flatten a ValidationError into per-item errors.
+
+        Args:
+            error: The error raised for the list
+
+        Returns:
+            List of {'index', 'field', 'message'} dictionaries
+        """
+        errors = []
+        for detail in error.errors():
+            location = detail['loc']
+            index = location[0] if location and isinstance(location[0], int) else None
+            field_path = location[1:] if index is not None else location
+            errors.append({
+                'index': index,
+                'field': '.'.join(str(part) for part in field_path) or None,
+                'message': detail['msg']
+            })
+        return errors